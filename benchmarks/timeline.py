@@ -0,0 +1,125 @@
+"""
+Time and allocations to lay out a timeline, per 10k segments.
+
+Covers the part of a /timeline request which runs in Python once its rows
+have been read: clamping stored histories to the view, then computing the
+rendering for the template.
+
+Run from the repository root, with it on the path:
+
+    PYTHONPATH=. python benchmarks/timeline.py [--issues N] [--segments N]
+        [--repeat N]
+"""
+import argparse
+import datetime
+import timeit
+import tracemalloc
+
+from mosura import schemas
+
+
+CURRENT_DATE = datetime.date(2026, 3, 4)
+STATUSES = ('Backlog', 'In Progress', 'Code Review', 'Ready for Testing')
+
+
+def build_inputs(
+        issues: int,
+        segments: int,
+) -> tuple[list[schemas.Issue], dict[str, schemas.IssueHistory]]:
+    created = datetime.datetime(2026, 1, 5, tzinfo=datetime.UTC)
+    rows: list[schemas.Issue] = []
+    histories: dict[str, schemas.IssueHistory] = {}
+    for i in range(issues):
+        key = f'BENCH-{i}'
+        rows.append(
+            schemas.Issue(
+                key=key,
+                summary=f'Issue {i}',
+                description=None,
+                status='In Progress',
+                assignee='bench',
+                priority=schemas.Priority.medium,
+                startdate=None,
+                timeestimate=datetime.timedelta(days=5),
+                created=created,
+                updated=created,
+                votes=0,
+                components=[],
+                labels=[],
+            ),
+        )
+
+        # one segment per day, the last still ongoing
+        start = created.date()
+        history_segments = [
+            schemas.HistorySegment(
+                start=start + datetime.timedelta(days=n),
+                end=start + datetime.timedelta(days=n + 1),
+                status=STATUSES[n % len(STATUSES)],
+            )
+            for n in range(segments - 1)
+        ]
+        history_segments.append(
+            schemas.HistorySegment(
+                start=start + datetime.timedelta(days=segments - 1),
+                end=None,
+                status='In Progress',
+            ),
+        )
+        histories[key] = schemas.IssueHistory(
+            key=key,
+            estimated_completion=None,
+            started=True,
+            segments=history_segments,
+        )
+    return rows, histories
+
+
+def layout(
+        issues: list[schemas.Issue],
+        histories: dict[str, schemas.IssueHistory],
+) -> schemas.Timeline:
+    timeline = schemas.Timeline.from_histories(
+        issues,
+        histories,
+        selected_date=CURRENT_DATE,
+        current_date=CURRENT_DATE,
+    )
+    timeline.calculate_rendering(CURRENT_DATE)
+    return timeline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--issues', type=int, default=200)
+    parser.add_argument('--segments', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    issues, histories = build_inputs(args.issues, args.segments)
+    timeline = layout(issues, histories)
+    rendered = sum(len(x.segments) for x in timeline.issues)
+    per_10k = 10_000 / rendered
+
+    seconds = min(
+        timeit.repeat(
+            lambda: layout(issues, histories),
+            number=1,
+            repeat=args.repeat,
+        ),
+    )
+
+    tracemalloc.start()
+    kept = layout(issues, histories)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    print(f'{rendered} segments rendered')
+    print(f'time:      {seconds * per_10k * 1000:8.2f} ms / 10k segments')
+    print(f'peak:      {peak * per_10k / 1024:8.1f} KiB / 10k segments')
+    print(f'retained:  {retained * per_10k / 1024:8.1f} KiB / 10k segments')
+
+
+if __name__ == '__main__':
+    main()
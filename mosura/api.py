@@ -1,30 +1,176 @@
 import asyncio
+import datetime
 import logging
+from collections.abc import AsyncIterator
+from typing import Annotated
 from typing import Any
 
 import fastapi
 import jira
+import pydantic
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from . import cache
+from . import conditional
 from . import database
+from . import events
 from . import models
+from . import outbox
+from . import pagination
 from . import schemas
 from . import tasks
+from . import timelines
 
 
 logger = logging.getLogger(__name__)
 router = fastapi.APIRouter(tags=['api'])
 
 
-@router.get('/issues', response_model=list[schemas.Issue])
-async def read_issues(request: fastapi.Request) -> list[schemas.Issue]:
+NDJSON = 'application/x-ndjson'
+# Jira calls in flight at once for a bulk edit
+BULK_CONCURRENCY = 8
+BULK_MAX_EDITS = 100
+MAX_LOOKUP_KEYS = 1000
+
+_LOOKUP = pydantic.TypeAdapter(list[schemas.Issue | None])
+
+
+async def _stream_issues(app: fastapi.FastAPI) -> AsyncIterator[bytes]:
+    # N.B. the session must outlive the handler, since the body is only
+    # produced once the response starts being sent
+    async with database.session_from_app(app) as session:
+        async for issue in models.Issue.stream(closed=False, session=session):
+            yield issue.model_dump_json().encode() + b'\n'
+
+
+async def _read_issue_fields(
+        request: fastapi.Request,
+        fields: str,
+        *,
+        limit: int | None,
+        after: schemas.IssueCursor | None,
+        etag: str,
+) -> fastapi.Response:
+    try:
+        projection = schemas.Issue.parse_fields(fields)
+    except ValueError as exc:
+        raise fastapi.HTTPException(status_code=422, detail=str(exc)) from exc
+
     async with database.session_from_app(request.app) as session:
-        return await models.Issue.get(closed=False, session=session)
+        total = await models.Issue.count(closed=False, session=session)
+        rows, cursor = await models.Issue.project(
+            projection, closed=False, limit=limit, after=after,
+            session=session,
+        )
+
+    # N.B. skip response_model validation, which would demand every field
+    response = fastapi.Response(
+        content=schemas.Issue.dump_fields(projection, rows),
+        media_type='application/json',
+        headers=conditional.headers(etag),
+    )
+    pagination.set_headers(request, response, total=total, cursor=cursor)
+    return response
+
+
+async def _lookup_issues(
+        app: fastapi.FastAPI,
+        keys: list[str],
+) -> list[schemas.Issue | None]:
+    # One query for the lot, answered in the order asked for and with null
+    # for each key which isn't known.
+    issues = await cache.fetch(
+        app, models.Issue.get, closed=True,
+        filters=schemas.IssueFilter(keys=frozenset(keys)),
+    )
+    by_key = {x.key: x for x in issues}
+    return [by_key.get(key) for key in keys]
+
+
+async def _read_issue_keys(
+        request: fastapi.Request,
+        keys: str,
+        *,
+        etag: str,
+) -> fastapi.Response:
+    requested = [x for x in keys.split(',') if x]
+    if len(requested) > MAX_LOOKUP_KEYS:
+        raise fastapi.HTTPException(
+            status_code=422,
+            detail=f'At most {MAX_LOOKUP_KEYS} keys may be looked up at once',
+        )
+
+    # N.B. skip response_model validation, which doesn't allow for misses
+    issues = await _lookup_issues(request.app, requested)
+    return fastapi.Response(
+        content=_LOOKUP.dump_json(issues),
+        media_type='application/json',
+        headers=conditional.headers(etag),
+    )
+
+
+@router.get(
+    '/issues',
+    response_model=list[schemas.Issue],
+    responses={200: {'content': {NDJSON: {}}}},
+)
+async def read_issues(
+        request: fastapi.Request,
+        response: fastapi.Response,
+        limit: Annotated[int | None, fastapi.Query(ge=1, le=1000)] = None,
+        after: str | None = None,
+        stream: bool = False,
+        fields: str | None = None,
+        keys: str | None = None,
+) -> list[schemas.Issue] | fastapi.Response:
+    etag = await conditional.check(request)
+    if keys is not None:
+        return await _read_issue_keys(request, keys, etag=etag)
+
+    if stream or NDJSON in request.headers.get('accept', ''):
+        return fastapi.responses.StreamingResponse(
+            _stream_issues(request.app),
+            media_type=NDJSON,
+            headers=conditional.headers(etag),
+        )
+
+    cursor = pagination.parse_cursor(after)
+    if fields is not None:
+        return await _read_issue_fields(
+            request, fields, limit=limit, after=cursor, etag=etag,
+        )
+
+    total = await cache.fetch(request.app, models.Issue.count, closed=False)
+    if limit is None:
+        issues = await cache.fetch(
+            request.app, models.Issue.get, closed=False, after=cursor,
+        )
+        cursor = None
+    else:
+        issues, cursor = await cache.fetch(
+            request.app, models.Issue.paginate, limit=limit, after=cursor,
+            closed=False,
+        )
+
+    response.headers.update(conditional.headers(etag))
+    pagination.set_headers(request, response, total=total, cursor=cursor)
+    return issues
+
+
+@router.post('/issues/lookup', response_model=list[schemas.Issue | None])
+async def lookup_issues(
+        request: fastapi.Request,
+        keys: Annotated[list[str], fastapi.Body(max_length=MAX_LOOKUP_KEYS)],
+) -> list[schemas.Issue | None]:
+    # the same as GET /issues?keys=, for lists too long for a URL
+    return await _lookup_issues(request.app, keys)
 
 
 @router.get('/issues/{key}', response_model=schemas.Issue)
 async def read_issue(request: fastapi.Request, key: str) -> schemas.Issue:
-    async with database.session_from_app(request.app) as session:
-        issues = await models.Issue.get(key=key, closed=True, session=session)
+    issues = await cache.fetch(
+        request.app, models.Issue.get, key=key, closed=True,
+    )
 
     if not issues:
         raise fastapi.HTTPException(
@@ -34,12 +180,171 @@ async def read_issue(request: fastapi.Request, key: str) -> schemas.Issue:
     return issues[0]
 
 
-@router.patch('/issues/{key}', status_code=fastapi.status.HTTP_204_NO_CONTENT)
+async def _queue_patch(
+        request: fastapi.Request,
+        cached_issue: schemas.Issue,
+        issue: schemas.IssuePatch,
+        session: AsyncSession,
+) -> fastapi.Response:
+    # The edit shows up in the cache straight away, and is pushed to Jira by
+    # the outbox worker; the Location reports how that went.
+    entry = await models.Outbox.add(cached_issue, issue, session=session)
+    await models.Issue.upsert(issue.apply(cached_issue), session=session)
+    await session.commit()
+
+    generation = await cache.refresh(request.app)
+    events.publish(
+        request.app, generation,
+        changed=[cached_issue.key], assignees=[cached_issue.assignee],
+    )
+    outbox.wake(request.app)
+    return fastapi.Response(
+        content=entry.model_dump_json(),
+        status_code=fastapi.status.HTTP_202_ACCEPTED,
+        media_type='application/json',
+        headers={
+            'Location': str(
+                request.url_for(
+                    'read_outbox_entry', entry_id=entry.entry_id,
+                ),
+            ),
+            'Preference-Applied': 'respond-async',
+        },
+    )
+
+
+async def _check_unchanged(
+        app: fastapi.FastAPI,
+        cached_issue: schemas.Issue,
+) -> None:
+    live_issue = await asyncio.to_thread(
+        app.state.jira_client.issue,
+        id=cached_issue.key,
+        fields=schemas.Issue.jira_fields(),
+        expand='renderedFields',
+    )
+    if cached_issue != live_issue:
+        tasks.schedule_issue_refresh(app=app, key=cached_issue.key)
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_409_CONFLICT,
+            detail=(
+                'This issue was modified in Jira while you were editing '
+                'it, please refresh the page and try again.'
+            ),
+        )
+
+
+async def _apply_patch(
+        app: fastapi.FastAPI,
+        cached_issue: schemas.Issue,
+        issue: schemas.IssuePatch,
+) -> schemas.Issue:
+    # Edits rarely race each other, so first check whether Jira has seen any
+    # write since the last sync, from its timestamp alone. Only if it has is
+    # the whole issue worth fetching and comparing.
+    live_issue = await asyncio.to_thread(
+        app.state.jira_client.issue,
+        id=cached_issue.key,
+        fields=issue.jira_fields(),
+    )
+    if not cached_issue.updated_matches(live_issue):
+        await _check_unchanged(app, cached_issue)
+
+    logger.info(
+        'updating %s with %r',
+        cached_issue.key, issue.model_dump(exclude_unset=True),
+    )
+
+    await asyncio.to_thread(live_issue.update, fields=issue.to_jira())
+    return issue.apply(cached_issue)
+
+
+@router.patch('/issues', response_model=list[schemas.IssueEditResult])
+async def patch_issues(
+        request: fastapi.Request,
+        edits: Annotated[
+            list[schemas.IssueEdit],
+            fastapi.Body(max_length=BULK_MAX_EDITS),
+        ],
+) -> list[schemas.IssueEditResult]:
+    keys = frozenset(edit.key for edit in edits)
+    if len(keys) != len(edits):
+        raise fastapi.HTTPException(
+            status_code=422, detail='Each issue may only be edited once',
+        )
+
+    # Each edit succeeds or fails by itself, as it would have done as a
+    # request of its own; only the local writes are batched together.
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    updated_issues: list[schemas.Issue] = []
+
+    async def apply(
+            edit: schemas.IssueEdit,
+            cached_issue: schemas.Issue | None,
+    ) -> schemas.IssueEditResult:
+        if cached_issue is None:
+            return schemas.IssueEditResult(key=edit.key, status=404)
+        try:
+            async with semaphore:
+                updated_issues.append(
+                    await _apply_patch(request.app, cached_issue, edit.patch),
+                )
+        except fastapi.HTTPException as exc:
+            return schemas.IssueEditResult(
+                key=edit.key, status=exc.status_code, detail=exc.detail,
+            )
+        except jira.JIRAError as exc:
+            logger.warning('failed to update %s: %s', edit.key, exc.text)
+            return schemas.IssueEditResult(
+                key=edit.key, status=502, detail=exc.text,
+            )
+        except Exception as exc:
+            # eg. a dropped connection: this edit may or may not have reached
+            # Jira, but the others' results still have to be written back
+            logger.exception('failed to update %s', edit.key)
+            return schemas.IssueEditResult(
+                key=edit.key, status=502,
+                detail=str(exc) or type(exc).__name__,
+            )
+        return schemas.IssueEditResult(key=edit.key, status=204)
+
+    async with database.session_from_app(request.app) as session:
+        cached_issues = {
+            x.key: x for x in await models.Issue.get(
+                closed=True, filters=schemas.IssueFilter(keys=keys),
+                session=session,
+            )
+        }
+        results = await asyncio.gather(
+            *(apply(edit, cached_issues.get(edit.key)) for edit in edits),
+        )
+        if not updated_issues:
+            return results
+
+        for issue in updated_issues:
+            await models.Issue.upsert(issue, session=session)
+        await session.commit()
+
+    generation = await cache.refresh(request.app)
+    events.publish(
+        request.app, generation,
+        changed=[x.key for x in updated_issues],
+        assignees=[x.assignee for x in updated_issues],
+    )
+    return results
+
+
+@router.patch(
+    '/issues/{key}',
+    status_code=fastapi.status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    responses={202: {'model': schemas.OutboxEntry}},
+)
 async def patch_issue(
         request: fastapi.Request,
         key: str,
         issue: schemas.IssuePatch,
-) -> None:
+) -> fastapi.Response | None:
     async with database.session_from_app(request.app) as session:
         issues = await models.Issue.get(key=key, closed=True, session=session)
         if not issues:
@@ -48,34 +353,71 @@ async def patch_issue(
             )
 
         cached_issue = issues[0]
-        live_issue = await asyncio.to_thread(
-            request.app.state.jira_client.issue,
-            id=cached_issue.key,
-            fields=schemas.Issue.jira_fields(),
-            expand='renderedFields',
-        )
-        if cached_issue != live_issue:
-            tasks.schedule_issue_refresh(
-                app=request.app,
-                key=cached_issue.key,
-            )
-            raise fastapi.HTTPException(
-                status_code=fastapi.status.HTTP_409_CONFLICT,
-                detail=(
-                    'This issue was modified in Jira while you were editing '
-                    'it, please refresh the page and try again.'
-                ),
-            )
+        if 'respond-async' in request.headers.get('prefer', ''):
+            return await _queue_patch(request, cached_issue, issue, session)
+
+        updated_issue = await _apply_patch(request.app, cached_issue, issue)
+        await models.Issue.upsert(updated_issue, session=session)
+        await session.commit()
+
+    generation = await cache.refresh(request.app)
+    events.publish(
+        request.app, generation,
+        changed=[cached_issue.key], assignees=[cached_issue.assignee],
+    )
+    return None
 
-        new_data = issue.model_dump(exclude_unset=True)
-        logger.info('updating %s with %r', cached_issue.key, new_data)
 
-        await asyncio.to_thread(live_issue.update, fields=issue.to_jira())
-        await models.Issue.upsert(
-            cached_issue.model_copy(update=new_data),
-            session=session,
+@router.get('/outbox/{entry_id}', response_model=schemas.OutboxEntry)
+async def read_outbox_entry(
+        request: fastapi.Request,
+        entry_id: int,
+) -> schemas.OutboxEntry:
+    async with database.session_from_app(request.app) as session:
+        entry = await models.Outbox.get(entry_id, session=session)
+    if entry is None:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
         )
-        await session.commit()
+    return entry
+
+
+@router.get('/changes', response_model=schemas.ChangeSet)
+async def read_changes(
+        request: fastapi.Request,
+        since: Annotated[int, fastapi.Query(ge=0)] = 0,
+) -> schemas.ChangeSet:
+    # Pass the returned generation as the next "since". A reader which is
+    # told to resync should reload everything, then carry on from there.
+    async with database.session_from_app(request.app) as session:
+        return await models.Change.since(since, session=session)
+
+
+@router.get(
+    '/events',
+    response_class=fastapi.responses.StreamingResponse,
+    responses={200: {'content': {'text/event-stream': {}}}},
+)
+async def stream_events(
+        request: fastapi.Request,
+        last_event_id: Annotated[str | None, fastapi.Header()] = None,
+) -> fastapi.responses.StreamingResponse:
+    return fastapi.responses.StreamingResponse(
+        events.stream(request.app, last_event_id),
+        media_type='text/event-stream',
+        # N.B. proxies must pass each event through as soon as it is sent
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.get('/search', response_model=list[schemas.SearchResult])
+async def search_issues(
+        request: fastapi.Request,
+        q: str,
+        limit: Annotated[int, fastapi.Query(ge=1, le=100)] = 25,
+) -> list[schemas.SearchResult]:
+    async with database.session_from_app(request.app) as session:
+        return await models.Issue.search(q, limit=limit, session=session)
 
 
 @router.get('/settings')
@@ -124,6 +466,24 @@ async def patch_settings(
     }
 
 
+@router.get('/timeline', response_model=schemas.TimelineRange)
+async def read_timeline(
+        request: fastapi.Request,
+        response: fastapi.Response,
+        start: datetime.date,
+        end: datetime.date,
+) -> schemas.TimelineRange:
+    current_date = datetime.datetime.now(datetime.UTC).date()
+    etag = await conditional.check(request, current_date)
+
+    timeline = await timelines.get_range(
+        request.app, start, end, current_date,
+    )
+
+    response.headers.update(conditional.headers(etag))
+    return schemas.TimelineRange.from_timeline(timeline, current_date)
+
+
 @router.get('/ping', status_code=fastapi.status.HTTP_204_NO_CONTENT)
 async def ping() -> None:
     return None
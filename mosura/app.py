@@ -5,13 +5,17 @@ import os
 import signal
 from collections.abc import AsyncIterator
 
-import fastapi.staticfiles
+import fastapi
 import jira
 
 from . import api
+from . import cache
+from . import compression
 from . import config
 from . import database
-from . import models
+from . import events
+from . import outbox
+from . import static
 from . import tasks
 from . import ui
 
@@ -28,19 +32,25 @@ def _log_task_exception(task: asyncio.Task[None]) -> None:
             os.kill(os.getpid(), signal.SIGTERM)
 
 
+def _match_users(
+        jira_client: config.Jira,
+        query: str,
+) -> list[jira.resources.User]:
+    users = jira_client.search_users(query=query)
+    for user in users:
+        if user.accountId == query:
+            return [user]
+    return users
+
+
 def resolve_tracked_user(app_: fastapi.FastAPI) -> jira.resources.User:
     settings: config.Settings = app_.state.settings
-    jira_client: config.Jira = app_.state.jira_client
     tracked_user = settings.jira_tracked_user
-    users = jira_client.search_users(query=tracked_user)
+    users = _match_users(app_.state.jira_client, tracked_user)
     if not users:
         raise RuntimeError(
             f'could not resolve tracked Jira user "{tracked_user}"',
         )
-
-    for user in users:
-        if user.accountId == tracked_user:
-            return user
     if len(users) == 1:
         return users[0]
 
@@ -50,6 +60,21 @@ def resolve_tracked_user(app_: fastapi.FastAPI) -> jira.resources.User:
     )
 
 
+def resolve_team(app_: fastapi.FastAPI) -> dict[str, str]:
+    # account id -> display name, starting with the tracked user
+    settings: config.Settings = app_.state.settings
+    team = {app_.state.tracked_user_id: app_.state.tracked_user_name}
+    for member in settings.jira_team:
+        users = _match_users(app_.state.jira_client, member)
+        if len(users) != 1:
+            raise RuntimeError(
+                f'team member "{member}" matched {len(users)} Jira users; '
+                'set MOSURA_TEAM to unique values',
+            )
+        team[users[0].accountId] = users[0].displayName
+    return team
+
+
 @contextlib.asynccontextmanager
 async def lifespan(app_: fastapi.FastAPI) -> AsyncIterator[None]:
     app_.state.settings = config.load_settings()
@@ -63,16 +88,31 @@ async def lifespan(app_: fastapi.FastAPI) -> AsyncIterator[None]:
         app_.state.tracked_user_id,
         app_.state.tracked_user_name,
     )
+    app_.state.team = resolve_team(app_)
+
+    ui.configure_templates(app_.state.settings)
+    logger.info('startup(): compiled templates')
 
     app_.state.engine = database.build_engine(app_.state.settings)
     app_.state.sessionmaker = database.build_sessionmaker(app_.state.engine)
+    app_.state.read_cache = cache.ReadCache(
+        capacity=app_.state.settings.mosura_cache_size,
+    )
+    app_.state.lane_cache = cache.TaggedCache(
+        capacity=app_.state.settings.mosura_cache_size,
+    )
+    app_.state.events = events.Broker()
+    app_.state.outbox = asyncio.Event()
 
     async with app_.state.engine.begin() as conn:
-        await conn.run_sync(models.Base.metadata.create_all)
+        await conn.run_sync(database.initialize)
     logger.info('startup(): initialized db')
 
     # TODO: catch errors in these tasks immediately and crash/retry
     app_.state.tasks = await tasks.spawn(app_)
+    app_.state.tasks.add(
+        asyncio.create_task(outbox.push(app_), name='push_outbox'),
+    )
     for t in app_.state.tasks:
         t.add_done_callback(_log_task_exception)
         if t.done():
@@ -91,13 +131,14 @@ async def lifespan(app_: fastapi.FastAPI) -> AsyncIterator[None]:
 
 
 app = fastapi.FastAPI(lifespan=lifespan)
+app.add_middleware(
+    compression.GZipMiddleware, minimum_size=1024, compresslevel=6,
+)
 app.include_router(ui.router)
 app.include_router(api.router, prefix='/api/v0')
 app.include_router(api.router, prefix='/api/latest')
-app.mount(
-    '/static', fastapi.staticfiles.StaticFiles(directory='static'),
-    name='static',
-)
+app.state.static_files = static.StaticFiles(directory=static.DIRECTORY)
+app.mount('/static', app.state.static_files, name='static')
 
 
 @app.exception_handler(fastapi.exceptions.RequestValidationError)
@@ -0,0 +1,180 @@
+import collections
+import logging
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
+from typing import cast
+from typing import TypeVar
+
+import fastapi
+
+from . import database
+from . import models
+from . import schemas
+
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+def _weight(value: object) -> int:
+    # Roughly how many issues a result holds, which is what dominates its
+    # memory use.
+    if isinstance(value, tuple):
+        return sum(_weight(x) for x in value)
+    if isinstance(value, list):
+        return max(len(value), 1)
+    if isinstance(value, schemas.Timeline):
+        return len(value.issues) + len(value.attention) + 1
+    if isinstance(value, str):
+        # rendered HTML, at somewhere around a kilobyte per issue
+        return max(len(value) // 1024, 1)
+    return 1
+
+
+class TaggedCache:
+    """
+    An LRU of results, each tagged with the generation it was read from.
+
+    A lookup only hits if the caller still expects that same generation, so
+    a write never has to know which entries it made stale.
+
+    Cached values are shared between requests: treat them as read-only.
+    """
+
+    def __init__(self, capacity: int = 20_000) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[
+            Hashable, tuple[int, int, Any],
+        ] = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def lookup(self, key: Hashable, generation: int) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != generation:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return True, entry[2]
+
+    def store(self, key: Hashable, generation: int, value: object) -> None:
+        weight = _weight(value)
+        if weight > self.capacity:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous[1]
+
+        self._entries[key] = (generation, weight, value)
+        self._size += weight
+        while self._size > self.capacity:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._size -= evicted
+
+
+class ReadCache(TaggedCache):
+    """
+    A TaggedCache of query results, which all share one generation.
+
+    That generation is the one of the whole issue graph. An entry is only
+    served while its generation is still current.
+    """
+
+    def __init__(self, capacity: int = 20_000) -> None:
+        super().__init__(capacity)
+        # the latest committed generation we know of; None until first read
+        self.generation: int | None = None
+
+    def observe(self, generation: int) -> None:
+        # Generations only move forwards, so a slow reader which fetched an
+        # older value can never roll us back.
+        if self.generation is not None and generation <= self.generation:
+            return
+
+        logger.debug(
+            'cache: generation %s -> %d, dropping %d entries '
+            '(hits=%d misses=%d)',
+            self.generation, generation, len(self),
+            self.hits, self.misses,
+        )
+        self.generation = generation
+        self.clear()
+
+    def store(self, key: Hashable, generation: int, value: object) -> None:
+        if generation != self.generation:
+            # already stale, and may well have been read from newer data
+            return
+        super().store(key, generation, value)
+
+
+def from_app(app: fastapi.FastAPI) -> ReadCache:
+    read_cache: ReadCache = app.state.read_cache
+    return read_cache
+
+
+def lanes_from_app(app: fastapi.FastAPI) -> TaggedCache:
+    # per-assignee results, tagged with that assignee's own generation
+    lane_cache: TaggedCache = app.state.lane_cache
+    return lane_cache
+
+
+async def refresh(app: fastapi.FastAPI) -> int:
+    """
+    Pick up the latest committed generation.
+
+    Writers call this right after committing, which is what drops stale
+    entries.
+    """
+    async with database.session_from_app(app) as session:
+        generation = await models.Generation.get(session=session)
+
+    read_cache = from_app(app)
+    read_cache.observe(generation)
+    return read_cache.generation or generation
+
+
+async def current_generation(app: fastapi.FastAPI) -> int:
+    generation = from_app(app).generation
+    if generation is None:
+        return await refresh(app)
+    return generation
+
+
+async def fetch(
+        app: fastapi.FastAPI,
+        loader: Callable[..., Awaitable[T]],
+        **kwargs: Hashable,
+) -> T:
+    """
+    Return ``await loader(**kwargs, session=...)``, from the cache if hit.
+
+    A hit means that the same call was already made at the current
+    generation.
+    """
+    read_cache = from_app(app)
+    generation = await current_generation(app)
+
+    key = (loader, tuple(sorted(kwargs.items())))
+    hit, value = read_cache.lookup(key, generation)
+    if hit:
+        return cast(T, value)
+
+    async with database.session_from_app(app) as session:
+        result = await loader(**kwargs, session=session)
+
+    read_cache.store(key, generation, result)
+    return result
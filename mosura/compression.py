@@ -0,0 +1,48 @@
+import starlette.datastructures
+import starlette.middleware.gzip
+import starlette.types
+
+
+# Only whole documents are worth compressing on the fly: static files are
+# precompressed ahead of time, and compressing a stream would hold back each
+# chunk until the compressor had buffered enough of them.
+COMPRESSIBLE = ('text/html', 'application/json')
+
+
+class _DocumentResponder(starlette.middleware.gzip.GZipResponder):
+    async def send_with_compression(
+            self,
+            message: starlette.types.Message,
+    ) -> None:
+        await super().send_with_compression(message)
+        if message['type'] == 'http.response.start':
+            headers = starlette.datastructures.Headers(raw=message['headers'])
+            content_type = headers.get('content-type', '')
+            if not content_type.startswith(COMPRESSIBLE):
+                self.content_type_is_excluded = True
+
+
+class GZipMiddleware(starlette.middleware.gzip.GZipMiddleware):
+    """GZip HTML and JSON responses for clients which accept it."""
+
+    async def __call__(
+            self,
+            scope: starlette.types.Scope,
+            receive: starlette.types.Receive,
+            send: starlette.types.Send,
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = starlette.datastructures.Headers(scope=scope)
+        responder: starlette.types.ASGIApp
+        if 'gzip' in headers.get('accept-encoding', ''):
+            responder = _DocumentResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel,
+            )
+        else:
+            responder = starlette.middleware.gzip.IdentityResponder(
+                self.app, self.minimum_size,
+            )
+        await responder(scope, receive, send)
@@ -0,0 +1,74 @@
+import hashlib
+import secrets
+
+import fastapi
+
+from . import cache
+
+
+# Responses also depend on the code and templates that rendered them, so tags
+# handed out by a previous process are never honoured.
+_INSTANCE = secrets.token_hex(8)
+
+
+def make_etag(
+        request: fastapi.Request,
+        generation: int,
+        *extra: object,
+) -> str:
+    parts = [
+        _INSTANCE,
+        request.url.path,
+        repr(sorted(request.query_params.multi_items())),
+        request.headers.get('accept', ''),
+        *map(str, extra),
+    ]
+    digest = hashlib.blake2b(
+        '\0'.join(parts).encode(),
+        digest_size=8,
+    ).hexdigest()
+    # N.B. weak: the compression middleware may gzip the body after the tag
+    # is made, and a strong tag would have to differ between the two codings
+    return f'W/"{generation}-{digest}"'
+
+
+def headers(etag: str) -> dict[str, str]:
+    # no-cache still lets clients keep the response, but makes them
+    # revalidate it (cheaply) on every use
+    return {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+
+def not_modified_headers(etag: str) -> dict[str, str]:
+    # a 304 must vary as the response it stands in for would have
+    return {**headers(etag), 'Vary': 'Accept-Encoding'}
+
+
+def matches(request: fastapi.Request, etag: str) -> bool:
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+
+    # If-None-Match always uses the weak comparison
+    tags = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return etag.removeprefix('W/') in tags
+
+
+async def check(request: fastapi.Request, *extra: object) -> str:
+    """
+    Short-circuit a read whose client copy is still current.
+
+    Only the data generation is consulted, so a matching request is answered
+    with ``304 Not Modified`` without touching the issue tables. Anything
+    other than the request itself which the response depends on, such as the
+    current date, must be passed as ``extra``.
+    """
+    generation = await cache.current_generation(request.app)
+    etag = make_etag(request, generation, *extra)
+    if matches(request, etag):
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_304_NOT_MODIFIED,
+            headers=not_modified_headers(etag),
+        )
+    return etag
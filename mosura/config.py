@@ -45,8 +45,17 @@ class Settings(pydantic_settings.BaseSettings):
     jira_auth_user: str
     jira_domain: str
     mosura_appdata: str = '.'
+    # roughly how many issues the in-process read cache may hold
+    mosura_cache_size: int = 20_000
     mosura_log_level: str = 'DEBUG'
     mosura_poll_interval: int = 60
+    # re-read templates from disk when they change, for development
+    mosura_reload_templates: bool = False
+    # keep compiled templates under mosura_appdata across restarts
+    mosura_template_cache: bool = True
+    # comma-separated Jira users, as for MOSURA_USER, to show alongside the
+    # tracked user on the team timeline
+    mosura_team: str | None = None
     mosura_user: str | None = None
 
     # support docker compose secrets by default
@@ -72,6 +81,11 @@ class Settings(pydantic_settings.BaseSettings):
     def jira_tracked_user(self) -> str:
         return self.mosura_user or self.jira_auth_user
 
+    @property
+    def jira_team(self) -> list[str]:
+        members = (self.mosura_team or '').split(',')
+        return [x.strip() for x in members if x.strip()]
+
 
 class Jira(jira.JIRA):
     @classmethod
@@ -2,11 +2,13 @@ import contextlib
 from collections.abc import AsyncIterator
 
 import fastapi
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 
+from . import models
 from .config import Settings
 
 
@@ -17,6 +19,22 @@ def build_engine(settings: Settings) -> AsyncEngine:
     )
 
 
+def initialize(conn: Connection) -> None:
+    version = conn.exec_driver_sql('PRAGMA user_version').scalar()
+    if version != models.SCHEMA_VERSION:
+        # Everything but user settings and unsent edits can be re-fetched
+        # from Jira.
+        kept = {models.Setting.__tablename__, models.Outbox.__tablename__}
+        stale = [
+            table for table in models.Base.metadata.sorted_tables
+            if table.name not in kept
+        ]
+        models.Base.metadata.drop_all(conn, tables=stale)
+        conn.exec_driver_sql(f'PRAGMA user_version = {models.SCHEMA_VERSION}')
+
+    models.Base.metadata.create_all(conn)
+
+
 def build_sessionmaker(
         engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
@@ -0,0 +1,120 @@
+"""
+Change sets published to open pages after each write.
+
+Pages subscribe over Server-Sent Events.
+"""
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncGenerator
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+import fastapi
+
+from . import cache
+from . import schemas
+
+
+# change sets held for each subscriber before it's told to resync instead
+BUFFER_SIZE = 16
+# seconds between comments which keep idle connections from timing out
+KEEPALIVE = 15.0
+
+logger = logging.getLogger(__name__)
+
+
+class Broker:
+    """
+    Fan change sets out to every subscriber.
+
+    Each subscriber has a bounded buffer: one which falls behind has its
+    backlog replaced by a single resync, so a slow client costs at most
+    ``buffer_size`` change sets of memory.
+    """
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        self.subscribers: set[asyncio.Queue[schemas.ChangeSet]] = set()
+
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+    def publish(self, change: schemas.ChangeSet) -> None:
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                logger.debug('publish(): subscriber fell behind, resyncing')
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(
+                    schemas.ChangeSet(
+                        generation=change.generation, resync=True,
+                    ),
+                )
+
+    @contextlib.contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue[schemas.ChangeSet]]:
+        queue: asyncio.Queue[schemas.ChangeSet] = asyncio.Queue(
+            maxsize=self.buffer_size,
+        )
+        self.subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self.subscribers.discard(queue)
+
+
+def from_app(app: fastapi.FastAPI) -> Broker:
+    broker: Broker = app.state.events
+    return broker
+
+
+def publish(
+        app: fastapi.FastAPI,
+        generation: int,
+        *,
+        changed: Iterable[str] = (),
+        removed: Iterable[str] = (),
+        assignees: Iterable[str | None] = (),
+) -> None:
+    """Announce a write, once it has been committed and the cache refreshed."""
+    change = schemas.ChangeSet(
+        generation=generation,
+        changed=sorted(changed),
+        removed=sorted(removed),
+        assignees=sorted({x for x in assignees if x}),
+    )
+    if change.changed or change.removed:
+        from_app(app).publish(change)
+
+
+def format_event(change: schemas.ChangeSet) -> str:
+    return (
+        f'id: {change.generation}\n'
+        'event: change\n'
+        f'data: {change.model_dump_json()}\n\n'
+    )
+
+
+async def stream(
+        app: fastapi.FastAPI,
+        last_event_id: str | None = None,
+) -> AsyncGenerator[str, None]:
+    with from_app(app).subscribe() as queue:
+        # A reconnecting client may have missed change sets in between, which
+        # are not kept around.
+        generation = await cache.current_generation(app)
+        if last_event_id is not None and last_event_id != str(generation):
+            yield format_event(
+                schemas.ChangeSet(generation=generation, resync=True),
+            )
+
+        while True:
+            try:
+                change = await asyncio.wait_for(queue.get(), KEEPALIVE)
+            except TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            yield format_event(change)
@@ -0,0 +1,41 @@
+from mosura.models.base import Base
+from mosura.models.base import SCHEMA_VERSION
+from mosura.models.change import Change
+from mosura.models.component import Component
+from mosura.models.component import Label
+from mosura.models.issue import Issue
+from mosura.models.outbox import Outbox
+from mosura.models.rows import convert_component_response
+from mosura.models.rows import convert_field_response
+from mosura.models.rows import convert_issue_response
+from mosura.models.rows import convert_label_response
+from mosura.models.rows import IssueRow
+from mosura.models.search import IssueSearch
+from mosura.models.task import Generation
+from mosura.models.task import Setting
+from mosura.models.task import Task
+from mosura.models.timeline import HistorySegment
+from mosura.models.timeline import IssueHistory
+from mosura.models.transition import IssueTransition
+
+__all__ = [
+    'Base',
+    'Change',
+    'Component',
+    'convert_component_response',
+    'convert_field_response',
+    'convert_issue_response',
+    'convert_label_response',
+    'Generation',
+    'HistorySegment',
+    'Issue',
+    'IssueHistory',
+    'IssueRow',
+    'IssueSearch',
+    'IssueTransition',
+    'Label',
+    'Outbox',
+    'SCHEMA_VERSION',
+    'Setting',
+    'Task',
+]
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import MappedAsDataclass
+
+
+strpk = Annotated[str, mapped_column(primary_key=True)]
+strpkindex = Annotated[str, mapped_column(primary_key=True, index=True)]
+strfk = Annotated[
+    str, mapped_column(
+        ForeignKey('issues.key'),
+        primary_key=True,
+    ),
+]
+
+
+class Base(AsyncAttrs, DeclarativeBase, MappedAsDataclass):
+    pass
+
+
+# Bump whenever a table or index changes shape. The database is a cache of
+# Jira, so rather than carrying migrations, a mismatched cache is rebuilt on
+# startup and repopulated by the next sync.
+SCHEMA_VERSION = 8
@@ -0,0 +1,108 @@
+import datetime
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import func
+from sqlalchemy.sql import literal
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.base import Base
+from mosura.models.base import strpk
+from mosura.models.task import Generation
+
+
+class Change(Base):
+    # The last write to each issue, as of the generation which committed it.
+    # Keeping only the latest one per key compacts the log as it goes, so a
+    # reader catches up in O(changes) rather than O(issues).
+    #
+    # The "changes" generation is the horizon: readers from before it may
+    # have missed writes. It starts out just before the first write logged
+    # since the cache was (re)built, and moves forwards as compact() drops
+    # old deletions.
+    __tablename__ = 'changes'
+
+    key: Mapped[strpk]
+    generation: Mapped[int] = mapped_column(index=True)
+    op: Mapped[str]
+    recorded: Mapped[datetime.datetime]
+
+    @classmethod
+    async def record(
+        cls, key: str, op: schemas.ChangeOp, *, session: AsyncSession,
+    ) -> None:
+        # N.B. run after Generation.bump(), to pick up the new generation
+        start = insert(Generation).from_select(
+            ['key', 'value'],
+            select(literal('changes'), Generation.value - 1)
+            .where(Generation.key == 'issues'),
+        )
+        await session.execute(start.on_conflict_do_nothing())
+
+        generation = select(
+            Generation.value,
+            literal(key),
+            literal(str(op)),
+            literal(datetime.datetime.now(datetime.UTC).replace(tzinfo=None)),
+        ).where(Generation.key == 'issues')
+        stmt = insert(cls).from_select(
+            ['generation', 'key', 'op', 'recorded'], generation,
+        )
+        query = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={
+                'generation': stmt.excluded.generation,
+                'op': stmt.excluded.op,
+                'recorded': stmt.excluded.recorded,
+            },
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def since(
+        cls, generation: int, *, session: AsyncSession,
+    ) -> schemas.ChangeSet:
+        current = await Generation.get(session=session)
+        # N.B. no horizon yet means that nothing was ever written
+        query = select(Generation.value).where(Generation.key == 'changes')
+        horizon = (await session.execute(query)).scalar_one_or_none() or 0
+        if generation < horizon or generation > current:
+            return schemas.ChangeSet(generation=current, resync=True)
+
+        changes = (
+            select(cls.key, cls.op)
+            .where(cls.generation > generation)
+            .order_by(cls.key)
+        )
+        rows = (await session.execute(changes)).tuples().all()
+        return schemas.ChangeSet(
+            generation=current,
+            changed=[k for k, op in rows if op == schemas.ChangeOp.upsert],
+            removed=[k for k, op in rows if op == schemas.ChangeOp.delete],
+        )
+
+    @classmethod
+    async def compact(
+        cls, *, before: datetime.datetime, session: AsyncSession,
+    ) -> int:
+        query = (
+            delete(cls)
+            .where(cls.op == schemas.ChangeOp.delete)
+            .where(cls.recorded < before.replace(tzinfo=None))
+            .returning(cls.generation)
+        )
+        dropped = (await session.execute(query)).scalars().all()
+        if not dropped:
+            return 0
+
+        stmt = insert(Generation).values(key='changes', value=max(dropped))
+        horizon = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={'value': func.max(Generation.value, stmt.excluded.value)},
+        )
+        await session.execute(horizon)
+        return len(dropped)
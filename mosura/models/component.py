@@ -0,0 +1,98 @@
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.base import Base
+from mosura.models.base import strfk
+from mosura.models.base import strpk
+
+
+class Component(Base):
+    __tablename__ = 'components'
+
+    key: Mapped[strfk]
+    component: Mapped[strpk]
+
+    @classmethod
+    async def list_(cls, key: str, *, session: AsyncSession) -> set[str]:
+        query = select(cls.component).where(cls.key == key)
+        rows = await session.execute(query)
+        return set(rows.scalars())
+
+    @classmethod
+    async def delete(cls, key: str, *, session: AsyncSession) -> None:
+        query = delete(cls).where(cls.key == key)
+        await session.execute(query)
+
+    @classmethod
+    async def delete_many(
+        cls,
+        key: str,
+        components: set[str],
+        *,
+        session: AsyncSession,
+    ) -> None:
+        if not components:
+            return
+
+        query = (
+            delete(cls)
+            .where(cls.key == key)
+            .where(cls.component.in_(components))
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def upsert(
+        cls, component: schemas.Component, *,
+        session: AsyncSession,
+    ) -> None:
+        stmt = insert(cls).values(**component.model_dump())
+        await session.execute(stmt.on_conflict_do_nothing())
+
+
+class Label(Base):
+    __tablename__ = 'labels'
+
+    key: Mapped[strfk]
+    label: Mapped[strpk]
+
+    @classmethod
+    async def list_(cls, key: str, *, session: AsyncSession) -> set[str]:
+        query = select(cls.label).where(cls.key == key)
+        rows = await session.execute(query)
+        return set(rows.scalars())
+
+    @classmethod
+    async def delete(cls, key: str, *, session: AsyncSession) -> None:
+        query = delete(cls).where(cls.key == key)
+        await session.execute(query)
+
+    @classmethod
+    async def delete_many(
+        cls,
+        key: str,
+        labels: set[str],
+        *,
+        session: AsyncSession,
+    ) -> None:
+        if not labels:
+            return
+
+        query = (
+            delete(cls)
+            .where(cls.key == key)
+            .where(cls.label.in_(labels))
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def upsert(
+        cls, label: schemas.Label, *,
+        session: AsyncSession,
+    ) -> None:
+        stmt = insert(cls).values(**label.model_dump())
+        await session.execute(stmt.on_conflict_do_nothing())
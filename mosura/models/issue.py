@@ -0,0 +1,458 @@
+import datetime
+from collections.abc import AsyncIterator
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Index
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import and_
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import exists
+from sqlalchemy.sql import func
+from sqlalchemy.sql import literal_column
+from sqlalchemy.sql import or_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models import listing
+from mosura.models.base import Base
+from mosura.models.base import strpkindex
+from mosura.models.change import Change
+from mosura.models.component import Component
+from mosura.models.component import Label
+from mosura.models.rows import convert_issue
+from mosura.models.rows import convert_issue_response
+from mosura.models.rows import IssueRow
+from mosura.models.search import IssueSearch
+from mosura.models.task import Generation
+from mosura.models.timeline import IssueHistory
+from mosura.models.transition import IssueTransition
+
+
+class Issue(Base):
+    __tablename__ = 'issues'
+    __table_args__ = (
+        Index('ix_issues_priority_rank_key', 'priority_rank', 'key'),
+        Index('ix_issues_assignee_updated', 'assignee', 'updated'),
+    )
+
+    key: Mapped[strpkindex]
+    summary: Mapped[str]
+    description: Mapped[str | None]
+    status: Mapped[str]
+    assignee: Mapped[str | None]
+    priority: Mapped[str]
+    startdate: Mapped[datetime.datetime | None]
+    created: Mapped[datetime.datetime]
+    updated: Mapped[datetime.datetime]
+    timeestimate: Mapped[datetime.timedelta]
+    votes: Mapped[int]
+    priority_rank: Mapped[int]
+    # see schemas.IssueCreate.derive_status()
+    status_category: Mapped[str]
+    status_rank: Mapped[int]
+
+    components: Mapped[list[Component]] = relationship()
+    labels: Mapped[list[Label]] = relationship()
+
+    @classmethod
+    def read_columns(cls) -> tuple[InstrumentedAttribute[Any], ...]:
+        # N.B. order matches IssueRow
+        return (
+            cls.key, cls.summary, cls.description, cls.status, cls.assignee,
+            cls.priority, cls.startdate, cls.created, cls.updated,
+            cls.timeestimate, cls.votes, cls.status_category, cls.status_rank,
+        )
+
+    @classmethod
+    def sort_order(
+        cls, order: schemas.IssueOrder | None = None,
+    ) -> tuple[ColumnElement[Any], ...]:
+        # By default, the canonical listing order: most important first. The
+        # key is always a unique tie-breaker so that pages never overlap or
+        # skip issues.
+        order = order or schemas.IssueOrder()
+        if order.sort is schemas.IssueSort.key:
+            return (cls.key.desc() if order.descending else cls.key.asc(),)
+
+        column = listing.sort_column(cls, order.sort)
+        return (
+            column.desc() if order.descending else column.asc(),
+            cls.key.asc(),
+        )
+
+    @classmethod
+    def select_rows(
+        cls, order: schemas.IssueOrder | None = None,
+    ) -> Select[Any]:
+        # one row per component/label pair, grouped by issue
+        return (
+            select(*cls.read_columns(), Component.component, Label.label)
+            .join(Component.__table__, cls.key == Component.key, isouter=True)
+            .join(Label, cls.key == Label.key, isouter=True)
+            .order_by(*cls.sort_order(order))
+        )
+
+    @classmethod
+    def filter_(
+        cls, query: Select[Any], *, key: str | None = None,
+        assignee: str | None = None, closed: bool = False,
+        needs_triage: bool = False,
+        window: tuple[datetime.date, datetime.date] | None = None,
+        filters: schemas.IssueFilter | None = None,
+    ) -> Select[Any]:
+        if filters:
+            query = query.where(*listing.matches(cls, filters))
+        if key:
+            query = query.where(cls.key == key)
+        if assignee:
+            query = query.where(cls.assignee == assignee)
+        if not closed:
+            query = query.where(cls.status != 'Closed')
+        if needs_triage:
+            # TODO: make this configurable
+            query = query.where(
+                or_(
+                    cls.status == 'Needs Triage',
+                    ~exists()
+                    .where(Component.key == cls.key)
+                    .correlate_except(Component),
+                    ~exists()
+                    .where(Label.key == cls.key)
+                    .correlate_except(Label),
+                ),
+            )
+        if window:
+            query = query.where(cls.overlaps(*window))
+        return query
+
+    @classmethod
+    def overlaps(
+        cls, start: datetime.date, end: datetime.date,
+    ) -> ColumnElement[bool]:
+        # Whether the issue may show up on a timeline of [start, end). Open
+        # issues always can: they extend to today, or get flagged for
+        # attention. A closed issue spans from its creation to at most its
+        # last update, since closing it was itself an update.
+        start_at = datetime.datetime.combine(start, datetime.time())
+        end_at = datetime.datetime.combine(end, datetime.time())
+        return or_(
+            cls.status.not_in(schemas.Status.CLOSED),
+            and_(cls.updated >= start_at, cls.created < end_at),
+        )
+
+    @classmethod
+    def keyset(
+        cls, query: Select[Any], *, limit: int | None,
+        after: schemas.IssueCursor | None,
+        order: schemas.IssueOrder | None = None,
+    ) -> Select[Any]:
+        order = order or schemas.IssueOrder()
+        if after is not None:
+            query = query.where(listing.after(cls, after, order))
+        return query.order_by(*cls.sort_order(order)).limit(limit)
+
+    @classmethod
+    async def get(
+        cls, *, key: str | None = None, assignee: str | None = None,
+        closed: bool = False, needs_triage: bool = False,
+        window: tuple[datetime.date, datetime.date] | None = None,
+        filters: schemas.IssueFilter | None = None,
+        order: schemas.IssueOrder | None = None,
+        limit: int | None = None, after: schemas.IssueCursor | None = None,
+        session: AsyncSession,
+    ) -> list[schemas.Issue]:
+        query = cls.select_rows(order)
+        if limit is None and after is None:
+            query = cls.filter_(
+                query, key=key, assignee=assignee, closed=closed,
+                needs_triage=needs_triage, window=window, filters=filters,
+            )
+        else:
+            # Page over issues rather than joined rows, otherwise the limit
+            # would count one row per component/label pair.
+            page = cls.filter_(
+                select(cls.key), key=key, assignee=assignee, closed=closed,
+                needs_triage=needs_triage, window=window, filters=filters,
+            )
+            query = query.where(
+                cls.key.in_(
+                    cls.keyset(page, limit=limit, after=after, order=order),
+                ),
+            )
+
+        results: Sequence[IssueRow] = (await session.execute(query)).all()
+        return convert_issue_response(results)
+
+    @classmethod
+    async def stream(
+        cls, *, closed: bool = False, session: AsyncSession,
+    ) -> AsyncIterator[schemas.Issue]:
+        # Reads through a server-side cursor and yields each issue as soon as
+        # its last row arrives, so memory use doesn't grow with the cache.
+        query = cls.filter_(cls.select_rows(), closed=closed)
+        fields: list[IssueRow] = []
+        async for row in await session.stream(query):
+            if fields and row[0] != fields[0][0]:
+                yield convert_issue(fields)
+                fields = []
+            fields.append(row)
+
+        if fields:
+            yield convert_issue(fields)
+
+    @classmethod
+    async def paginate(
+        cls, *, limit: int, after: schemas.IssueCursor | None = None,
+        assignee: str | None = None, closed: bool = False,
+        needs_triage: bool = False,
+        filters: schemas.IssueFilter | None = None,
+        order: schemas.IssueOrder | None = None, session: AsyncSession,
+    ) -> tuple[list[schemas.Issue], schemas.IssueCursor | None]:
+        # fetch one extra issue to find out whether there is a next page
+        issues = await cls.get(
+            assignee=assignee, closed=closed, needs_triage=needs_triage,
+            filters=filters, order=order, limit=limit + 1, after=after,
+            session=session,
+        )
+        if len(issues) <= limit:
+            return issues, None
+
+        issues = issues[:limit]
+        return issues, schemas.IssueCursor.from_issue(issues[-1])
+
+    @classmethod
+    async def project(
+        cls, fields: frozenset[str], *, closed: bool = False,
+        limit: int | None = None, after: schemas.IssueCursor | None = None,
+        session: AsyncSession,
+    ) -> tuple[list[dict[str, Any]], schemas.IssueCursor | None]:
+        # Like paginate(), but only reads the requested columns, and only
+        # touches the component/label tables when those are asked for.
+        columns = [
+            column for column in cls.read_columns()
+            if column.key in fields and column is not cls.key
+        ]
+        query = cls.keyset(
+            cls.filter_(
+                select(cls.key, cls.priority_rank, *columns), closed=closed,
+            ),
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        rows = [row._asdict() for row in await session.execute(query)]
+
+        cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            cursor = schemas.IssueCursor(
+                priority_rank=rows[-1]['priority_rank'], key=rows[-1]['key'],
+            )
+
+        for row in rows:
+            for name in ('startdate', 'created', 'updated'):
+                if row.get(name):
+                    # TODO: store tzinfo in db
+                    row[name] = row[name].replace(tzinfo=datetime.UTC)
+
+        keys = query.with_only_columns(cls.key)
+        for table, name in ((Component, 'component'), (Label, 'label')):
+            if f'{name}s' in fields:
+                await cls._project_values(
+                    rows, table.__table__.c.key, table.__table__.c[name],
+                    keys=keys, session=session,
+                )
+        return rows, cursor
+
+    @staticmethod
+    async def _project_values(
+        rows: list[dict[str, Any]], key: ColumnElement[str],
+        value: ColumnElement[str], *, keys: Select[Any],
+        session: AsyncSession,
+    ) -> None:
+        query = select(key, value).where(key.in_(keys)).order_by(key, value)
+        values: dict[str, list[dict[str, str]]] = {}
+        for k, v in await session.execute(query):
+            values.setdefault(k, []).append({'key': k, value.name: v})
+
+        for row in rows:
+            row[f'{value.name}s'] = values.get(row['key'], [])
+
+    @classmethod
+    async def count(
+        cls, *, assignee: str | None = None, closed: bool = False,
+        needs_triage: bool = False,
+        filters: schemas.IssueFilter | None = None, session: AsyncSession,
+    ) -> int:
+        query = cls.filter_(
+            select(func.count()).select_from(cls),
+            assignee=assignee, closed=closed, needs_triage=needs_triage,
+            filters=filters,
+        )
+        count: int = (await session.execute(query)).scalar_one()
+        return count
+
+    @classmethod
+    async def get_meta(
+        cls, *, assignee: str | None = None, closed: bool = False,
+        needs_triage: bool = False, session: AsyncSession,
+    ) -> schemas.Meta:
+        # The filter choices have to cover every matching issue, not just
+        # whichever page has been rendered so far.
+        queries: dict[str, Select[Any]] = {
+            'assignees': select(cls.assignee),
+            'components': (
+                select(Component.component)
+                .join(cls, cls.key == Component.key)
+            ),
+            'labels': select(Label.label).join(cls, cls.key == Label.key),
+            'priorities': select(cls.priority),
+            'statuses': select(cls.status),
+        }
+        values: dict[str, list[str]] = {}
+        for name, query in queries.items():
+            query = cls.filter_(
+                query.distinct(), assignee=assignee, closed=closed,
+                needs_triage=needs_triage,
+            )
+            rows = await session.execute(query)
+            values[name] = sorted(x for x in rows.scalars() if x)
+
+        return schemas.Meta(
+            assignees=values['assignees'] + ['None'],
+            components=values['components'],
+            labels=values['labels'],
+            priorities=sorted(map(schemas.Priority, values['priorities'])),
+            statuses=values['statuses'],
+        )
+
+    @classmethod
+    async def search(
+        cls, query: str, *, limit: int = 25,
+        session: AsyncSession,
+    ) -> list[schemas.SearchResult]:
+        expression = IssueSearch.match_expression(query)
+        if expression is None:
+            return []
+
+        stmt = (
+            select(cls.key, cls.summary, cls.status, IssueSearch.snippet())
+            .select_from(IssueSearch.index)
+            .join(
+                cls,
+                literal_column('issues.rowid') == IssueSearch.index.c.rowid,
+            )
+            .where(IssueSearch.matches(expression))
+            .order_by(IssueSearch.rank())
+            .limit(limit)
+        )
+        rows = await session.execute(stmt)
+        return [
+            schemas.SearchResult(
+                key=key,
+                summary=summary,
+                status=status,
+                snippet=IssueSearch.highlight(snippet),
+            )
+            for key, summary, status, snippet in rows.all()
+        ]
+
+    @classmethod
+    async def list_keys(
+        cls, *, session: AsyncSession,
+    ) -> list[str]:
+        query = select(cls.key).order_by(cls.key)
+        rows = await session.execute(query)
+        return list(rows.scalars())
+
+    @classmethod
+    async def get_updated_map(
+        cls, *, session: AsyncSession,
+    ) -> dict[str, datetime.datetime]:
+        # Change-detection gate: only the stored ``updated`` timestamp is
+        # needed, so this deliberately skips the read model and its
+        # component/label joins. SQLite persists naive datetimes, so each
+        # value is UTC-normalised to stay comparable with tz-aware Jira
+        # timestamps.
+        query = select(cls.key, cls.updated)
+        rows = await session.execute(query)
+        return {
+            key: updated.replace(tzinfo=datetime.UTC)
+            for key, updated in rows.all()
+        }
+
+    @classmethod
+    async def _get_assignee(
+        cls, key: str, *, session: AsyncSession,
+    ) -> str | None:
+        query = select(cls.assignee).where(cls.key == key)
+        assignee: str | None = (
+            (await session.execute(query)).scalar_one_or_none()
+        )
+        return assignee
+
+    @classmethod
+    async def hard_delete(
+        cls, key: str, *, session: AsyncSession,
+    ) -> None:
+        # TODO(perf): group these into a single operation?
+        assignee = await cls._get_assignee(key, session=session)
+        await Component.delete(key, session=session)
+        await Label.delete(key, session=session)
+        await IssueTransition.delete(key, session=session)
+        await IssueHistory.delete(key, session=session)
+        await IssueSearch.delete(key, session=session)
+        query = delete(cls).where(cls.key == key)
+        await session.execute(query)
+        await Generation.bump(assignee, session=session)
+        await Change.record(key, schemas.ChangeOp.delete, session=session)
+
+    @classmethod
+    async def upsert(
+        cls, issue: schemas.IssueCreate, *,
+        session: AsyncSession,
+    ) -> None:
+        # TODO: fix upserts, then avoid the deletion here
+        previous = await cls._get_assignee(issue.key, session=session)
+        await IssueSearch.delete(issue.key, session=session)
+        deletion = delete(cls).where(cls.key == issue.key)
+        await session.execute(deletion)
+
+        # N.B. set "include" explicitly to support subclasses of IssueCreate
+        stmt = insert(cls).values(
+            **issue.model_dump(
+                include=set(schemas.IssueCreate.model_fields.keys()),
+            ),
+            priority_rank=issue.priority.rank,
+        )
+        query = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={
+                'assignee': stmt.excluded.assignee,
+                'created': stmt.excluded.created,
+                'description': stmt.excluded.description,
+                'priority': stmt.excluded.priority,
+                'priority_rank': stmt.excluded.priority_rank,
+                'status': stmt.excluded.status,
+                'status_category': stmt.excluded.status_category,
+                'status_rank': stmt.excluded.status_rank,
+                'summary': stmt.excluded.summary,
+                'startdate': stmt.excluded.startdate,
+                'timeestimate': stmt.excluded.timeestimate,
+                'updated': stmt.excluded.updated,
+                'votes': stmt.excluded.votes,
+            },
+        )
+        await session.execute(query)
+        await IssueSearch.insert(issue, session=session)
+        # both lanes change when an issue is reassigned
+        await Generation.bump(previous, issue.assignee, session=session)
+        await Change.record(
+            issue.key, schemas.ChangeOp.upsert, session=session,
+        )
@@ -0,0 +1,94 @@
+"""Filtering and ordering of issue listings, as chosen by the reader."""
+from typing import Any
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import and_
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import exists
+from sqlalchemy.sql import false
+from sqlalchemy.sql import func
+from sqlalchemy.sql import or_
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.component import Component
+from mosura.models.component import Label
+
+if TYPE_CHECKING:
+    from mosura.models.issue import Issue
+
+
+def sort_column(
+        issue: type['Issue'],
+        sort: schemas.IssueSort,
+) -> ColumnElement[Any] | InstrumentedAttribute[Any]:
+    columns: dict[
+        schemas.IssueSort, ColumnElement[Any] | InstrumentedAttribute[Any],
+    ] = {
+        # N.B. no NULLs, which would never compare past a cursor
+        schemas.IssueSort.assignee: func.coalesce(issue.assignee, ''),
+        schemas.IssueSort.key: issue.key,
+        schemas.IssueSort.priority: issue.priority_rank,
+        schemas.IssueSort.status: issue.status_rank,
+        schemas.IssueSort.summary: issue.summary,
+        schemas.IssueSort.votes: issue.votes,
+    }
+    return columns[sort]
+
+
+def matches(
+        issue: type['Issue'],
+        filters: schemas.IssueFilter,
+) -> list[ColumnElement[bool]]:
+    conditions = []
+    if filters.assignees is not None:
+        conditions.append(
+            or_(
+                issue.assignee.in_(sorted(filters.assignees - {'None'})),
+                issue.assignee.is_(None) if 'None' in filters.assignees
+                else false(),
+            ),
+        )
+    if filters.keys is not None:
+        conditions.append(issue.key.in_(sorted(filters.keys)))
+    if filters.priorities is not None:
+        conditions.append(issue.priority.in_(sorted(filters.priorities)))
+    if filters.statuses is not None:
+        conditions.append(issue.status.in_(sorted(filters.statuses)))
+    for table, column, values in (
+            (Component, Component.component, filters.components),
+            (Label, Label.label, filters.labels),
+    ):
+        if values is not None:
+            conditions.append(
+                exists()
+                .where(table.key == issue.key, column.in_(sorted(values)))
+                .correlate_except(table),
+            )
+    return conditions
+
+
+def after(
+        issue: type['Issue'],
+        cursor: schemas.IssueCursor,
+        order: schemas.IssueOrder,
+) -> ColumnElement[bool]:
+    if order.sort is schemas.IssueSort.key:
+        if order.descending:
+            return issue.key < cursor.key
+        return issue.key > cursor.key
+
+    column = sort_column(issue, order.sort)
+    value: Any = cursor.priority_rank
+    if order.sort is not schemas.IssueSort.priority:
+        # The cursor only carries the priority, so look up the sorted value of
+        # the issue it points at.
+        value = (
+            select(column).where(issue.key == cursor.key)
+            .correlate(None).scalar_subquery()
+        )
+    return or_(
+        column < value if order.descending else column > value,
+        and_(column == value, issue.key > cursor.key),
+    )
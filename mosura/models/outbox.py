@@ -0,0 +1,115 @@
+import datetime
+from typing import Any
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine.row import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql import exists
+from sqlalchemy.sql import select
+from sqlalchemy.sql import update
+
+from mosura import schemas
+from mosura.models.base import Base
+
+
+class Outbox(Base):
+    # Edits waiting to be written to Jira. Unlike the rest of the database,
+    # these can't be re-fetched, so they survive cache rebuilds.
+    __tablename__ = 'outbox'
+
+    key: Mapped[str] = mapped_column(index=True)
+    patch: Mapped[dict[str, Any]] = mapped_column(JSON)
+    original: Mapped[dict[str, Any]] = mapped_column(JSON)
+    created: Mapped[datetime.datetime]
+    next_attempt: Mapped[datetime.datetime]
+    # N.B. the column keeps its name, since this table outlives rebuilds
+    entry_id: Mapped[int] = mapped_column(
+        'id', primary_key=True, init=False,
+    )
+    status: Mapped[str] = mapped_column(default=schemas.OutboxStatus.pending)
+    attempts: Mapped[int] = mapped_column(default=0)
+    error: Mapped[str | None] = mapped_column(default=None)
+
+    @classmethod
+    async def add(
+        cls, issue: schemas.Issue, patch: schemas.IssuePatch, *,
+        session: AsyncSession,
+    ) -> schemas.OutboxEntry:
+        fields = patch.model_fields_set
+        now = datetime.datetime.now(datetime.UTC)
+        query = insert(cls).values(
+            key=issue.key,
+            patch=patch.model_dump(include=fields),
+            original=schemas.IssuePatch.model_validate(
+                issue.model_dump(include=fields),
+            ).model_dump(include=fields),
+            created=now,
+            next_attempt=now,
+        ).returning(*cls.__table__.c)
+        return cls._convert((await session.execute(query)).one())
+
+    @classmethod
+    async def get(
+        cls, entry_id: int, *, session: AsyncSession,
+    ) -> schemas.OutboxEntry | None:
+        query = select(cls.__table__).where(cls.entry_id == entry_id)
+        row = (await session.execute(query)).one_or_none()
+        return cls._convert(row) if row else None
+
+    @classmethod
+    async def due(
+        cls, *, now: datetime.datetime, session: AsyncSession,
+    ) -> list[schemas.OutboxEntry]:
+        # Edits to one issue are applied in the order they were made, so an
+        # edit waits behind any earlier one which is still being retried.
+        earlier = aliased(cls)
+        query = (
+            select(cls.__table__)
+            .where(cls.status == schemas.OutboxStatus.pending)
+            .where(cls.next_attempt <= now.replace(tzinfo=None))
+            .where(
+                ~exists()
+                .where(
+                    earlier.key == cls.key,
+                    earlier.entry_id < cls.entry_id,
+                    earlier.status == schemas.OutboxStatus.pending,
+                )
+                .correlate(cls),
+            )
+            .order_by(cls.entry_id)
+        )
+        rows = (await session.execute(query)).all()
+        return [cls._convert(row) for row in rows]
+
+    @classmethod
+    async def resolve(
+        cls, entry_id: int, status: schemas.OutboxStatus, *,
+        attempts: int, error: str | None = None,
+        next_attempt: datetime.datetime | None = None,
+        session: AsyncSession,
+    ) -> None:
+        values: dict[str, Any] = {
+            'status': status, 'attempts': attempts, 'error': error,
+        }
+        if next_attempt is not None:
+            values['next_attempt'] = next_attempt
+        await session.execute(
+            update(cls).where(cls.entry_id == entry_id).values(**values),
+        )
+
+    @staticmethod
+    def _convert(row: Row[Any]) -> schemas.OutboxEntry:
+        return schemas.OutboxEntry(
+            entry_id=row.id,
+            key=row.key,
+            patch=schemas.IssuePatch.model_validate(row.patch),
+            original=schemas.IssuePatch.model_validate(row.original),
+            status=schemas.OutboxStatus(row.status),
+            attempts=row.attempts,
+            error=row.error,
+            created=row.created.replace(tzinfo=datetime.UTC),
+        )
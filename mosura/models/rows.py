@@ -0,0 +1,81 @@
+import datetime
+import itertools
+import operator
+from collections.abc import Sequence
+
+from sqlalchemy.engine.row import Row
+
+from mosura import schemas
+
+
+IssueRow = Row[
+    tuple[
+        str, str, str | None, str, str | None, str,
+        datetime.datetime | None, datetime.datetime, datetime.datetime,
+        datetime.timedelta, int, str, int, str | None, str | None,
+    ]
+]
+
+
+# TODO: nuke the convert_* methods, see dataclass?
+def convert_field_response(
+    key: str, results: Sequence[IssueRow], *,
+    idx: int, name: str,
+) -> list[dict[str, str]]:
+    deduped = {x for x in {x[idx] for x in results} if x}
+    ordered = sorted(deduped)
+    return [{'key': key, name: x} for x in ordered]
+
+
+def convert_component_response(
+        key: str,
+        results: Sequence[IssueRow],
+) -> list[dict[str, str]]:
+    return convert_field_response(key, results, idx=13, name='component')
+
+
+def convert_label_response(
+        key: str,
+        results: Sequence[IssueRow],
+) -> list[dict[str, str]]:
+    return convert_field_response(key, results, idx=14, name='label')
+
+
+def convert_issue(fields: Sequence[IssueRow]) -> schemas.Issue:
+    # N.B. all rows belong to the same issue, one per component/label pair
+    key = fields[0][0]
+    # TODO: store tzinfo in db
+    startdate = (
+        fields[0][6].replace(tzinfo=datetime.UTC)
+        if fields[0][6] else None
+    )
+    created = fields[0][7].replace(tzinfo=datetime.UTC)
+    updated = fields[0][8].replace(tzinfo=datetime.UTC)
+    return schemas.Issue.model_validate({
+        'key': key,
+        'summary': fields[0][1],
+        'description': fields[0][2],
+        'status': fields[0][3],
+        'assignee': fields[0][4],
+        'priority': fields[0][5],
+        'startdate': startdate,
+        'created': created,
+        'updated': updated,
+        'timeestimate': fields[0][9],
+        'votes': fields[0][10],
+        'status_category': fields[0][11],
+        'status_rank': fields[0][12],
+        'components': convert_component_response(key, fields),
+        'labels': convert_label_response(key, fields),
+    })
+
+
+def convert_issue_response(
+        results: Sequence[IssueRow],
+) -> list[schemas.Issue]:
+    return [
+        convert_issue(list(group))
+        for _, group in itertools.groupby(
+            results, operator.attrgetter('key'),
+        )
+    ]
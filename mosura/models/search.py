@@ -0,0 +1,125 @@
+import html
+import re
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import column
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import func
+from sqlalchemy.sql import insert
+from sqlalchemy.sql import literal
+from sqlalchemy.sql import literal_column
+from sqlalchemy.sql import select
+from sqlalchemy.sql import table
+from sqlalchemy.sql.expression import ColumnClause
+
+from mosura import schemas
+from mosura.models.base import Base
+
+
+# FTS5 virtual tables can't be declared through the ORM, so the index is
+# created next to the mapped tables and addressed through a lightweight table
+# clause. Each row shares its rowid with the matching ``issues`` row, which
+# keeps index maintenance and result joins on an integer key instead of
+# scanning the index for an issue key.
+_index = table(
+    'issues_fts',
+    column('rowid'),
+    column('summary'),
+    column('description'),
+)
+_issues = table('issues', column('rowid'), column('key'))
+# FTS5 exposes a hidden column named after the table itself, which is what
+# MATCH, bm25() and snippet() operate on.
+_hidden: ColumnClause[Any] = literal_column('issues_fts')
+
+_HIGHLIGHT_START = '\x02'
+_HIGHLIGHT_END = '\x03'
+_TOKEN = re.compile(r'\w+')
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _create_index(_target: object, conn: Connection, **_kw: Any) -> None:
+    conn.exec_driver_sql(
+        'CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts '
+        "USING fts5(summary, description, tokenize='unicode61')",
+    )
+
+
+@event.listens_for(Base.metadata, 'before_drop')
+def _drop_index(_target: object, conn: Connection, **_kw: Any) -> None:
+    conn.exec_driver_sql('DROP TABLE IF EXISTS issues_fts')
+
+
+class IssueSearch:
+    index = _index
+
+    # bm25() weights, in column order: a hit in the summary is worth far more
+    # than the same hit somewhere in a long description.
+    WEIGHTS = (10.0, 1.0)
+
+    @staticmethod
+    def match_expression(query: str) -> str | None:
+        # Quote every token so user input can never be parsed as FTS5 query
+        # syntax, and prefix-match the last one to support typing-as-you-go.
+        tokens = _TOKEN.findall(query)
+        if not tokens:
+            return None
+
+        quoted = [f'"{token}"' for token in tokens]
+        quoted[-1] += '*'
+        return ' '.join(quoted)
+
+    @staticmethod
+    def matches(expression: str) -> ColumnElement[bool]:
+        return _hidden.bool_op('MATCH')(expression)
+
+    @classmethod
+    def rank(cls) -> ColumnElement[float]:
+        return func.bm25(_hidden, *cls.WEIGHTS)
+
+    @staticmethod
+    def snippet() -> ColumnElement[str]:
+        # -1 lets FTS5 pick whichever column best matches the query
+        return func.snippet(
+            _hidden, -1, _HIGHLIGHT_START, _HIGHLIGHT_END, '…', 16,
+        )
+
+    @staticmethod
+    def highlight(snippet: str) -> str:
+        # Escape first, then swap the sentinels for markup, so that the only
+        # tags in the result are the ones we added.
+        return (
+            html.escape(snippet)
+            .replace(_HIGHLIGHT_START, '<mark>')
+            .replace(_HIGHLIGHT_END, '</mark>')
+        )
+
+    @classmethod
+    async def delete(cls, key: str, *, session: AsyncSession) -> None:
+        rowid = select(_issues.c.rowid).where(_issues.c.key == key)
+        query = delete(_index).where(
+            _index.c.rowid == rowid.scalar_subquery(),
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def insert(
+        cls, issue: schemas.IssueCreate, *,
+        session: AsyncSession,
+    ) -> None:
+        # N.B. must run after the issue row itself has been written, since
+        # that is where the rowid comes from
+        source = select(
+            _issues.c.rowid,
+            literal(issue.summary),
+            literal(issue.description_text),
+        ).where(_issues.c.key == issue.key)
+        query = insert(_index).from_select(
+            ['rowid', 'summary', 'description'],
+            source,
+        )
+        await session.execute(query)
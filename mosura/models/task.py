@@ -0,0 +1,144 @@
+import datetime
+import time
+from collections.abc import Sequence
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.base import Base
+from mosura.models.base import strpk
+from mosura.models.base import strpkindex
+
+
+class Setting(Base):
+    __tablename__ = 'settings'
+
+    key: Mapped[strpk]
+    value: Mapped[str]
+
+    @classmethod
+    async def get(
+        cls, key: str, *, session: AsyncSession,
+    ) -> str | None:
+        query = select(cls.value).where(cls.key == key)
+        result = (await session.execute(query)).scalar_one_or_none()
+        return result
+
+    @classmethod
+    async def upsert(
+        cls, key: str, value: str, *, session: AsyncSession,
+    ) -> None:
+        stmt = insert(cls).values(key=key, value=value)
+        query = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={'value': stmt.excluded.value},
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def delete(
+        cls, key: str, *, session: AsyncSession,
+    ) -> None:
+        query = delete(cls).where(cls.key == key)
+        await session.execute(query)
+
+
+class Generation(Base):
+    # A counter bumped by every write to the issue graph, in the same
+    # transaction as the write. Anything derived from cached issues can be
+    # reused for as long as the generation it was built from is current.
+    #
+    # Each assignee also gets a counter of their own, bumped by writes to
+    # their issues, for results which only cover that one person.
+    __tablename__ = 'generations'
+
+    key: Mapped[strpk]
+    value: Mapped[int]
+
+    @staticmethod
+    def assignee_key(assignee: str) -> str:
+        return f'assignee:{assignee}'
+
+    @classmethod
+    async def get(cls, *, session: AsyncSession) -> int:
+        query = select(cls.value).where(cls.key == 'issues')
+        result = (await session.execute(query)).scalar_one_or_none()
+        return int(result or 0)
+
+    @classmethod
+    async def get_assignees(
+        cls, assignees: Sequence[str], *, session: AsyncSession,
+    ) -> dict[str, int]:
+        keys = {cls.assignee_key(x): x for x in assignees}
+        query = select(cls.key, cls.value).where(cls.key.in_(keys))
+        values = dict((await session.execute(query)).tuples().all())
+        return {x: int(values.get(key, 0)) for key, x in keys.items()}
+
+    @classmethod
+    async def get_lanes(cls, *, session: AsyncSession) -> dict[str, int]:
+        # every assignee's counter, to tell whose lanes a write changed
+        prefix = cls.assignee_key('')
+        query = select(cls.key, cls.value).where(cls.key.startswith(prefix))
+        rows = (await session.execute(query)).tuples().all()
+        return {key.removeprefix(prefix): int(value) for key, value in rows}
+
+    @classmethod
+    async def bump(
+        cls, *assignees: str | None, session: AsyncSession,
+    ) -> None:
+        # Seeded from the clock, so that a rebuilt cache never hands out a
+        # generation which was already used for different data.
+        seed = time.time_ns() // 1000
+        lanes = {cls.assignee_key(x) for x in assignees if x}
+        keys = ['issues', *sorted(lanes)]
+        stmt = insert(cls).values([{'key': k, 'value': seed} for k in keys])
+        query = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={'value': cls.value + 1},
+        )
+        await session.execute(query)
+
+
+class Task(Base):
+    __tablename__ = 'tasks'
+
+    key: Mapped[strpkindex]
+    variant: Mapped[strpkindex]
+    latest: Mapped[datetime.datetime | None]
+
+    @classmethod
+    async def upsert(
+        cls, task: schemas.Task, *,
+        session: AsyncSession,
+    ) -> None:
+        stmt = insert(cls).values(**task.model_dump())
+        query = stmt.on_conflict_do_update(
+            index_elements=['key', 'variant'],
+            set_={'latest': stmt.excluded.latest},
+        )
+        await session.execute(query)
+
+    @classmethod
+    async def get(
+        cls, key: str, variant: str, *,
+        session: AsyncSession,
+    ) -> schemas.Task | None:
+        query = (
+            select(cls.__table__)
+            .where(cls.key == key)
+            .where(cls.variant == variant)
+        )
+        result = (await session.execute(query)).one_or_none()
+        if not result:
+            return None
+
+        # TODO: any way to store tz in sqlite?
+        return schemas.Task.model_validate({
+            'key': result.key,
+            'variant': result.variant,
+            'latest': result.latest.replace(tzinfo=datetime.UTC),
+        })
@@ -0,0 +1,137 @@
+import datetime
+from collections.abc import Sequence
+
+from sqlalchemy import Index
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import or_
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.base import Base
+from mosura.models.base import strfk
+from mosura.models.transition import IssueTransition
+
+
+class HistorySegment(Base):
+    __tablename__ = 'timeline_segments'
+    __table_args__ = (
+        Index('ix_timeline_segments_key_end', 'key', 'end'),
+    )
+
+    key: Mapped[strfk]
+    seq: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[str]
+    # see schemas.HistorySegment
+    category: Mapped[str]
+    start: Mapped[datetime.date]
+    # NULL while the segment is ongoing
+    end: Mapped[datetime.date | None]
+    estimated_end: Mapped[datetime.date | None]
+
+
+class IssueHistory(Base):
+    # The per-issue half of schemas.IssueHistory; its segments are stored in
+    # HistorySegment. Both are derived from an issue and its transitions at
+    # sync time, so that rendering a timeline never has to replay them.
+    __tablename__ = 'issue_histories'
+
+    key: Mapped[strfk]
+    estimated_completion: Mapped[datetime.date | None]
+    started: Mapped[bool]
+
+    @classmethod
+    async def delete(cls, key: str, *, session: AsyncSession) -> None:
+        await session.execute(delete(cls).where(cls.key == key))
+        query = delete(HistorySegment).where(HistorySegment.key == key)
+        await session.execute(query)
+
+    @classmethod
+    async def rebuild(
+        cls, issue: schemas.IssueCreate, *,
+        session: AsyncSession,
+    ) -> None:
+        # N.B. must run after the issue's transitions have been written
+        transitions = await IssueTransition.get_by_keys(
+            [issue.key],
+            session=session,
+        )
+        history = schemas.IssueHistory.from_transitions(issue, transitions)
+
+        await cls.delete(issue.key, session=session)
+        await session.execute(
+            insert(cls).values(
+                key=history.key,
+                estimated_completion=history.estimated_completion,
+                started=history.started,
+            ),
+        )
+        await session.execute(
+            insert(HistorySegment),
+            [
+                {
+                    'key': history.key,
+                    'seq': seq,
+                    'status': segment.status,
+                    'category': segment.category,
+                    'start': segment.start,
+                    'end': segment.end,
+                    'estimated_end': segment.estimated_end,
+                }
+                for seq, segment in enumerate(history.segments)
+            ],
+        )
+
+    @classmethod
+    async def get_many(
+        cls, keys: Sequence[str], *,
+        window: tuple[datetime.date, datetime.date],
+        session: AsyncSession,
+    ) -> dict[str, schemas.IssueHistory]:
+        """
+        Fetch the histories of the given issues.
+
+        Only segments which overlap the [start, end) window are included.
+        """
+        if not keys:
+            return {}
+
+        query = select(cls).where(cls.key.in_(keys))
+        histories = {
+            row.key: schemas.IssueHistory(
+                key=row.key,
+                estimated_completion=row.estimated_completion,
+                started=row.started,
+                segments=[],
+            )
+            for row in (await session.execute(query)).scalars()
+        }
+
+        start, end = window
+        segments = (
+            select(HistorySegment)
+            .where(HistorySegment.key.in_(keys))
+            .where(HistorySegment.start < end)
+            .where(
+                or_(
+                    HistorySegment.end.is_(None),
+                    HistorySegment.end >= start,
+                ),
+            )
+            .order_by(HistorySegment.key, HistorySegment.seq)
+        )
+        for segment in (await session.execute(segments)).scalars():
+            histories[segment.key].segments.append(
+                schemas.HistorySegment(
+                    start=segment.start,
+                    end=segment.end,
+                    status=segment.status,
+                    estimated_end=segment.estimated_end,
+                    category=segment.category,
+                ),
+            )
+
+        return histories
@@ -0,0 +1,60 @@
+import datetime
+from typing import Annotated
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql import delete
+from sqlalchemy.sql import select
+
+from mosura import schemas
+from mosura.models.base import Base
+from mosura.models.base import strfk
+
+
+class IssueTransition(Base):
+    __tablename__ = 'issue_transitions'
+
+    key: Mapped[strfk]
+    from_status: Mapped[str | None]
+    to_status: Mapped[str]
+    # see schemas.IssueTransition.derive_categories()
+    from_category: Mapped[str | None]
+    to_category: Mapped[str]
+    timestamp: Mapped[
+        Annotated[
+            datetime.datetime,
+            mapped_column(primary_key=True),
+        ]
+    ]
+
+    @classmethod
+    async def delete(cls, key: str, *, session: AsyncSession) -> None:
+        query = delete(cls).where(cls.key == key)
+        await session.execute(query)
+
+    @classmethod
+    async def upsert(
+        cls, transition: schemas.IssueTransition, *,
+        session: AsyncSession,
+    ) -> None:
+        stmt = insert(cls).values(**transition.model_dump())
+        await session.execute(stmt.on_conflict_do_nothing())
+
+    @classmethod
+    async def get_by_keys(
+        cls, keys: list[str], *, session: AsyncSession,
+    ) -> list[schemas.IssueTransition]:
+        query = select(cls).where(
+            cls.key.in_(keys),
+        ).order_by(
+            cls.key,
+            cls.timestamp,
+        )
+        results = await session.execute(query)
+        rows = results.scalars().all()
+        return [
+            schemas.IssueTransition.model_validate(row)
+            for row in rows
+        ]
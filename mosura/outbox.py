@@ -0,0 +1,120 @@
+"""
+Write-behind for issue edits.
+
+An edit made with ``Prefer: respond-async`` is applied to the cache and
+queued in the outbox in one transaction, and acknowledged straight away. A
+background worker then pushes each queued edit to Jira, retrying on failure,
+and records how it went for the page to pick up.
+"""
+import asyncio
+import contextlib
+import datetime
+import logging
+
+import fastapi
+
+from . import database
+from . import models
+from . import schemas
+from . import tasks
+
+
+# seconds between checks for retries which have come due
+POLL_INTERVAL = 30.0
+MAX_ATTEMPTS = 5
+# the wait before the first retry, doubled for each one after that
+RETRY_BACKOFF = datetime.timedelta(seconds=30)
+
+logger = logging.getLogger(__name__)
+
+
+def wake(app: fastapi.FastAPI) -> None:
+    """Have the worker look for new edits now, rather than at its next poll."""
+    wakeup: asyncio.Event = app.state.outbox
+    wakeup.set()
+
+
+async def _apply(
+        app: fastapi.FastAPI,
+        entry: schemas.OutboxEntry,
+) -> schemas.OutboxStatus:
+    live_issue = await asyncio.to_thread(
+        app.state.jira_client.issue,
+        id=entry.key,
+        fields=entry.patch.jira_fields(),
+    )
+    current = schemas.IssuePatch.from_jira(
+        live_issue.raw, entry.patch.model_fields_set,
+    )
+    if current == entry.patch:
+        # eg. pushed already, but the worker stopped before recording it
+        return schemas.OutboxStatus.applied
+    if current != entry.original:
+        logger.warning(
+            'outbox(%d): %s changed in Jira since it was edited',
+            entry.entry_id, entry.key,
+        )
+        return schemas.OutboxStatus.conflict
+
+    await asyncio.to_thread(live_issue.update, fields=entry.patch.to_jira())
+    return schemas.OutboxStatus.applied
+
+
+async def _push_one(
+        app: fastapi.FastAPI,
+        entry: schemas.OutboxEntry,
+) -> None:
+    attempts = entry.attempts + 1
+    error = None
+    next_attempt = None
+    try:
+        status = await _apply(app, entry)
+    except Exception as exc:
+        error = str(exc) or type(exc).__name__
+        status = schemas.OutboxStatus.failed
+        if attempts < MAX_ATTEMPTS:
+            status = schemas.OutboxStatus.pending
+            next_attempt = (
+                datetime.datetime.now(datetime.UTC)
+                + RETRY_BACKOFF * 2 ** (attempts - 1)
+            )
+        logger.warning(
+            'outbox(%d): attempt %d/%d failed for %s',
+            entry.entry_id, attempts, MAX_ATTEMPTS, entry.key, exc_info=True,
+        )
+
+    async with database.session_from_app(app) as session:
+        await models.Outbox.resolve(
+            entry.entry_id, status, attempts=attempts, error=error,
+            next_attempt=next_attempt, session=session,
+        )
+        await session.commit()
+
+    if status is not schemas.OutboxStatus.pending:
+        # Either way, Jira now has the last word: this picks up the new
+        # timestamp of an applied edit, or reverts one which wasn't.
+        await tasks.refresh_issue_by_key(app=app, key=entry.key)
+
+
+async def push_due(app: fastapi.FastAPI) -> None:
+    # Resolving one edit can let the next one for the same issue through.
+    while True:
+        async with database.session_from_app(app) as session:
+            entries = await models.Outbox.due(
+                now=datetime.datetime.now(datetime.UTC), session=session,
+            )
+        if not entries:
+            return
+
+        for entry in entries:
+            await _push_one(app, entry)
+
+
+async def push(app: fastapi.FastAPI) -> None:
+    logger.info('outbox: initialized with interval %ds', POLL_INTERVAL)
+    wakeup: asyncio.Event = app.state.outbox
+    while True:
+        wakeup.clear()
+        await push_due(app)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(wakeup.wait(), POLL_INTERVAL)
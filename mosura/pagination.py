@@ -0,0 +1,81 @@
+from typing import Annotated
+
+import fastapi
+
+from . import schemas
+
+
+# Rows rendered per page by the issue list views; the API leaves the page
+# size up to the caller.
+PAGE_SIZE = 100
+
+
+def parse_cursor(after: str | None = None) -> schemas.IssueCursor | None:
+    if after is None:
+        return None
+
+    try:
+        return schemas.IssueCursor.parse(after)
+    except ValueError as exc:
+        raise fastapi.HTTPException(
+            status_code=422,
+            detail=f'invalid cursor: {after}',
+        ) from exc
+
+
+def parse_order(sort: str | None = None) -> schemas.IssueOrder:
+    try:
+        return schemas.IssueOrder.parse(sort)
+    except ValueError as exc:
+        raise fastapi.HTTPException(
+            status_code=422,
+            detail=f'invalid sort: {sort}',
+        ) from exc
+
+
+def parse_filter(
+        assignee: str | None = None,
+        component: str | None = None,
+        key: str | None = None,
+        label: str | None = None,
+        priority: str | None = None,
+        status: str | None = None,
+) -> schemas.IssueFilter:
+    """
+    Filter an issue list by comma-separated query parameters.
+
+    For use as a dependency. Omitting a parameter leaves that field
+    unfiltered.
+    """
+    return schemas.IssueFilter.parse(
+        assignees=assignee, components=component, keys=key, labels=label,
+        priorities=priority, statuses=status,
+    )
+
+
+# the query parameters of a listing, parsed by the functions above
+Cursor = Annotated[schemas.IssueCursor | None, fastapi.Depends(parse_cursor)]
+Filters = Annotated[schemas.IssueFilter, fastapi.Depends(parse_filter)]
+Order = Annotated[schemas.IssueOrder, fastapi.Depends(parse_order)]
+
+
+def next_url(
+        request: fastapi.Request,
+        cursor: schemas.IssueCursor | None,
+) -> str | None:
+    if cursor is None:
+        return None
+    return str(request.url.include_query_params(after=str(cursor)))
+
+
+def set_headers(
+        request: fastapi.Request,
+        response: fastapi.Response,
+        *,
+        total: int,
+        cursor: schemas.IssueCursor | None,
+) -> None:
+    response.headers['X-Total-Count'] = str(total)
+    url = next_url(request, cursor)
+    if url is not None:
+        response.headers['Link'] = f'<{url}>; rel="next"'
@@ -1,31 +1,63 @@
+from mosura.schemas.change import ChangeOp
+from mosura.schemas.change import ChangeSet
+from mosura.schemas.history import HistorySegment
+from mosura.schemas.history import IssueHistory
 from mosura.schemas.issue import Component
 from mosura.schemas.issue import Issue
 from mosura.schemas.issue import IssueCreate
+from mosura.schemas.issue import IssueCursor
+from mosura.schemas.issue import IssueEdit
+from mosura.schemas.issue import IssueEditResult
 from mosura.schemas.issue import IssuePatch
 from mosura.schemas.issue import IssueTransition
 from mosura.schemas.issue import Label
 from mosura.schemas.issue import Meta
 from mosura.schemas.issue import Priority
+from mosura.schemas.issue import SearchResult
 from mosura.schemas.issue import Status
+from mosura.schemas.listing import IssueFilter
+from mosura.schemas.listing import IssueOrder
+from mosura.schemas.listing import IssueSort
+from mosura.schemas.outbox import OutboxEntry
+from mosura.schemas.outbox import OutboxStatus
 from mosura.schemas.task import SettingValue
 from mosura.schemas.task import Task
 from mosura.schemas.timeline import Timeline
 from mosura.schemas.timeline import TimelineIssue
 from mosura.schemas.timeline import TimelineSegment
+from mosura.schemas.timeline_range import TimelineAttention
+from mosura.schemas.timeline_range import TimelineRange
+from mosura.schemas.timeline_range import TimelineRangeIssue
 
 __all__ = [
+    'ChangeOp',
+    'ChangeSet',
     'Component',
+    'HistorySegment',
     'Issue',
     'IssueCreate',
+    'IssueCursor',
+    'IssueEdit',
+    'IssueEditResult',
+    'IssueFilter',
+    'IssueHistory',
+    'IssueOrder',
     'IssuePatch',
+    'IssueSort',
     'IssueTransition',
     'Label',
     'Meta',
+    'OutboxEntry',
+    'OutboxStatus',
     'Priority',
+    'SearchResult',
     'Status',
     'SettingValue',
     'Task',
     'Timeline',
+    'TimelineAttention',
     'TimelineIssue',
+    'TimelineRange',
+    'TimelineRangeIssue',
     'TimelineSegment',
 ]
@@ -0,0 +1,21 @@
+import enum
+
+import pydantic
+
+
+class ChangeOp(enum.StrEnum):
+    upsert = 'upsert'
+    delete = 'delete'
+
+
+class ChangeSet(pydantic.BaseModel):
+    # What a write did to the cache, as of the generation it committed.
+    # Readers which missed some change sets get one with ``resync`` set, and
+    # should reload everything instead.
+    generation: int
+    changed: list[str] = []
+    removed: list[str] = []
+    # whose lanes changed, including the previous assignee of a reassigned
+    # issue
+    assignees: list[str] = []
+    resync: bool = False
@@ -0,0 +1,169 @@
+import dataclasses
+import datetime
+from collections.abc import Iterator
+from typing import Self
+
+from mosura.schemas.issue import IssueCreate
+from mosura.schemas.issue import IssueTransition
+from mosura.schemas.issue import Status
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HistorySegment:
+    """
+    A contiguous period with a single status, as stored ahead of rendering.
+
+    Fields:
+        start: Start date of the segment
+        end: End date of the segment, or None if it is still ongoing
+        status: Status during this segment
+        estimated_end: Earliest end of an ongoing segment, which otherwise
+            runs until the current date
+        category: Normalized status, derived from the status if not given
+    """
+
+    start: datetime.date
+    end: datetime.date | None
+    status: str
+    estimated_end: datetime.date | None = None
+    category: str = ''
+
+    def __post_init__(self) -> None:
+        if not self.category:
+            category = Status.normalize_status(self.status)
+            object.__setattr__(self, 'category', category)
+
+    def end_on(self, current_date: datetime.date) -> datetime.date:
+        if self.end is not None:
+            return self.end
+        return max(self.estimated_end or current_date, current_date)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class IssueHistory:
+    """
+    Everything the timeline derives from an issue's status transitions.
+
+    None of it depends on the current date, so it only needs to be rebuilt
+    when the issue or its transitions change.
+
+    Fields:
+        key: Issue key
+        estimated_completion: Estimated completion date
+        started: True once the issue has been worked on
+        segments: Status segments, in chronological order
+    """
+
+    key: str
+    estimated_completion: datetime.date | None
+    started: bool
+    segments: list[HistorySegment]
+
+    @classmethod
+    def from_transitions(
+            cls,
+            issue: IssueCreate,
+            trans: list[IssueTransition],
+    ) -> Self:
+        return cls(
+            key=issue.key,
+            estimated_completion=cls._compute_estimated_completion(
+                issue, trans,
+            ),
+            started=any(
+                category == 'in-progress'
+                for category in [t.to_category for t in trans]
+                + [issue.status_category]
+            ),
+            segments=list(cls._build_segments(issue, trans)),
+        )
+
+    @classmethod
+    def _build_segments(
+            cls,
+            issue: IssueCreate,
+            trans: list[IssueTransition],
+    ) -> Iterator[HistorySegment]:
+        """Build status segments for an issue from its transitions."""
+        created_date = issue.created.date()
+
+        if not trans:
+            # TODO: consider scheduling a fetch here
+            segment_end = cls._compute_estimated_completion(issue, trans)
+            if issue.status_category == 'closed':
+                segment_end = segment_end or issue.updated.date()
+
+            yield HistorySegment(
+                start=created_date,
+                end=segment_end,
+                status=issue.status,
+                category=issue.status_category,
+            )
+            return
+
+        first_trans = trans[0]
+        yield HistorySegment(
+            start=created_date,
+            end=first_trans.timestamp.date(),
+            status=first_trans.from_status or issue.status,
+            category=first_trans.from_category or issue.status_category,
+        )
+
+        for i, transition in enumerate(trans[:-1]):
+            yield HistorySegment(
+                start=transition.timestamp.date(),
+                end=trans[i + 1].timestamp.date(),
+                status=transition.to_status,
+                category=transition.to_category,
+            )
+
+        last_trans = trans[-1]
+        if last_trans.to_category == 'closed':
+            yield HistorySegment(
+                start=last_trans.timestamp.date(),
+                end=last_trans.timestamp.date(),
+                status=last_trans.to_status,
+                category=last_trans.to_category,
+            )
+            return
+
+        yield HistorySegment(
+            start=last_trans.timestamp.date(),
+            end=None,
+            status=last_trans.to_status,
+            estimated_end=cls._compute_estimated_completion(issue, trans),
+            category=last_trans.to_category,
+        )
+
+    @staticmethod
+    def _compute_estimated_completion(
+            issue: IssueCreate,
+            trans: list[IssueTransition],
+    ) -> datetime.date | None:
+        """Compute estimated completion date for an issue."""
+        if issue.status_category == 'closed':
+            # Closed issues: find close transition date
+            return next(
+                (
+                    t.timestamp.date() for t in trans
+                    if t.to_category == 'closed'
+                ),
+                None,
+            )
+
+        # Look for first in-progress transition
+        in_prog_trans = next(
+            (t for t in trans if t.to_category == 'in-progress'),
+            None,
+        )
+        if in_prog_trans and issue.timeestimate:
+            base_date = in_prog_trans.timestamp.date()
+            days = max(issue.timeestimate.days - 1, 0)
+            return base_date + datetime.timedelta(days=days)
+
+        # No in-progress, use startdate if available
+        if issue.startdate and issue.timeestimate:
+            days = max(issue.timeestimate.days - 1, 0)
+            return issue.startdate + datetime.timedelta(days=days)
+
+        return None
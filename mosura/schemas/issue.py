@@ -1,6 +1,9 @@
 import datetime
 import enum
+import functools
+import html.parser
 import logging
+from collections.abc import Iterable
 from typing import Any
 from typing import assert_never
 from typing import Self
@@ -38,21 +41,36 @@ class Priority(str, enum.Enum):
         assert_never(self)
 
     @property
-    def sort_value(self) -> str:
+    def rank(self) -> int:
         if self == Priority.unknown:
-            return 'pri0'
+            return 0
         if self == Priority.low:
-            return 'pri1'
+            return 1
         if self == Priority.medium:
-            return 'pri2'
+            return 2
         if self == Priority.high:
-            return 'pri3'
+            return 3
         if self == Priority.urgent:
-            return 'pri4'
+            return 4
         assert_never(self)
 
+    @property
+    def sort_value(self) -> str:
+        return f'pri{self.rank}'
+
 
 class Status:
+    CLOSED = frozenset({'Closed', 'Done', 'Root Caused'})
+    # workflow order, for sorting; anything unknown sorts last
+    RANKS = {
+        'Needs Triage': 0,
+        'Backlog': 1,
+        'In Progress': 2,
+        'Code Review': 3,
+        'Ready for Testing': 4,
+        'Closed': 5,
+    }
+
     @staticmethod
     def normalize_status(x: str) -> str:
         if x in {'To Do', 'Backlog'}:
@@ -61,10 +79,38 @@ class Status:
             return 'needs-triage'
         if x in {'Code Review', 'In Progress', 'Ready for Testing'}:
             return 'in-progress'
-        if x in {'Closed', 'Done', 'Root Caused'}:
+        if x in Status.CLOSED:
             return 'closed'
         return x.lower().replace(' ', '-')
 
+    @staticmethod
+    def rank(x: str) -> int:
+        return Status.RANKS.get(x, 9)
+
+
+class _TextExtractor(html.parser.HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: list[str] = []
+
+    def handle_starttag(
+            self,
+            tag: str,
+            attrs: list[tuple[str, str | None]],
+    ) -> None:
+        # keep words on either side of a tag (eg. <p>, <br>) from merging
+        self.chunks.append(' ')
+
+    def handle_data(self, data: str) -> None:
+        self.chunks.append(data)
+
+    @classmethod
+    def extract(cls, markup: str) -> str:
+        parser = cls()
+        parser.feed(markup)
+        parser.close()
+        return ' '.join(''.join(parser.chunks).split())
+
 
 class Component(pydantic.BaseModel):
     key: str
@@ -85,9 +131,20 @@ class IssueTransition(pydantic.BaseModel):
     from_status: str | None = None
     to_status: str
     timestamp: datetime.datetime
+    # derived from the statuses unless given, eg. when read back from the db
+    from_category: str | None = None
+    to_category: str = ''
 
     model_config = pydantic.ConfigDict(from_attributes=True)
 
+    @pydantic.model_validator(mode='after')
+    def derive_categories(self) -> Self:
+        if 'to_category' not in self.model_fields_set:
+            self.to_category = Status.normalize_status(self.to_status)
+        if 'from_category' not in self.model_fields_set and self.from_status:
+            self.from_category = Status.normalize_status(self.from_status)
+        return self
+
 
 class IssueCreate(pydantic.BaseModel):
     key: str
@@ -101,6 +158,19 @@ class IssueCreate(pydantic.BaseModel):
     updated: datetime.datetime
     timeestimate: datetime.timedelta
     votes: int
+    # Derived from the status unless given, eg. when read back from the db.
+    # This happens once as the issue comes in, so that nothing downstream has
+    # to keep string-matching statuses.
+    status_category: str = ''
+    status_rank: int = 0
+
+    @pydantic.model_validator(mode='after')
+    def derive_status(self) -> Self:
+        if 'status_category' not in self.model_fields_set:
+            self.status_category = Status.normalize_status(self.status)
+        if 'status_rank' not in self.model_fields_set:
+            self.status_rank = Status.rank(self.status)
+        return self
 
     @classmethod
     def jira_fields(cls) -> list[str]:
@@ -203,6 +273,11 @@ class IssueCreate(pydantic.BaseModel):
             votes=data['fields']['votes']['votes'],
         )
 
+    @property
+    def description_text(self) -> str:
+        # descriptions are stored as Jira's rendered HTML
+        return _TextExtractor.extract(self.description or '')
+
     @property
     def enddate(self) -> datetime.date | None:
         if self.startdate is None:
@@ -211,14 +286,7 @@ class IssueCreate(pydantic.BaseModel):
 
     @property
     def status_sort_value(self) -> str:
-        return {
-            'Needs Triage': 'stat0',
-            'Backlog': 'stat1',
-            'In Progress': 'stat2',
-            'Code Review': 'stat3',
-            'Ready for Testing': 'stat4',
-            'Closed': 'stat5',
-        }.get(self.status, 'stat9')
+        return f'stat{self.status_rank}'
 
 
 class Issue(IssueCreate):
@@ -257,6 +325,67 @@ class Issue(IssueCreate):
         # TODO: components_equal and labels_equal
         return True
 
+    def updated_matches(self, other: jira.Issue) -> bool:
+        # Whether Jira has seen no writes since this copy was synced, which
+        # only takes the "updated" field to tell.
+        updated = IssueCreate.parse_datetime(other.raw['fields']['updated'])
+        # N.B. the cache reads back naive datetimes, which are in UTC
+        return self.updated.replace(tzinfo=datetime.UTC) == updated
+
+    @classmethod
+    def parse_fields(cls, value: str) -> frozenset[str]:
+        fields = {name.strip() for name in value.split(',') if name.strip()}
+        unknown = fields - cls.model_fields.keys()
+        if unknown:
+            raise ValueError(f'unknown fields: {", ".join(sorted(unknown))}')
+        # the key identifies each issue, so it's always included
+        return frozenset(fields | {'key'})
+
+    @classmethod
+    def dump_fields(
+            cls,
+            fields: frozenset[str],
+            rows: Iterable[dict[str, Any]],
+    ) -> bytes:
+        # Serializes to the same JSON as a full Issue would, restricted to the
+        # given fields.
+        model = _projection(fields)
+        items = [model.model_validate(row).model_dump_json() for row in rows]
+        return f'[{",".join(items)}]'.encode()
+
+
+@functools.cache
+def _projection(fields: frozenset[str]) -> type[pydantic.BaseModel]:
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in Issue.model_fields.items()
+        if name in fields
+    }
+    return pydantic.create_model('IssueFields', **definitions)
+
+
+class IssueCursor(pydantic.BaseModel):
+    # Position of the last issue on a page, in the canonical listing order
+    # (highest priority first, then by key).
+    priority_rank: int
+    key: str
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    def __str__(self) -> str:
+        return f'{self.priority_rank}:{self.key}'
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        rank, sep, key = value.partition(':')
+        if not sep or not key:
+            raise ValueError(f'invalid cursor: {value!r}')
+        return cls(priority_rank=int(rank), key=key)
+
+    @classmethod
+    def from_issue(cls, issue: IssueCreate) -> Self:
+        return cls(priority_rank=issue.priority.rank, key=issue.key)
+
 
 class IssuePatch(pydantic.BaseModel):
     # TODO: reminder to update Issue.__eq__ before adding support for
@@ -266,6 +395,25 @@ class IssuePatch(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(use_enum_values=True)
 
+    def apply(self, issue: Issue) -> Issue:
+        # N.B. validate the result: model_copy() would keep the plain strings
+        # which use_enum_values dumps, eg. a priority without a rank
+        return Issue.model_validate(
+            issue.model_dump() | self.model_dump(exclude_unset=True),
+        )
+
+    def jira_fields(self) -> list[str]:
+        # enough to check for conflicting edits before applying this one
+        return ['updated', *sorted(self.model_fields_set)]
+
+    @classmethod
+    def from_jira(cls, data: dict[str, Any], fields: Iterable[str]) -> Self:
+        # the inverse of to_jira(), for just the given fields
+        values = {name: data['fields'][name] for name in fields}
+        if values.get('priority'):
+            values['priority'] = values['priority']['name']
+        return cls.model_validate(values)
+
     def to_jira(self) -> dict[str, str | dict[str, str]]:
         data = self.model_dump(exclude_unset=True)
         if data.get('priority'):
@@ -273,6 +421,28 @@ class IssuePatch(pydantic.BaseModel):
         return data
 
 
+class IssueEdit(pydantic.BaseModel):
+    key: str
+    patch: IssuePatch
+
+
+class IssueEditResult(pydantic.BaseModel):
+    # One per edit in a bulk request, with the status code that the edit
+    # would have got as a request of its own.
+    key: str
+    status: int
+    detail: str | None = None
+
+
+class SearchResult(pydantic.BaseModel):
+    key: str
+    summary: str
+    status: str
+    # HTML-escaped excerpt of the best matching field, with each matched term
+    # wrapped in <mark>
+    snippet: str
+
+
 @pydantic.dataclasses.dataclass
 class Meta:
     assignees: list[str]
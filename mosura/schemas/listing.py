@@ -0,0 +1,58 @@
+import enum
+from typing import Self
+
+import pydantic
+
+
+class IssueSort(enum.StrEnum):
+    assignee = 'assignee'
+    key = 'key'
+    priority = 'priority'
+    status = 'status'
+    summary = 'summary'
+    votes = 'votes'
+
+
+class IssueOrder(pydantic.BaseModel):
+    # The default is the canonical listing order: highest priority first.
+    sort: IssueSort = IssueSort.priority
+    descending: bool = True
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    def __str__(self) -> str:
+        return f'{"-" if self.descending else ""}{self.sort}'
+
+    @classmethod
+    def parse(cls, value: str | None) -> Self:
+        """Parse eg. ``votes`` or ``-votes``, for descending."""
+        if not value:
+            return cls()
+        return cls(
+            sort=IssueSort(value.removeprefix('-')),
+            descending=value.startswith('-'),
+        )
+
+
+class IssueFilter(pydantic.BaseModel):
+    # Each field limits a listing to issues with any of the given values, or
+    # leaves it unfiltered when None. "None" matches unassigned issues.
+    assignees: frozenset[str] | None = None
+    components: frozenset[str] | None = None
+    keys: frozenset[str] | None = None
+    labels: frozenset[str] | None = None
+    priorities: frozenset[str] | None = None
+    statuses: frozenset[str] | None = None
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    @classmethod
+    def parse(cls, **values: str | None) -> Self:
+        """Build from comma-separated query parameters."""
+        return cls(
+            **{
+                name: frozenset(x for x in value.split(',') if x)
+                for name, value in values.items()
+                if value is not None
+            },
+        )
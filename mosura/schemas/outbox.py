@@ -0,0 +1,30 @@
+import datetime
+import enum
+
+import pydantic
+
+from mosura.schemas.issue import IssuePatch
+
+
+class OutboxStatus(enum.StrEnum):
+    pending = 'pending'
+    applied = 'applied'
+    # someone else changed the same fields in Jira first
+    conflict = 'conflict'
+    # gave up after too many attempts
+    failed = 'failed'
+
+
+class OutboxEntry(pydantic.BaseModel):
+    # An edit which has been applied to the cache but not yet to Jira. The
+    # values it replaced are kept alongside, to detect conflicting edits.
+    entry_id: int
+    key: str
+    patch: IssuePatch
+    original: IssuePatch
+    status: OutboxStatus = OutboxStatus.pending
+    attempts: int = 0
+    error: str | None = None
+    created: datetime.datetime
+
+    model_config = pydantic.ConfigDict(from_attributes=True)
@@ -1,20 +1,27 @@
+import dataclasses
 import datetime
 import logging
-from collections.abc import Iterator
 from typing import Self
 
-import pydantic
-
+from mosura.schemas.history import IssueHistory
 from mosura.schemas.issue import Issue
-from mosura.schemas.issue import IssueCreate
 from mosura.schemas.issue import IssueTransition
 from mosura.schemas.issue import Status
 
 
 logger = logging.getLogger(__name__)
 
+# How many segments a single issue may be drawn with across the whole chart.
+# Zoomed out far enough that a slot spans several days, shorter stints are
+# folded into their neighbours rather than drawn as sub-pixel slivers.
+SEGMENT_SLOTS = 120
+
+
+# The timeline types are plain slotted dataclasses rather than pydantic
+# models: they are built in bulk from data which was validated on its way
+# into the database, and their rendering fields are filled in afterwards.
 
-@pydantic.dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimelineSegment:
     """
     A contiguous period with a single status.
@@ -23,29 +30,30 @@ class TimelineSegment:
         start: Start date of the segment
         end: End date of the segment
         status: Status during this segment
+        category: Normalized status, derived from the status if not given
     """
 
     start: datetime.date
     end: datetime.date
     status: str
+    category: str = ''
 
     # rendering
     left_percent: float = 0.
     width_percent: float | None = None
     show_transition_marker: bool = False
 
-    @pydantic.model_validator(mode='after')
-    def log_inverted_segments(self) -> 'TimelineSegment':
-        if self.start > self.end:
-            logger.error(
-                'timeline segment has inverted dates for %s: %s > %s',
-                self.status, self.start, self.end,
-            )
-        return self
+    def __post_init__(self) -> None:
+        if not self.category:
+            self.category = Status.normalize_status(self.status)
 
     @property
     def status_css_class(self) -> str:
-        return f'status-{Status.normalize_status(self.status)}'
+        return f'status-{self.category}'
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
 
     def calculate_rendering(
             self,
@@ -65,12 +73,12 @@ class TimelineSegment:
 
         self.show_transition_marker = bool(
             previous
-            and previous.status_css_class == self.status_css_class
+            and previous.category == self.category
             and self.left_percent > 0,
         )
 
 
-@pydantic.dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimelineIssue:
     """
     An issue rendered on the timeline with colored status segments.
@@ -104,6 +112,49 @@ class TimelineIssue:
     overdue_width_percent: float = 0.
     startdate_percent: float = 0.
 
+    def coalesce(self, resolution: int) -> None:
+        """
+        Merge segments which would not be told apart at this resolution.
+
+        The resolution is in days per slot.
+
+        A segment is folded into the next one when the next starts within the
+        same slot and runs at least as long, since it would only be drawn
+        underneath it. Neighbours with the same status are always merged, and
+        those with the same category are merged once either is shorter than a
+        slot; otherwise they are kept apart for their transition marker.
+        """
+        merged: list[TimelineSegment] = []
+        for segment in self.segments:
+            while (
+                    merged
+                    and (segment.start - merged[-1].start).days < resolution
+                    and segment.end >= merged[-1].end
+            ):
+                hidden = merged.pop()
+                segment = TimelineSegment(
+                    hidden.start, segment.end, segment.status,
+                    segment.category,
+                )
+
+            previous = merged[-1] if merged else None
+            if previous and (
+                    previous.status == segment.status
+                    or (
+                        previous.category == segment.category
+                        and min(previous.days, segment.days) < resolution
+                    )
+            ):
+                merged[-1] = TimelineSegment(
+                    previous.start, max(previous.end, segment.end),
+                    segment.status, segment.category,
+                )
+                continue
+
+            merged.append(segment)
+
+        self.segments = merged
+
     def calculate_rendering(
             self,
             total_days: int,
@@ -133,7 +184,7 @@ class TimelineIssue:
             self.startdate_percent = days_from_start / total_days * 100
 
 
-@pydantic.dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Timeline:
     issues: list[TimelineIssue]
     attention: list[Issue]
@@ -165,34 +216,92 @@ class Timeline:
             weeks_after: Number of weeks after the selected week
         """
         transitions = transitions or {}
+        histories = {
+            issue.key: IssueHistory.from_transitions(
+                issue, transitions.get(issue.key, []),
+            )
+            for issue in issues
+        }
+        return cls.from_histories(
+            issues,
+            histories,
+            selected_date=selected_date,
+            current_date=current_date,
+            weeks_before=weeks_before,
+            weeks_after=weeks_after,
+        )
+
+    @classmethod
+    def from_histories(
+            cls,
+            issues: list[Issue],
+            histories: dict[str, IssueHistory],
+            *,
+            selected_date: datetime.date,
+            current_date: datetime.date,
+            weeks_before: int = 3,
+            weeks_after: int = 5,
+    ) -> 'Timeline':
+        """
+        Build a timeline from issues and their precomputed histories.
+
+        Histories only need to include the segments which overlap the view;
+        issues without a history are treated as having no transitions.
+        """
         selected_monday, boxes = cls.get_boxes(
             selected_date=selected_date,
             current_date=current_date,
             weeks_before=weeks_before,
             weeks_after=weeks_after,
         )
-        view_start = boxes[0][0]
-        view_end = boxes[-1][0] + datetime.timedelta(days=7)
+        timeline_issues, attention_issues = cls._partition(
+            issues,
+            histories,
+            current_date,
+            view_start=boxes[0][0],
+            view_end=boxes[-1][0] + datetime.timedelta(days=7),
+        )
 
-        # Partition issues into timeline and attention
+        return cls(
+            sorted(timeline_issues, key=lambda x: x.created),
+            sorted(attention_issues, key=lambda x: x.summary),
+            selected_monday,
+            boxes,
+        )
+
+    @classmethod
+    def _partition(
+            cls,
+            issues: list[Issue],
+            histories: dict[str, IssueHistory],
+            current_date: datetime.date,
+            *,
+            view_start: datetime.date,
+            view_end: datetime.date,
+    ) -> tuple[list[TimelineIssue], list[Issue]]:
+        """Partition issues into timeline and attention."""
         timeline_issues: list[TimelineIssue] = []
         attention_issues: list[Issue] = []
 
         for issue in issues:
+            history = histories.get(issue.key)
+            if history is None:
+                history = IssueHistory.from_transitions(issue, [])
+
             # Determine if issue should be in attention list
             if cls._should_attend(
                 issue,
-                transitions.get(issue.key, []),
+                history,
                 current_date,
                 view_start=view_start,
             ):
                 attention_issues.append(issue)
                 continue
 
-            # Build timeline issue from transitions
+            # Build timeline issue from its history
             tli = cls._build_timeline_issue(
                 issue,
-                transitions.get(issue.key, []),
+                history,
                 current_date,
                 view_start,
                 view_end,
@@ -200,18 +309,13 @@ class Timeline:
             if tli:
                 timeline_issues.append(tli)
 
-        return cls(
-            sorted(timeline_issues, key=lambda x: x.created),
-            sorted(attention_issues, key=lambda x: x.summary),
-            selected_monday,
-            boxes,
-        )
+        return timeline_issues, attention_issues
 
     @classmethod
     def _should_attend(
             cls,
             issue: Issue,
-            trans: list[IssueTransition],
+            history: IssueHistory,
             current_date: datetime.date,
             view_start: datetime.date,
     ) -> bool:
@@ -222,7 +326,7 @@ class Timeline:
         - They have no timeestimate (zero timedelta)
         - OR they have overdue_start AND startdate < view_start
         """
-        if Status.normalize_status(issue.status) == 'closed':
+        if issue.status_category == 'closed':
             return False
 
         # No timeestimate: needs attention
@@ -230,7 +334,7 @@ class Timeline:
             return True
 
         # Overdue for starting work
-        if cls._overdue_start(issue, trans, current_date):
+        if cls._overdue_start(issue, history, current_date):
             # Only put in attention if startdate is before the view window,
             # since otherwise it's already visible in the timeline.
             if issue.startdate and issue.startdate < view_start:
@@ -241,155 +345,87 @@ class Timeline:
     @staticmethod
     def _overdue_start(
             issue: Issue,
-            trans: list[IssueTransition],
+            history: IssueHistory,
             current_date: datetime.date,
     ) -> bool:
         # An issue is overdue for having started work if it has an estimated
         # start date in the past, but has not yet transitioned through a
         # working state.
-        has_started = any(
-            Status.normalize_status(s) == 'in-progress'
-            for s in [t.to_status for t in trans] + [issue.status]
-        )
         return bool(
             issue.startdate
             and issue.startdate < current_date
-            and not has_started
-            and Status.normalize_status(issue.status) != 'closed',
-        )
-
-    @classmethod
-    def _build_timeline_issue_segments(
-            cls,
-            issue: Issue,
-            trans: list[IssueTransition],
-            current_date: datetime.date,
-    ) -> Iterator[TimelineSegment]:
-        """Build timeline segments for an issue from status transitions."""
-        created_date = issue.created.date()
-
-        if not trans:
-            # TODO: consider scheduling a fetch here
-            segment_end = cls._compute_estimated_completion(issue, trans)
-            if Status.normalize_status(issue.status) == 'closed':
-                segment_end = segment_end or issue.updated.date()
-            else:
-                segment_end = segment_end or current_date
-
-            yield TimelineSegment(
-                start=created_date,
-                end=segment_end,
-                status=issue.status,
-            )
-            return
-
-        first_trans = trans[0]
-        initial_status = first_trans.from_status or issue.status
-        yield TimelineSegment(
-            start=created_date,
-            end=first_trans.timestamp.date(),
-            status=initial_status,
-        )
-
-        for i, transition in enumerate(trans[:-1]):
-            yield TimelineSegment(
-                start=transition.timestamp.date(),
-                end=trans[i + 1].timestamp.date(),
-                status=transition.to_status,
-            )
-
-        last_trans = trans[-1]
-        if Status.normalize_status(last_trans.to_status) == 'closed':
-            segment_end = last_trans.timestamp.date()
-        else:
-            est_complete = cls._compute_estimated_completion(issue, trans)
-            segment_end = max(est_complete or current_date, current_date)
-
-        yield TimelineSegment(
-            start=last_trans.timestamp.date(),
-            end=segment_end,
-            status=last_trans.to_status,
+            and not history.started
+            and issue.status_category != 'closed',
         )
 
     @classmethod
     def _build_timeline_issue(
             cls,
             issue: Issue,
-            trans: list[IssueTransition],
+            history: IssueHistory,
             current_date: datetime.date,
             view_start: datetime.date,
             view_end: datetime.date,
     ) -> TimelineIssue | None:
-        """Build a TimelineIssue from an issue and its transitions."""
-        issue_status = IssueCreate.parse_status(issue.status)
-        segments = cls._build_timeline_issue_segments(
-            issue, trans, current_date,
-        )
-
+        """Build a TimelineIssue from an issue and its history."""
         clamped_segments: list[TimelineSegment] = []
         view_end_inclusive = view_end - datetime.timedelta(days=1)
-        for segment in segments:
-            segment.start = max(segment.start, view_start)
-            segment.end = min(segment.end, view_end_inclusive)
-            if segment.start <= segment.end:
-                clamped_segments.append(segment)
+        for span in history.segments:
+            start = span.start
+            end = span.end_on(current_date)
+            if start > end:
+                logger.error(
+                    'timeline segment has inverted dates for %s: %s > %s',
+                    span.status, start, end,
+                )
+
+            start = max(start, view_start)
+            end = min(end, view_end_inclusive)
+            if start <= end:
+                clamped_segments.append(
+                    TimelineSegment(start, end, span.status, span.category),
+                )
         if not clamped_segments:
             return None
 
-        est_completion = cls._compute_estimated_completion(issue, trans)
+        est_completion = history.estimated_completion
         overdue = bool(
             est_completion
             and est_completion < current_date
-            and Status.normalize_status(issue.status) != 'closed',
+            and issue.status_category != 'closed',
         )
 
         return TimelineIssue(
             key=issue.key,
             summary=issue.summary,
-            status=issue_status,
+            # N.B. already de-duplicated by parse_status() at ingest
+            status=issue.status,
             created=issue.created.date(),
             startdate=issue.startdate,
             segments=clamped_segments,
             estimated_completion=est_completion,
             overdue=overdue,
-            overdue_start=cls._overdue_start(issue, trans, current_date),
+            overdue_start=cls._overdue_start(issue, history, current_date),
         )
 
-    @staticmethod
-    def _compute_estimated_completion(
-            issue: Issue,
-            trans: list[IssueTransition],
-    ) -> datetime.date | None:
-        """Compute estimated completion date for an issue."""
-        if Status.normalize_status(issue.status) == 'closed':
-            # Closed issues: find close transition date
-            return next(
-                (
-                    t.timestamp.date() for t in trans
-                    if Status.normalize_status(t.to_status) == 'closed'
-                ),
-                None,
-            )
+    def calculate_rendering(self, current_date: datetime.date) -> None:
+        """Add computed percentages to the timeline issues and segments."""
+        total_days = len(self.boxes) * 7
+        view_start = self.boxes[0][0]
+        resolution = -(-total_days // SEGMENT_SLOTS)
 
-        # Look for first in-progress transition
-        in_prog_trans = next(
-            (
-                t for t in trans
-                if Status.normalize_status(t.to_status) == 'in-progress'
-            ),
-            None,
-        )
-        if in_prog_trans and issue.timeestimate:
-            base_date = in_prog_trans.timestamp.date()
-            days = max(issue.timeestimate.days - 1, 0)
-            return base_date + datetime.timedelta(days=days)
+        for issue in self.issues:
+            issue.coalesce(resolution)
+            issue.calculate_rendering(total_days, view_start, current_date)
 
-        # No in-progress, use startdate if available
-        if issue.startdate and issue.timeestimate:
-            days = max(issue.timeestimate.days - 1, 0)
-            return issue.startdate + datetime.timedelta(days=days)
+            previous = None
+            for segment in issue.segments:
+                if segment.left_percent:
+                    previous = segment
+                    continue
 
-        return None
+                segment.calculate_rendering(previous, total_days, view_start)
+                previous = segment
 
     @staticmethod
     def get_boxes(
@@ -417,6 +453,23 @@ class Timeline:
 
         return selected_monday, boxes
 
+    @classmethod
+    def get_window(
+            cls,
+            selected_date: datetime.date,
+            current_date: datetime.date,
+            weeks_before: int,
+            weeks_after: int,
+    ) -> tuple[datetime.date, datetime.date]:
+        """The [start, end) range of dates a timeline would render."""
+        _, boxes = cls.get_boxes(
+            selected_date=selected_date,
+            current_date=current_date,
+            weeks_before=weeks_before,
+            weeks_after=weeks_after,
+        )
+        return boxes[0][0], boxes[-1][0] + datetime.timedelta(days=7)
+
     @property
     def next_week(self) -> str:
         return (self.selected_monday + datetime.timedelta(days=7)).isoformat()
@@ -0,0 +1,82 @@
+import datetime
+from typing import Self
+
+import pydantic
+
+from mosura.schemas.timeline import Timeline
+
+
+# Compact JSON views of a Timeline, for the client to lay out itself. Dates
+# are left as dates rather than as percentages, so that the same response
+# can be drawn at any width.
+
+
+class TimelineRangeIssue(pydantic.BaseModel):
+    key: str
+    summary: str
+    status: str
+    startdate: datetime.date | None
+    estimated_completion: datetime.date | None
+    overdue: bool
+    overdue_start: bool
+    # (start, end, status, category), with inclusive end dates
+    segments: list[tuple[datetime.date, datetime.date, str, str]]
+
+
+class TimelineAttention(pydantic.BaseModel):
+    key: str
+    summary: str
+    assignee: str | None
+    status: str
+    startdate: datetime.date | None
+    timeestimate: datetime.timedelta
+
+    model_config = pydantic.ConfigDict(ser_json_timedelta='float')
+
+
+class TimelineRange(pydantic.BaseModel):
+    # the [start, end) range covered, always whole weeks from a Monday
+    start: datetime.date
+    end: datetime.date
+    current_date: datetime.date
+    issues: list[TimelineRangeIssue]
+    attention: list[TimelineAttention]
+
+    @classmethod
+    def from_timeline(
+            cls,
+            timeline: Timeline,
+            current_date: datetime.date,
+    ) -> Self:
+        return cls(
+            start=timeline.range_start,
+            end=timeline.range_end,
+            current_date=current_date,
+            issues=[
+                TimelineRangeIssue(
+                    key=issue.key,
+                    summary=issue.summary,
+                    status=issue.status,
+                    startdate=issue.startdate,
+                    estimated_completion=issue.estimated_completion,
+                    overdue=issue.overdue,
+                    overdue_start=issue.overdue_start,
+                    segments=[
+                        (x.start, x.end, x.status, x.category)
+                        for x in issue.segments
+                    ],
+                )
+                for issue in timeline.issues
+            ],
+            attention=[
+                TimelineAttention(
+                    key=issue.key,
+                    summary=issue.summary,
+                    assignee=issue.assignee,
+                    status=issue.status,
+                    startdate=issue.startdate,
+                    timeestimate=issue.timeestimate,
+                )
+                for issue in timeline.attention
+            ],
+        )
@@ -0,0 +1,129 @@
+"""
+Static assets, served precompressed and cacheable forever by fingerprint.
+
+Run as ``python -m mosura.static`` at build time to write the ``.gz`` copy of
+each asset which is worth compressing.
+"""
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import pathlib
+from typing import Any
+
+import fastapi.staticfiles
+import starlette.datastructures
+import starlette.responses
+import starlette.staticfiles
+import starlette.types
+
+
+DIRECTORY = 'static'
+# below this, compression saves less than a packet
+MIN_COMPRESS_SIZE = 1024
+# already compressed, or too small to matter
+SKIP_SUFFIXES = {'.gz', '.ico', '.png', '.woff', '.woff2'}
+
+logger = logging.getLogger(__name__)
+
+
+def _assets(directory: str) -> list[pathlib.Path]:
+    return [
+        path for path in sorted(pathlib.Path(directory).rglob('*'))
+        if path.is_file() and path.suffix != '.gz'
+    ]
+
+
+def fingerprint(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=6).hexdigest()
+
+
+def compress(directory: str = DIRECTORY) -> None:
+    for path in _assets(directory):
+        if path.suffix in SKIP_SUFFIXES:
+            continue
+        if path.stat().st_size < MIN_COMPRESS_SIZE:
+            continue
+
+        content = gzip.compress(path.read_bytes(), compresslevel=9, mtime=0)
+        path.with_name(f'{path.name}.gz').write_bytes(content)
+        logger.info('compressed %s', path)
+
+
+class StaticFiles(fastapi.staticfiles.StaticFiles):
+    """
+    Serve the precompressed ``.gz`` copy of an asset to clients which take it.
+
+    Responses are also marked as immutable when requested with the
+    fingerprint from ``version()``.
+
+    Assets are read once at startup: a ``.gz`` copy is only used if it is at
+    least as new as its source, so a stale build never wins.
+    """
+
+    def __init__(self, *, directory: str = DIRECTORY, **kwargs: Any) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self.fingerprints: dict[str, str] = {}
+        self.precompressed: set[str] = set()
+        for path in _assets(directory):
+            full_path = os.path.realpath(path)
+            self.fingerprints[full_path] = fingerprint(path.read_bytes())
+
+            gzipped = path.with_name(f'{path.name}.gz')
+            if (
+                    gzipped.exists()
+                    and gzipped.stat().st_mtime >= path.stat().st_mtime
+            ):
+                self.precompressed.add(full_path)
+
+    def version(self, path: str) -> str | None:
+        """The fingerprint of an asset, to be passed as ``?v=``."""
+        full_path = os.path.realpath(
+            os.path.join(str(self.directory), path.lstrip('/')),
+        )
+        return self.fingerprints.get(full_path)
+
+    def file_response(
+            self,
+            full_path: os.PathLike[str] | str,
+            stat_result: os.stat_result,
+            scope: starlette.types.Scope,
+            status_code: int = 200,
+    ) -> starlette.responses.Response:
+        full_path = str(full_path)
+        request = starlette.datastructures.Headers(scope=scope)
+        accepts_gzip = 'gzip' in request.get('accept-encoding', '')
+        response: starlette.responses.Response
+        if full_path in self.precompressed and accepts_gzip:
+            response = starlette.responses.FileResponse(
+                f'{full_path}.gz',
+                status_code=status_code,
+                stat_result=os.stat(f'{full_path}.gz'),
+                # as the original, rather than application/gzip
+                media_type=mimetypes.guess_type(full_path)[0],
+                headers={'Content-Encoding': 'gzip'},
+            )
+            if self.is_not_modified(response.headers, request):
+                response = starlette.staticfiles.NotModifiedResponse(
+                    response.headers,
+                )
+        else:
+            response = super().file_response(
+                full_path, stat_result, scope, status_code,
+            )
+        if full_path in self.precompressed:
+            response.headers.add_vary_header('Accept-Encoding')
+
+        query = starlette.datastructures.QueryParams(scope['query_string'])
+        version = self.fingerprints.get(full_path)
+        if version and query.get('v') == version:
+            response.headers['Cache-Control'] = (
+                'public, max-age=31536000, immutable'
+            )
+        return response
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    compress()
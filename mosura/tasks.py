@@ -7,7 +7,9 @@ from typing import Any
 import fastapi
 import requests
 
+from . import cache
 from . import database
+from . import events
 from . import models
 from . import schemas
 
@@ -24,6 +26,9 @@ _TRANSIENT_ERRORS = (
 # Consecutive transient failures tolerated before we stop skipping runs and let
 # the error propagate, crashing the process for the orchestrator to restart.
 _MAX_CONSECUTIVE_TRANSIENT = 3
+# How long deletions stay in the change feed. Readers which fall further
+# behind than this are told to resync.
+CHANGE_RETENTION = datetime.timedelta(days=7)
 
 
 async def _search_issues(
@@ -102,9 +107,9 @@ async def _sync_issue_transitions(
     assignee = (
         issue.get('fields', {}).get('assignee') or {}
     ).get('displayName')
-    if assignee != app.state.tracked_user_name:
+    if assignee not in app.state.team.values():
         # We don't need transitions unless we're rendering timelines, and we
-        # only do that for the tracked user.
+        # only do that for the team.
         return
 
     try:
@@ -172,14 +177,15 @@ async def _upsert_issue_graph(
         )
 
     # upsert Issue
-    await models.Issue.upsert(
-        schemas.IssueCreate.from_jira(issue),
-        session=session,
-    )
+    parsed = schemas.IssueCreate.from_jira(issue)
+    await models.Issue.upsert(parsed, session=session)
 
-    # Sync transitions for tracked user issues
+    # Sync transitions for the team's issues
     await _sync_issue_transitions(issue, app, session)
 
+    # Precompute the issue's timeline, now that its transitions are current
+    await models.IssueHistory.rebuild(parsed, session=session)
+
 
 def _issue_changed(
     fetched_updated: datetime.datetime,
@@ -199,6 +205,12 @@ async def sync_desired_issues(
     session: Any,
 ) -> set[str]:
     jql = f'(assignee = "{app.state.tracked_user_id}")'
+    members = [
+        f'"{account_id}"' for account_id in app.state.team
+        if account_id != app.state.tracked_user_id
+    ]
+    if members:
+        jql += f'OR(assignee in ({", ".join(members)}))'
     custom_jql = await models.Setting.get('custom_jql', session=session)
     if custom_jql:
         jql += f'OR({custom_jql})'
@@ -295,12 +307,20 @@ async def refresh_issue_by_key(
         return
 
     async with database.session_from_app(app) as session:
+        lanes = await models.Generation.get_lanes(session=session)
         await _upsert_issue_graph(
             fetched_issue,
             app=app,
             session=session,
         )
         await session.commit()
+        lanes_after = await models.Generation.get_lanes(session=session)
+
+    generation = await cache.refresh(app)
+    events.publish(
+        app, generation,
+        changed=[key], assignees=_moved(lanes, lanes_after),
+    )
 
 
 def schedule_issue_refresh(
@@ -352,6 +372,10 @@ def _next_sleep_seconds(
     return int((next_run - now).total_seconds()) + 1
 
 
+def _moved(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    return [k for k, v in after.items() if before.get(k) != v]
+
+
 async def _sync_once(
     app: fastapi.FastAPI,
     *,
@@ -359,6 +383,8 @@ async def _sync_once(
 ) -> None:
     async with database.session_from_app(app) as session:
         logger.info('fetch(%s): fetching data', variant)
+        before = await models.Issue.get_updated_map(session=session)
+        lanes = await models.Generation.get_lanes(session=session)
         desired_keys = await sync_desired_issues(app=app, session=session)
         pruned_keys = await reconcile_stale_issues(
             session=session,
@@ -370,13 +396,27 @@ async def _sync_once(
             len(desired_keys),
             len(pruned_keys),
         )
+        now = datetime.datetime.now(datetime.UTC)
         task = schemas.Task.model_validate({
             'key': 'fetch',
             'variant': variant,
-            'latest': datetime.datetime.now(datetime.UTC),
+            'latest': now,
         })
         await models.Task.upsert(task, session=session)
+        await models.Change.compact(
+            before=now - CHANGE_RETENTION, session=session,
+        )
         await session.commit()
+        after = await models.Issue.get_updated_map(session=session)
+        lanes_after = await models.Generation.get_lanes(session=session)
+
+    generation = await cache.refresh(app)
+    events.publish(
+        app, generation,
+        changed=_moved(before, after),
+        removed=before.keys() - after.keys(),
+        assignees=_moved(lanes, lanes_after),
+    )
 
 
 async def fetch_desired(
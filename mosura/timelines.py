@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+from typing import Any
+
+import fastapi
+
+from . import cache
+from . import database
+from . import models
+from . import schemas
+
+
+# The widest range the API will lay out in one go.
+MAX_WEEKS = 53
+# How many team lanes may be rebuilt at once, each with its own connection.
+LANE_CONCURRENCY = 4
+
+
+async def build(
+        *,
+        assignee: str,
+        selected_monday: datetime.date,
+        current_date: datetime.date,
+        weeks_before: int,
+        weeks_after: int,
+        session: Any,
+) -> schemas.Timeline:
+    window = schemas.Timeline.get_window(
+        selected_monday, current_date, weeks_before, weeks_after,
+    )
+
+    # Only load issues which could overlap the rendered weeks, rather than
+    # every issue ever assigned; Timeline.from_histories() does the exact cut.
+    issues = await models.Issue.get(
+        assignee=assignee,
+        closed=True,
+        window=window,
+        session=session,
+    )
+    histories = await models.IssueHistory.get_many(
+        [issue.key for issue in issues],
+        window=window,
+        session=session,
+    )
+
+    timeline = schemas.Timeline.from_histories(
+        issues,
+        histories,
+        selected_date=selected_monday,
+        current_date=current_date,
+        weeks_before=weeks_before,
+        weeks_after=weeks_after,
+    )
+    timeline.calculate_rendering(current_date=current_date)
+    return timeline
+
+
+async def get(
+        app: fastapi.FastAPI,
+        selected_date: datetime.date,
+        current_date: datetime.date,
+        *,
+        weeks_before: int,
+        weeks_after: int,
+) -> schemas.Timeline:
+    # Memoized per week until the next write. The cached timeline is already
+    # enriched for rendering and shared between requests, so it must not be
+    # modified.
+    return await cache.fetch(
+        app,
+        build,
+        assignee=app.state.tracked_user_name,
+        selected_monday=(
+            selected_date - datetime.timedelta(days=selected_date.weekday())
+        ),
+        current_date=current_date,
+        weeks_before=weeks_before,
+        weeks_after=weeks_after,
+    )
+
+
+async def _build_lanes(
+        app: fastapi.FastAPI,
+        assignees: list[str],
+        **kwargs: Any,
+) -> list[schemas.Timeline]:
+    # Each lane gets its own session, so that their reads run side by side.
+    semaphore = asyncio.Semaphore(LANE_CONCURRENCY)
+
+    async def build_lane(assignee: str) -> schemas.Timeline:
+        async with semaphore, database.session_from_app(app) as session:
+            return await build(assignee=assignee, **kwargs, session=session)
+
+    return await asyncio.gather(*(build_lane(x) for x in assignees))
+
+
+async def get_team(
+        app: fastapi.FastAPI,
+        selected_date: datetime.date,
+        current_date: datetime.date,
+        *,
+        weeks_before: int,
+        weeks_after: int,
+        assignees: tuple[str, ...] | None = None,
+) -> dict[str, schemas.Timeline]:
+    """
+    Lay out one timeline per team member, in team order.
+
+    Given ``assignees``, lay out just the timelines for those instead.
+
+    Each lane is cached against its assignee's own generation rather than the
+    global one, so a change to one person's issues only rebuilds their lane.
+    Whichever lanes are stale get rebuilt concurrently.
+    """
+    if assignees is None:
+        assignees = tuple(app.state.team.values())
+    generations = await cache.fetch(
+        app, models.Generation.get_assignees, assignees=assignees,
+    )
+    selected_monday = (
+        selected_date - datetime.timedelta(days=selected_date.weekday())
+    )
+    lane_cache = cache.lanes_from_app(app)
+
+    def key(assignee: str) -> tuple[object, ...]:
+        return (
+            build, assignee, selected_monday, current_date, weeks_before,
+            weeks_after,
+        )
+
+    lanes = {
+        x: lane_cache.lookup(key(x), generations[x]) for x in assignees
+    }
+    stale = [x for x, (hit, _) in lanes.items() if not hit]
+    built = await _build_lanes(
+        app,
+        stale,
+        selected_monday=selected_monday,
+        current_date=current_date,
+        weeks_before=weeks_before,
+        weeks_after=weeks_after,
+    )
+    for assignee, lane in zip(stale, built, strict=True):
+        # N.B. tagged with the generation read before building, so a write
+        # which raced with the build just causes another rebuild
+        lane_cache.store(key(assignee), generations[assignee], lane)
+        lanes[assignee] = (True, lane)
+
+    return {x: lane for x, (_, lane) in lanes.items()}
+
+
+async def get_range(
+        app: fastapi.FastAPI,
+        start: datetime.date,
+        end: datetime.date,
+        current_date: datetime.date,
+) -> schemas.Timeline:
+    """Lay out the whole weeks which cover [start, end)."""
+    monday = start - datetime.timedelta(days=start.weekday())
+    weeks = -(-(end - monday).days // 7)
+    if end <= start or weeks > MAX_WEEKS:
+        raise fastapi.HTTPException(
+            status_code=422,
+            detail=f'range must be non-empty and at most {MAX_WEEKS} weeks',
+        )
+
+    return await get(
+        app,
+        monday,
+        current_date,
+        weeks_before=0,
+        weeks_after=weeks - 1,
+    )
+
+
+async def prefetch_adjacent(
+        app: fastapi.FastAPI,
+        timeline: schemas.Timeline,
+        current_date: datetime.date,
+        *,
+        weeks_before: int,
+        weeks_after: int,
+) -> None:
+    # Warm the cache for the prev/next week links, so that stepping through
+    # weeks doesn't wait on the database.
+    for selected_date in (timeline.prev_week, timeline.next_week):
+        await get(
+            app,
+            datetime.date.fromisoformat(selected_date),
+            current_date,
+            weeks_before=weeks_before,
+            weeks_after=weeks_after,
+        )
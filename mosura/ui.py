@@ -1,18 +1,38 @@
+import asyncio
 import datetime
+import logging
+import pathlib
+from collections.abc import Hashable
 from typing import Any
+from typing import cast
 
 import fastapi.templating
+import jinja2
+import markupsafe
 import starlette
 
+from . import cache
+from . import conditional
+from . import config
 from . import database
 from . import models
+from . import pagination
 from . import schemas
+from . import timelines
 
 
+logger = logging.getLogger(__name__)
+
 router = fastapi.APIRouter(tags=['ui'])
 
 templates = fastapi.templating.Jinja2Templates(directory='templates')
 
+# the weeks around the selected one which /timeline shows
+TIMELINE_WEEKS_BEFORE = 3
+TIMELINE_WEEKS_AFTER = 5
+# the most important of my issues, as listed on the home page
+HOME_TOP_ISSUES = 5
+
 
 def dateformat(x: datetime.datetime | None) -> str:
     if x is None:
@@ -42,46 +62,64 @@ templates.env.filters['dayformat'] = dayformat
 templates.env.filters['timeformat'] = timeformat
 
 
-async def _build_timeline(
-        request: fastapi.Request,
-        session: Any,
-        selected_date: datetime.date,
-        current_date: datetime.date,
-        weeks_before: int,
-        weeks_after: int,
-) -> schemas.Timeline:
-    transitions_by_issue: dict[str, list[schemas.IssueTransition]] = {}
-
-    # TODO: for perf, move some filters out of Timeline.from_issues() and into
-    # this SQL command.
-    issues = await models.Issue.get(
-        assignee=request.app.state.tracked_user_name,
-        closed=True,
-        session=session,
-    )
+@jinja2.pass_context
+def static_url(context: jinja2.runtime.Context, path: str) -> str:
+    # pinned to the asset's content, so that it can be cached forever
+    request: fastapi.Request = context['request']
+    url = request.url_for('static', path=path)
+    version = request.app.state.static_files.version(path)
+    if version:
+        url = url.include_query_params(v=version)
+    return str(url)
 
-    issue_keys = [issue.key for issue in issues]
-    if issue_keys:
-        transitions = await models.IssueTransition.get_by_keys(
-            issue_keys,
-            session=session,
-        )
-        for transition in transitions:
-            transitions_by_issue.setdefault(
-                transition.key,
-                [],
-            ).append(transition)
-
-    timeline = schemas.Timeline.from_issues(
-        issues,
-        selected_date=selected_date,
-        current_date=current_date,
-        transitions=transitions_by_issue,
-        weeks_before=weeks_before,
-        weeks_after=weeks_after,
-    )
-    _enrich_timeline_for_template(timeline, current_date=current_date)
-    return timeline
+
+templates.env.globals['static_url'] = static_url
+
+
+def configure_templates(settings: config.Settings) -> None:
+    """
+    Compile every template up front, rather than on the first request.
+
+    This optionally goes via an on-disk bytecode cache which survives
+    restarts.
+    """
+    env = templates.env
+    # Otherwise every render stats its template (and any it includes) to
+    # check for changes.
+    env.auto_reload = settings.mosura_reload_templates
+    if settings.mosura_template_cache:
+        directory = pathlib.Path(settings.mosura_appdata) / 'templates.cache'
+        directory.mkdir(exist_ok=True)
+        env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(directory))
+
+    names = env.list_templates()
+    for name in names:
+        env.get_template(name)
+    logger.debug('configure_templates(): compiled %d templates', len(names))
+
+
+def render_fragment(
+        request: fastapi.Request,
+        name: str,
+        generation: int,
+        *params: Hashable,
+        **context: Any,
+) -> markupsafe.Markup:
+    """
+    Render the template ``name``, memoized until the next write.
+
+    ``params`` must cover everything the fragment depends on other than the
+    data, and ``generation`` must have been read before that data was.
+    """
+    read_cache = cache.from_app(request.app)
+    key = (render_fragment, name, *params)
+    hit, html = read_cache.lookup(key, generation)
+    if hit:
+        return cast(markupsafe.Markup, html)
+
+    html = markupsafe.Markup(templates.get_template(name).render(**context))
+    read_cache.store(key, generation, html)
+    return html
 
 
 @router.get('/', response_class=fastapi.responses.HTMLResponse)
@@ -89,55 +127,115 @@ async def home(
         request: fastapi.Request,
 ) -> starlette.responses.Response:
     current_date = datetime.datetime.now(datetime.UTC).date()
-
-    async with database.session_from_app(request.app) as session:
-        my_issues = await models.Issue.get(
+    etag = await conditional.check(request, current_date)
+
+    # The two panels are independent, so load them side by side; each fetch
+    # reads through its own session.
+    top_issues, timeline = await asyncio.gather(
+        cache.fetch(
+            request.app,
+            models.Issue.get,
             assignee=request.app.state.tracked_user_name,
             closed=False,
-            session=session,
-        )
-        timeline = await _build_timeline(
-            request,
-            session,
+            limit=HOME_TOP_ISSUES,
+        ),
+        timelines.get(
+            request.app,
             current_date,
             current_date,
             weeks_before=1,
             weeks_after=1,
-        )
+        ),
+    )
 
-    my_issues.sort(key=lambda i: i.priority.sort_value, reverse=True)
+    context = {'my_issues': top_issues, 'timeline': timeline}
+    return templates.TemplateResponse(
+        request, 'home.html', context, headers=conditional.headers(etag),
+    )
 
-    context = {'my_issues': my_issues[:5], 'timeline': timeline}
-    return templates.TemplateResponse(request, 'home.html', context)
+
+async def _render_issue_list(
+        request: fastapi.Request,
+        title: str,
+        *,
+        cursor: schemas.IssueCursor | None,
+        partial: bool,
+        filters: schemas.IssueFilter,
+        order: schemas.IssueOrder,
+        assignee: str | None = None,
+        needs_triage: bool = False,
+) -> starlette.responses.Response:
+    etag = await conditional.check(request)
+    generation = await cache.current_generation(request.app)
+    issues, next_cursor = await cache.fetch(
+        request.app, models.Issue.paginate, limit=pagination.PAGE_SIZE,
+        after=cursor, assignee=assignee, needs_triage=needs_triage,
+        filters=filters, order=order,
+    )
+    total = await cache.fetch(
+        request.app, models.Issue.count, assignee=assignee,
+        needs_triage=needs_triage, filters=filters,
+    )
+
+    rows = render_fragment(
+        request, 'issues.rows.html', generation, cursor, assignee,
+        needs_triage, filters, order, issues=issues,
+    )
+    response: starlette.responses.Response
+    if partial:
+        # Later pages are fetched as they scroll into view, and the first
+        # page again whenever the filters or sort change; those requests
+        # only need the table rows.
+        response = fastapi.responses.HTMLResponse(
+            rows, headers=conditional.headers(etag),
+        )
+    else:
+        response = templates.TemplateResponse(
+            request,
+            'issues.list.html',
+            {
+                'rows': rows, 'title': title, 'total': total,
+                'filters': filters, 'order': order,
+                # N.B. unfiltered, so that every choice stays on offer
+                'meta': await cache.fetch(
+                    request.app, models.Issue.get_meta, assignee=assignee,
+                    needs_triage=needs_triage,
+                ),
+                'next_page': pagination.next_url(request, next_cursor),
+            },
+            headers=conditional.headers(etag),
+        )
+    pagination.set_headers(request, response, total=total, cursor=next_cursor)
+    return response
 
 
 @router.get('/issues', response_class=fastapi.responses.HTMLResponse)
 async def list_issues(
         request: fastapi.Request,
+        cursor: pagination.Cursor,
+        filters: pagination.Filters,
+        order: pagination.Order,
+        partial: bool = False,
 ) -> starlette.responses.Response:
-    async with database.session_from_app(request.app) as session:
-        issues = await models.Issue.get(closed=False, session=session)
-
-    meta = schemas.Meta.from_issues(issues)
-    context = {'issues': issues, 'meta': meta, 'title': 'Issues'}
-    return templates.TemplateResponse(request, 'issues.list.html', context)
+    return await _render_issue_list(
+        request, 'Issues', cursor=cursor, partial=partial,
+        filters=filters, order=order,
+    )
 
 
 @router.get('/mine', response_class=fastapi.responses.HTMLResponse)
 async def list_my_issues(
         request: fastapi.Request,
+        cursor: pagination.Cursor,
+        filters: pagination.Filters,
+        order: pagination.Order,
+        partial: bool = False,
 ) -> starlette.responses.Response:
-    tracked_user_name = request.app.state.tracked_user_name
-
-    async with database.session_from_app(request.app) as session:
-        issues = await models.Issue.get(
-            assignee=tracked_user_name, closed=False,
-            session=session,
-        )
-
-    meta = schemas.Meta.from_issues(issues)
-    context = {'issues': issues, 'meta': meta, 'title': 'My Issues'}
-    return templates.TemplateResponse(request, 'issues.list.html', context)
+    return await _render_issue_list(
+        request, 'My Issues', cursor=cursor, partial=partial,
+        filters=filters, order=order,
+        assignee=request.app.state.tracked_user_name,
+    )
 
 
 @router.get('/issues/{key}', response_class=fastapi.responses.HTMLResponse)
@@ -158,6 +256,18 @@ async def show_issue(
     return templates.TemplateResponse(request, 'issues.show.html', context)
 
 
+@router.get('/search', response_class=fastapi.responses.HTMLResponse)
+async def search_issues(
+        request: fastapi.Request,
+        q: str = '',
+) -> starlette.responses.Response:
+    async with database.session_from_app(request.app) as session:
+        results = await models.Issue.search(q, limit=50, session=session)
+
+    context = {'query': q, 'results': results}
+    return templates.TemplateResponse(request, 'search.html', context)
+
+
 @router.get('/settings', response_class=fastapi.responses.HTMLResponse)
 async def show_settings(
         request: fastapi.Request,
@@ -171,30 +281,10 @@ async def show_settings(
     return templates.TemplateResponse(request, 'settings.html', context)
 
 
-def _enrich_timeline_for_template(
-        timeline: schemas.Timeline,
-        current_date: datetime.date,
-) -> None:
-    """Add computed percentages and CSS classes to timeline issues."""
-    total_days = len(timeline.boxes) * 7
-    view_start = timeline.boxes[0][0]
-
-    for issue in timeline.issues:
-        issue.calculate_rendering(total_days, view_start, current_date)
-
-        previous = None
-        for segment in issue.segments:
-            if segment.left_percent:
-                previous = segment
-                continue
-
-            segment.calculate_rendering(previous, total_days, view_start)
-            previous = segment
-
-
 @router.get('/timeline', response_class=fastapi.responses.HTMLResponse)
 async def show_timeline(
         request: fastapi.Request,
+        background_tasks: fastapi.BackgroundTasks,
         date: str | None = None,
 ) -> starlette.responses.Response:
     current_date = datetime.datetime.now(datetime.UTC).date()
@@ -202,28 +292,101 @@ async def show_timeline(
         datetime.date.fromisoformat(date) if date
         else current_date
     )
+    etag = await conditional.check(request, current_date)
+    generation = await cache.current_generation(request.app)
+
+    timeline = await timelines.get(
+        request.app,
+        selected_date,
+        current_date,
+        weeks_before=TIMELINE_WEEKS_BEFORE,
+        weeks_after=TIMELINE_WEEKS_AFTER,
+    )
+    background_tasks.add_task(
+        timelines.prefetch_adjacent,
+        request.app,
+        timeline,
+        current_date,
+        weeks_before=TIMELINE_WEEKS_BEFORE,
+        weeks_after=TIMELINE_WEEKS_AFTER,
+    )
 
-    async with database.session_from_app(request.app) as session:
-        timeline = await _build_timeline(
-            request,
-            session,
-            selected_date,
-            current_date,
-            weeks_before=3,
-            weeks_after=5,
+    params = (timeline.selected_monday, current_date)
+    context = {
+        'timeline': timeline,
+        'chart': render_fragment(
+            request, 'timeline.chart.html', generation, *params,
+            timeline=timeline,
+        ),
+        'attention': render_fragment(
+            request, 'timeline.attention.html', generation, *params,
+            timeline=timeline,
+        ),
+        'weeks_before': TIMELINE_WEEKS_BEFORE,
+        'weeks_after': TIMELINE_WEEKS_AFTER,
+    }
+    return templates.TemplateResponse(
+        request, 'timeline.html', context, headers=conditional.headers(etag),
+    )
+
+
+@router.get('/timeline/team', response_class=fastapi.responses.HTMLResponse)
+async def show_team_timeline(
+        request: fastapi.Request,
+        date: str | None = None,
+        lane: str | None = None,
+) -> starlette.responses.Response:
+    current_date = datetime.datetime.now(datetime.UTC).date()
+    selected_date = (
+        datetime.date.fromisoformat(date) if date
+        else current_date
+    )
+    if lane is not None and lane not in request.app.state.team.values():
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
+        )
+    etag = await conditional.check(request, current_date)
+
+    lanes = await timelines.get_team(
+        request.app,
+        selected_date,
+        current_date,
+        weeks_before=TIMELINE_WEEKS_BEFORE,
+        weeks_after=TIMELINE_WEEKS_AFTER,
+        assignees=None if lane is None else (lane,),
+    )
+    if lane is not None:
+        # just the one lane, for the page to swap in after a change to it
+        return templates.TemplateResponse(
+            request, 'timeline.team.lane.html',
+            {'assignee': lane, 'timeline': lanes[lane]},
+            headers=conditional.headers(etag),
         )
 
-    context = {'timeline': timeline}
-    return templates.TemplateResponse(request, 'timeline.html', context)
+    context = {
+        'lanes': lanes,
+        # every lane covers the same weeks; any one of them will do for the
+        # header and the picker
+        'timeline': next(iter(lanes.values())),
+        'attention': [
+            issue for lane in lanes.values() for issue in lane.attention
+        ],
+    }
+    return templates.TemplateResponse(
+        request, 'timeline.team.html', context,
+        headers=conditional.headers(etag),
+    )
 
 
 @router.get('/triage', response_class=fastapi.responses.HTMLResponse)
 async def list_triagable_issues(
         request: fastapi.Request,
+        cursor: pagination.Cursor,
+        filters: pagination.Filters,
+        order: pagination.Order,
+        partial: bool = False,
 ) -> starlette.responses.Response:
-    async with database.session_from_app(request.app) as session:
-        issues = await models.Issue.get(needs_triage=True, session=session)
-
-    meta = schemas.Meta.from_issues(issues)
-    context = {'issues': issues, 'meta': meta, 'title': 'Triage'}
-    return templates.TemplateResponse(request, 'issues.list.html', context)
+    return await _render_issue_list(
+        request, 'Triage', cursor=cursor, partial=partial,
+        filters=filters, order=order, needs_triage=True,
+    )
@@ -0,0 +1,15 @@
+// Subscribe to the change sets published after each sync or edit, and hand
+// each of them to the page as a 'mosura:change' event to patch itself with.
+// Pages opt in by including this script.
+$(function() {
+  if (!window.EventSource) {
+    return;
+  }
+
+  let source = new EventSource('/api/v0/events');
+  source.addEventListener('change', function(event) {
+    document.dispatchEvent(
+      new CustomEvent('mosura:change', {detail: JSON.parse(event.data)}),
+    );
+  });
+});
@@ -0,0 +1,306 @@
+import json
+import types
+import unittest.mock
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from typing import Any
+
+import jira
+import niquests
+import pytest
+
+import mosura.app
+from mosura import events
+from mosura import models
+from mosura import schemas
+
+
+async def test_read_issues_returns_everything_by_default(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    get_mock = unittest.mock.AsyncMock(
+        return_value=[issue_factory('MOS-1'), issue_factory('MOS-2')],
+    )
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=2),
+    )
+
+    response = await client.get('/api/v0/issues')
+
+    assert response.status_code == 200
+    assert [issue['key'] for issue in response.json()] == ['MOS-1', 'MOS-2']
+    assert response.headers['X-Total-Count'] == '2'
+    assert 'Link' not in response.headers
+    get_mock.assert_awaited_once_with(
+        closed=False, after=None, session=api_session,
+    )
+
+
+async def test_read_issues_paginates_with_next_link(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    paginate_mock = unittest.mock.AsyncMock(
+        return_value=(
+            [issue_factory('MOS-7')],
+            schemas.IssueCursor(priority_rank=2, key='MOS-7'),
+        ),
+    )
+    monkeypatch.setattr(models.Issue, 'paginate', paginate_mock)
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=40),
+    )
+
+    response = await client.get('/api/v0/issues?limit=1&after=3:MOS-2')
+
+    assert response.status_code == 200
+    assert [issue['key'] for issue in response.json()] == ['MOS-7']
+    assert response.headers['X-Total-Count'] == '40'
+    assert response.headers['Link'] == (
+        '<http://default/api/v0/issues?limit=1&after=2%3AMOS-7>; rel="next"'
+    )
+    paginate_mock.assert_awaited_once_with(
+        limit=1,
+        after=schemas.IssueCursor(priority_rank=3, key='MOS-2'),
+        closed=False,
+        session=api_session,
+    )
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_read_issues_rejects_malformed_cursor(
+    client: niquests.AsyncSession,
+) -> None:
+    response = await client.get('/api/v0/issues?limit=1&after=nope')
+
+    assert response.status_code == 422
+    assert response.json() == {'detail': 'invalid cursor: nope'}
+
+
+@pytest.mark.parametrize(
+    ('path', 'headers'),
+    [
+        ('/api/v0/issues?stream=1', {}),
+        ('/api/v0/issues', {'Accept': 'application/x-ndjson'}),
+    ],
+)
+@pytest.mark.usefixtures('api_session')
+async def test_read_issues_streams_ndjson(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+    path: str,
+    headers: dict[str, str],
+) -> None:
+    async def stream(**_kwargs: Any) -> AsyncIterator[schemas.Issue]:
+        yield issue_factory('MOS-1')
+        yield issue_factory('MOS-2')
+
+    count_mock = unittest.mock.AsyncMock()
+    monkeypatch.setattr(models.Issue, 'stream', stream)
+    monkeypatch.setattr(models.Issue, 'count', count_mock)
+
+    response = await client.get(path, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == 'application/x-ndjson'
+    assert response.text is not None
+    lines = response.text.splitlines()
+    assert [json.loads(line)['key'] for line in lines] == ['MOS-1', 'MOS-2']
+    # streaming never waits on a full table count
+    count_mock.assert_not_awaited()
+
+
+async def test_read_issues_projects_requested_fields(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    issue = issue_factory('MOS-1')
+    project_mock = unittest.mock.AsyncMock(
+        return_value=(
+            [issue.model_dump()],
+            schemas.IssueCursor(priority_rank=2, key='MOS-1'),
+        ),
+    )
+    monkeypatch.setattr(models.Issue, 'project', project_mock)
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=9),
+    )
+
+    response = await client.get(
+        '/api/v0/issues?fields=status,priority&limit=1',
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {'key': 'MOS-1', 'status': 'In Progress', 'priority': 'Medium'},
+    ]
+    assert response.headers['X-Total-Count'] == '9'
+    assert 'rel="next"' in response.headers['Link']
+    project_mock.assert_awaited_once_with(
+        frozenset({'key', 'status', 'priority'}), closed=False, limit=1,
+        after=None, session=api_session,
+    )
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_read_issues_rejects_unknown_fields(
+    client: niquests.AsyncSession,
+) -> None:
+    response = await client.get('/api/v0/issues?fields=status,secret')
+
+    assert response.status_code == 422
+    assert response.json() == {'detail': 'unknown fields: secret'}
+
+
+async def test_read_issues_looks_up_keys_in_request_order(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    get_mock = unittest.mock.AsyncMock(
+        return_value=[issue_factory('MOS-1'), issue_factory('MOS-3')],
+    )
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+
+    response = await client.get('/api/v0/issues?keys=MOS-3,MOS-2,MOS-1')
+
+    assert response.status_code == 200
+    assert 'ETag' in response.headers
+    assert [x and x['key'] for x in response.json()] == [
+        'MOS-3', None, 'MOS-1',
+    ]
+    get_mock.assert_awaited_once_with(
+        closed=True,
+        filters=schemas.IssueFilter(
+            keys=frozenset({'MOS-1', 'MOS-2', 'MOS-3'}),
+        ),
+        session=api_session,
+    )
+
+    response = await client.post(
+        '/api/v0/issues/lookup', json=['MOS-2', 'MOS-1'],
+    )
+
+    assert response.status_code == 200
+    assert [x and x['key'] for x in response.json()] == [None, 'MOS-1']
+
+
+async def test_patch_issues_reports_each_edit(  # pylint: disable=too-many-locals
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    jira_raw_factory: Callable[..., dict[str, Any]],
+    issue_from_jira_factory: Callable[..., schemas.Issue],
+    jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
+) -> None:
+    fresh = jira_raw_factory(key='MOS-301')
+    stale = jira_raw_factory(key='MOS-302', summary='Stale summary')
+    moved = jira_raw_factory(
+        key='MOS-302',
+        summary='Canonical summary',
+        updated='2026-01-03T00:00:00.000000+00:00',
+    )
+    live_issues = {
+        'MOS-301': [jira_issue_factory(fresh)],
+        'MOS-302': [jira_issue_factory(moved), jira_issue_factory(moved)],
+    }
+    update_mock = unittest.mock.Mock()
+    for live in live_issues['MOS-301'] + live_issues['MOS-302']:
+        monkeypatch.setattr(live, 'update', update_mock, raising=False)
+
+    def fetch_issue(**kwargs: Any) -> jira.Issue:
+        return live_issues[kwargs['id']].pop(0)
+
+    mosura.app.app.state.jira_client = types.SimpleNamespace(
+        issue=fetch_issue,
+    )
+    get_mock = unittest.mock.AsyncMock(
+        return_value=[
+            issue_from_jira_factory(fresh), issue_from_jira_factory(stale),
+        ],
+    )
+    upsert_mock = unittest.mock.AsyncMock()
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+    monkeypatch.setattr(models.Issue, 'upsert', upsert_mock)
+    monkeypatch.setattr(
+        'mosura.api.tasks.schedule_issue_refresh', unittest.mock.Mock(),
+    )
+
+    with events.from_app(mosura.app.app).subscribe() as changes:
+        response = await client.patch(
+            '/api/v0/issues',
+            json=[
+                {'key': 'MOS-301', 'patch': {'priority': 'High'}},
+                {'key': 'MOS-302', 'patch': {'priority': 'High'}},
+                {'key': 'MOS-404', 'patch': {'priority': 'High'}},
+            ],
+        )
+
+    assert response.status_code == 200
+    assert [(x['key'], x['status']) for x in response.json()] == [
+        ('MOS-301', 204), ('MOS-302', 409), ('MOS-404', 404),
+    ]
+    get_mock.assert_awaited_once_with(
+        closed=True,
+        filters=schemas.IssueFilter(
+            keys=frozenset({'MOS-301', 'MOS-302', 'MOS-404'}),
+        ),
+        session=api_session,
+    )
+    update_mock.assert_called_once_with(fields={'priority': {'name': 'High'}})
+    upsert_mock.assert_awaited_once()
+    assert upsert_mock.await_args is not None
+    assert upsert_mock.await_args.args[0].key == 'MOS-301'
+    api_session.commit.assert_awaited_once()
+    assert changes.get_nowait() == schemas.ChangeSet(
+        generation=1, changed=['MOS-301'], assignees=['Test User'],
+    )
+
+
+async def test_patch_issues_rejects_repeated_keys(
+    client: niquests.AsyncSession,
+) -> None:
+    response = await client.patch(
+        '/api/v0/issues',
+        json=[
+            {'key': 'MOS-301', 'patch': {'priority': 'High'}},
+            {'key': 'MOS-301', 'patch': {'summary': 'Again'}},
+        ],
+    )
+
+    assert response.status_code == 422
+
+
+async def test_read_changes_returns_changes_since_generation(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+) -> None:
+    since_mock = unittest.mock.AsyncMock(
+        return_value=schemas.ChangeSet(
+            generation=12, changed=['MOS-1'], removed=['MOS-2'],
+        ),
+    )
+    monkeypatch.setattr(models.Change, 'since', since_mock)
+
+    response = await client.get('/api/v0/changes?since=10')
+
+    assert response.status_code == 200
+    assert response.json() == {
+        'generation': 12,
+        'changed': ['MOS-1'],
+        'removed': ['MOS-2'],
+        'assignees': [],
+        'resync': False,
+    }
+    since_mock.assert_awaited_once_with(10, session=api_session)
@@ -0,0 +1,132 @@
+import types
+import unittest.mock
+import urllib.parse
+from collections.abc import Callable
+from typing import Any
+
+import jira
+import niquests
+import pytest
+import requests
+import sqlalchemy.ext.asyncio
+
+import mosura.app
+from mosura import models
+from mosura import schemas
+
+
+@pytest.fixture(name='live_issues')
+async def _live_issues(
+    api_db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    jira_raw_factory: Callable[..., dict[str, Any]],
+    jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
+) -> Callable[..., Any]:
+    # Cache each issue as synced, and serve it from a fake Jira client.
+    update = unittest.mock.Mock()
+
+    def fetch_issue(**kwargs: Any) -> jira.Issue:
+        key = kwargs['id']
+        if key == 'MOS-500':
+            raise requests.exceptions.ConnectionError('Connection reset')
+        live = jira_issue_factory(jira_raw_factory(key=key, priority='Low'))
+        live.update = update  # type: ignore[method-assign]
+        return live
+
+    async def _seed(*keys: str) -> unittest.mock.Mock:
+        for key in keys:
+            await models.Issue.upsert(
+                schemas.IssueCreate.from_jira(
+                    jira_raw_factory(key=key, priority='Low'),
+                ),
+                session=api_db_session,
+            )
+        await api_db_session.commit()
+        return update
+
+    mosura.app.app.state.jira_client = types.SimpleNamespace(
+        issue=fetch_issue,
+    )
+    return _seed
+
+
+async def _priority(
+    key: str,
+    session: sqlalchemy.ext.asyncio.AsyncSession,
+) -> schemas.Priority:
+    issues = await models.Issue.get(key=key, closed=True, session=session)
+    return issues[0].priority
+
+
+async def test_patch_issue_priority_is_written_back(
+    client: niquests.AsyncSession,
+    api_db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    live_issues: Callable[..., Any],
+) -> None:
+    update = await live_issues('MOS-1')
+
+    response = await client.patch(
+        '/api/v0/issues/MOS-1', json={'priority': 'High'},
+    )
+
+    assert response.status_code == 204
+    update.assert_called_once_with(fields={'priority': {'name': 'High'}})
+    assert await _priority('MOS-1', api_db_session) == schemas.Priority.high
+
+
+async def test_patch_issues_writes_back_each_edit_which_went_through(
+    client: niquests.AsyncSession,
+    api_db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    live_issues: Callable[..., Any],
+) -> None:
+    update = await live_issues('MOS-1', 'MOS-2', 'MOS-500')
+
+    response = await client.patch(
+        '/api/v0/issues',
+        json=[
+            {'key': 'MOS-1', 'patch': {'priority': 'High'}},
+            {'key': 'MOS-500', 'patch': {'priority': 'High'}},
+            {'key': 'MOS-2', 'patch': {'priority': 'Medium'}},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {'key': 'MOS-1', 'status': 204, 'detail': None},
+        {'key': 'MOS-500', 'status': 502, 'detail': 'Connection reset'},
+        {'key': 'MOS-2', 'status': 204, 'detail': None},
+    ]
+    assert update.call_count == 2
+    assert await _priority('MOS-1', api_db_session) == schemas.Priority.high
+    assert await _priority('MOS-2', api_db_session) == (
+        schemas.Priority.medium
+    )
+    assert await _priority('MOS-500', api_db_session) == (
+        schemas.Priority.low
+    )
+
+
+async def test_patch_issue_respond_async_queues_a_priority_edit(
+    client: niquests.AsyncSession,
+    api_db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    live_issues: Callable[..., Any],
+) -> None:
+    # the issue page's priority dropdown sends exactly this
+    update = await live_issues('MOS-1')
+
+    response = await client.patch(
+        '/api/v0/issues/MOS-1',
+        json={'priority': 'High'},
+        headers={'Prefer': 'respond-async'},
+    )
+
+    assert response.status_code == 202
+    update.assert_not_called()
+    assert await _priority('MOS-1', api_db_session) == schemas.Priority.high
+
+    location = urllib.parse.urlsplit(response.headers['Location'])
+    response = await client.get(location.path)
+    assert response.status_code == 200
+    entry = schemas.OutboxEntry.model_validate(response.json())
+    assert entry.status == schemas.OutboxStatus.pending
+    assert entry.patch == schemas.IssuePatch(priority=schemas.Priority.high)
+    assert entry.original == schemas.IssuePatch(priority=schemas.Priority.low)
@@ -1,3 +1,4 @@
+import datetime
 import types
 import unittest.mock
 from collections.abc import Callable
@@ -8,6 +9,7 @@ import niquests
 import pytest
 
 import mosura.app
+from mosura import events
 from mosura import models
 from mosura import schemas
 
@@ -86,10 +88,13 @@ async def test_patch_issue_conflict(
     issue_from_jira_factory: Callable[..., schemas.Issue],
     jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
 ) -> None:
-    raw = jira_raw_factory(key='MOS-777', summary='Canonical summary')
     cached_issue = issue_from_jira_factory(
-        raw,
-        summary='Changed summary locally',
+        jira_raw_factory(key='MOS-777', summary='Stale summary'),
+    )
+    raw = jira_raw_factory(
+        key='MOS-777',
+        summary='Canonical summary',
+        updated='2026-01-03T00:00:00.000000+00:00',
     )
 
     get_mock = unittest.mock.AsyncMock(return_value=[cached_issue])
@@ -126,11 +131,14 @@ async def test_patch_issue_conflict(
         'This issue was modified in Jira while you were editing it, '
         'please refresh the page and try again.'
     )
-    jira_issue.assert_called_once_with(
-        id='MOS-777',
-        fields=schemas.Issue.jira_fields(),
-        expand='renderedFields',
-    )
+    assert jira_issue.call_args_list == [
+        unittest.mock.call(id='MOS-777', fields=['updated', 'summary']),
+        unittest.mock.call(
+            id='MOS-777',
+            fields=schemas.Issue.jira_fields(),
+            expand='renderedFields',
+        ),
+    ]
     schedule_refresh_mock.assert_called_once_with(
         app=mosura.app.app,
         key='MOS-777',
@@ -140,6 +148,93 @@ async def test_patch_issue_conflict(
     api_session.commit.assert_not_awaited()
 
 
+async def test_patch_issue_compares_whole_issue_once_updated_moves(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    jira_raw_factory: Callable[..., dict[str, Any]],
+    issue_from_jira_factory: Callable[..., schemas.Issue],
+    jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
+) -> None:
+    raw = jira_raw_factory(key='MOS-205')
+    cached_issue = issue_from_jira_factory(raw)
+    # eg. a comment: the timestamp moves, but none of the synced fields do
+    fields = raw['fields'] | {'updated': '2026-01-03T00:00:00.000000+00:00'}
+    moved = jira_issue_factory(raw | {'fields': fields})
+    fields_equal = jira_issue_factory(raw)
+    update_mock = unittest.mock.Mock()
+    monkeypatch.setattr(moved, 'update', update_mock, raising=False)
+
+    jira_issue = unittest.mock.MagicMock(side_effect=[moved, fields_equal])
+    mosura.app.app.state.jira_client = types.SimpleNamespace(issue=jira_issue)
+    get_mock = unittest.mock.AsyncMock(return_value=[cached_issue])
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+    monkeypatch.setattr(models.Issue, 'upsert', unittest.mock.AsyncMock())
+
+    response = await client.patch(
+        '/api/v0/issues/MOS-205', json={'summary': 'Updated summary'},
+    )
+
+    assert response.status_code == 204
+    assert jira_issue.call_count == 2
+    update_mock.assert_called_once_with(fields={'summary': 'Updated summary'})
+    api_session.commit.assert_awaited_once()
+
+
+async def test_patch_issue_respond_async_queues_the_edit(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    cached_issue = issue_factory('MOS-206', summary='Old summary')
+    entry = schemas.OutboxEntry(
+        entry_id=3,
+        key='MOS-206',
+        patch=schemas.IssuePatch(summary='New summary'),
+        original=schemas.IssuePatch(summary='Old summary'),
+        created=datetime.datetime(2026, 1, 5, tzinfo=datetime.UTC),
+    )
+    add_mock = unittest.mock.AsyncMock(return_value=entry)
+    upsert_mock = unittest.mock.AsyncMock()
+    jira_issue = unittest.mock.MagicMock()
+    mosura.app.app.state.jira_client = types.SimpleNamespace(issue=jira_issue)
+    monkeypatch.setattr(
+        models.Issue, 'get',
+        unittest.mock.AsyncMock(return_value=[cached_issue]),
+    )
+    monkeypatch.setattr(models.Issue, 'upsert', upsert_mock)
+    monkeypatch.setattr(models.Outbox, 'add', add_mock)
+    monkeypatch.setattr(
+        models.Outbox, 'get', unittest.mock.AsyncMock(return_value=entry),
+    )
+
+    response = await client.patch(
+        '/api/v0/issues/MOS-206',
+        json={'summary': 'New summary'},
+        headers={'Prefer': 'respond-async'},
+    )
+
+    assert response.status_code == 202
+    assert response.headers['Location'] == 'http://default/api/v0/outbox/3'
+    assert response.json()['status'] == 'pending'
+    jira_issue.assert_not_called()
+    add_mock.assert_awaited_once_with(
+        cached_issue, schemas.IssuePatch(summary='New summary'),
+        session=api_session,
+    )
+    assert upsert_mock.await_args is not None
+    assert upsert_mock.await_args.args[0].summary == 'New summary'
+    api_session.commit.assert_awaited_once()
+    assert mosura.app.app.state.outbox.is_set()
+
+    response = await client.get('/api/v0/outbox/3')
+    assert response.status_code == 200
+    assert response.json()['patch'] == {
+        'priority': None, 'summary': 'New summary',
+    }
+
+
 async def test_patch_issue_success(  # pylint: disable=too-many-locals
     client: niquests.AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
@@ -173,17 +268,17 @@ async def test_patch_issue_success(  # pylint: disable=too-many-locals
     monkeypatch.setattr(models.Issue, 'get', get_mock)
     monkeypatch.setattr(models.Issue, 'upsert', upsert_mock)
 
-    response = await client.patch(
-        '/api/v0/issues/MOS-204',
-        json={'summary': 'Updated summary', 'priority': 'High'},
-    )
+    with events.from_app(mosura.app.app).subscribe() as changes:
+        response = await client.patch(
+            '/api/v0/issues/MOS-204',
+            json={'summary': 'Updated summary', 'priority': 'High'},
+        )
     print('PATCH success:', response.status_code, response.text)
 
     assert response.status_code == 204
+    # the timestamp is unchanged, so the whole issue is never fetched
     jira_issue.assert_called_once_with(
-        id='MOS-204',
-        fields=schemas.Issue.jira_fields(),
-        expand='renderedFields',
+        id='MOS-204', fields=['updated', 'priority', 'summary'],
     )
     update_mock.assert_called_once_with(
         fields={
@@ -203,6 +298,9 @@ async def test_patch_issue_success(  # pylint: disable=too-many-locals
     assert updated_issue.priority == schemas.Priority.high
 
     api_session.commit.assert_awaited_once()
+    assert changes.get_nowait() == schemas.ChangeSet(
+        generation=1, changed=['MOS-204'], assignees=['Test User'],
+    )
 
 
 async def test_get_settings_returns_null_when_no_setting(
@@ -339,3 +437,34 @@ async def test_patch_settings_null_clears_setting(
     }
     delete_mock.assert_awaited_once_with('custom_jql', session=api_session)
     api_session.commit.assert_awaited_once()
+
+
+async def test_search_issues_returns_ranked_results(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+) -> None:
+    results = [
+        schemas.SearchResult(
+            key='MOS-1',
+            summary='Fix flaky exporter',
+            status='Backlog',
+            snippet='Fix <mark>flaky</mark> exporter',
+        ),
+    ]
+    search_mock = unittest.mock.AsyncMock(return_value=results)
+    monkeypatch.setattr(models.Issue, 'search', search_mock)
+
+    response = await client.get('/api/v0/search?q=flaky&limit=5')
+    print('GET search:', response.status_code, response.text)
+
+    assert response.status_code == 200
+    assert response.json() == [{
+        'key': 'MOS-1',
+        'summary': 'Fix flaky exporter',
+        'status': 'Backlog',
+        'snippet': 'Fix <mark>flaky</mark> exporter',
+    }]
+    search_mock.assert_awaited_once_with(
+        'flaky', limit=5, session=api_session,
+    )
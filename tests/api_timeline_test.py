@@ -0,0 +1,139 @@
+import datetime
+import unittest.mock
+from collections.abc import Callable
+
+import niquests
+import pytest
+
+import mosura.app
+from mosura import models
+from mosura import schemas
+
+
+def _freeze_today(monkeypatch: pytest.MonkeyPatch, day: datetime.date) -> None:
+    frozen = datetime.datetime.combine(day, datetime.time(12), datetime.UTC)
+    original_now = datetime.datetime.now
+
+    def _fake_now(tz: object = None) -> datetime.datetime:
+        return frozen if tz is not None else original_now()
+
+    fake_cls = type(
+        'FakeDatetime',
+        (datetime.datetime,),
+        {'now': staticmethod(_fake_now)},
+    )
+    monkeypatch.setattr('mosura.api.datetime.datetime', fake_cls)
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_read_timeline_returns_compact_range(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+    transition_factory: Callable[..., schemas.IssueTransition],
+) -> None:
+    issue = issue_factory(
+        'MOS-1',
+        status='In Progress',
+        assignee='TestUser',
+        startdate=datetime.date(2026, 3, 2),
+        created=datetime.datetime(2026, 2, 25, 9, 0, tzinfo=datetime.UTC),
+        timeestimate=datetime.timedelta(days=2),
+    )
+    unestimated = issue_factory(
+        'MOS-2',
+        status='Backlog',
+        assignee='TestUser',
+        timeestimate=datetime.timedelta(0),
+    )
+    history = schemas.IssueHistory.from_transitions(
+        issue,
+        [
+            transition_factory(
+                key='MOS-1',
+                from_status='Backlog',
+                to_status='In Progress',
+                timestamp=datetime.datetime(
+                    2026, 3, 3, 9, 0, tzinfo=datetime.UTC,
+                ),
+            ),
+        ],
+    )
+    issue_get = unittest.mock.AsyncMock(return_value=[issue, unestimated])
+    monkeypatch.setattr(models.Issue, 'get', issue_get)
+    monkeypatch.setattr(
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={'MOS-1': history}),
+    )
+    mosura.app.app.state.tracked_user_name = 'TestUser'
+    _freeze_today(monkeypatch, datetime.date(2026, 3, 6))
+
+    # covers the whole weeks around the requested dates
+    response = await client.get(
+        '/api/v0/timeline?start=2026-03-04&end=2026-03-10',
+    )
+
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    assert issue_get.await_args is not None
+    assert issue_get.await_args.kwargs['window'] == (
+        datetime.date(2026, 3, 2), datetime.date(2026, 3, 16),
+    )
+    assert response.json() == {
+        'start': '2026-03-02',
+        'end': '2026-03-16',
+        'current_date': '2026-03-06',
+        'issues': [
+            {
+                'key': 'MOS-1',
+                'summary': 'MOS-1',
+                'status': 'In Progress',
+                'startdate': '2026-03-02',
+                'estimated_completion': '2026-03-04',
+                'overdue': True,
+                'overdue_start': False,
+                'segments': [
+                    ['2026-03-02', '2026-03-03', 'Backlog', 'backlog'],
+                    [
+                        '2026-03-03', '2026-03-06', 'In Progress',
+                        'in-progress',
+                    ],
+                ],
+            },
+        ],
+        'attention': [
+            {
+                'key': 'MOS-2',
+                'summary': 'MOS-2',
+                'assignee': 'TestUser',
+                'status': 'Backlog',
+                'startdate': '2024-01-01',
+                'timeestimate': 0.0,
+            },
+        ],
+    }
+
+
+@pytest.mark.usefixtures('api_session')
+@pytest.mark.parametrize(
+    ('start', 'end'),
+    [
+        ('2026-03-04', '2026-03-04'),
+        ('2026-03-04', '2026-03-01'),
+        ('2026-01-01', '2027-03-01'),
+    ],
+)
+async def test_read_timeline_rejects_empty_or_oversized_ranges(
+    start: str,
+    end: str,
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    issue_get = unittest.mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(models.Issue, 'get', issue_get)
+    mosura.app.app.state.tracked_user_name = 'TestUser'
+
+    response = await client.get(f'/api/v0/timeline?start={start}&end={end}')
+
+    assert response.status_code == 422
+    issue_get.assert_not_awaited()
@@ -6,6 +6,7 @@ import types
 import unittest.mock
 import warnings
 from collections.abc import Callable
+from typing import cast
 
 import fastapi
 import niquests
@@ -81,6 +82,43 @@ def test_resolve_tracked_user_prefers_matching_account_id() -> None:
     assert resolved.displayName == 'Bob'
 
 
+def test_resolve_team_starts_with_tracked_user() -> None:
+    app = fastapi.FastAPI()
+    app.state.settings = types.SimpleNamespace(jira_team=['bob', 'acct-3'])
+    app.state.tracked_user_id = 'acct-1'
+    app.state.tracked_user_name = 'Alice'
+    app.state.jira_client = types.SimpleNamespace(
+        search_users=unittest.mock.Mock(
+            side_effect=[
+                [types.SimpleNamespace(accountId='acct-2', displayName='Bob')],
+                [
+                    types.SimpleNamespace(accountId='acct-3', displayName='C'),
+                    types.SimpleNamespace(accountId='acct-4', displayName='D'),
+                ],
+            ],
+        ),
+    )
+
+    team = mosura.app.resolve_team(app)
+
+    assert list(team.items()) == [
+        ('acct-1', 'Alice'), ('acct-2', 'Bob'), ('acct-3', 'C'),
+    ]
+
+
+def test_resolve_team_raises_on_ambiguous_member() -> None:
+    app = fastapi.FastAPI()
+    app.state.settings = types.SimpleNamespace(jira_team=['bob'])
+    app.state.tracked_user_id = 'acct-1'
+    app.state.tracked_user_name = 'Alice'
+    app.state.jira_client = types.SimpleNamespace(
+        search_users=unittest.mock.Mock(return_value=[]),
+    )
+
+    with pytest.raises(RuntimeError, match='"bob" matched 0 Jira users'):
+        mosura.app.resolve_team(app)
+
+
 async def test_lifespan_fails_fast_if_tracked_user_is_unresolvable(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -112,6 +150,10 @@ async def test_lifespan_starts_background_tasks(
     app = fastapi.FastAPI()
     settings = types.SimpleNamespace(
         jira_tracked_user='account-123',
+        jira_team=[],
+        mosura_cache_size=100,
+        mosura_reload_templates=False,
+        mosura_template_cache=False,
     )
     jira_client = types.SimpleNamespace()
 
@@ -174,6 +216,7 @@ async def test_lifespan_starts_background_tasks(
     )
     monkeypatch.setattr(database, 'build_sessionmaker', unittest.mock.Mock())
     monkeypatch.setattr('mosura.app.tasks.spawn', spawn)
+    monkeypatch.setattr('mosura.app.outbox.push', unittest.mock.AsyncMock())
 
     async with mosura.app.lifespan(app):
         pass
@@ -195,7 +238,7 @@ def _mock_issue_get(
     Build a mock for ``models.Issue.get`` that dispatches on kwargs.
 
     Handles two calls in home():
-    - assignee=..., closed=False -> my_issues
+    - assignee=..., closed=False, limit=... -> my_issues, as ordered
     - assignee=..., closed=True -> timeline_issues
     """
     if timeline_issues is None:
@@ -207,7 +250,7 @@ def _mock_issue_get(
         # Handle assignee + closed combination
         if kwargs.get('assignee'):
             if kwargs.get('closed') is False:
-                return my_issues.copy()
+                return my_issues[:cast(int | None, kwargs.get('limit'))]
             if kwargs.get('closed') is True:
                 return timeline_issues.copy()
         # Handle needs_triage (legacy, should not be called in new
@@ -239,8 +282,8 @@ async def test_home_returns_200_with_section_headings(
         ),
     )
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=[]),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -268,8 +311,8 @@ async def test_home_limits_my_issues_to_5(
         ),
     )
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=[]),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -284,26 +327,26 @@ async def test_home_limits_my_issues_to_5(
 
 
 @pytest.mark.usefixtures('api_session')
-async def test_home_sorts_my_issues_by_priority_descending(
+async def test_home_reads_top_issues_in_priority_order(
     client: niquests.AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
     issue_factory: Callable[..., schemas.Issue],
 ) -> None:
+    # N.B. as returned by the query, which orders and limits them
     my = [
-        issue_factory('MY-L', priority=schemas.Priority.low),
         issue_factory('MY-U', priority=schemas.Priority.urgent),
+        issue_factory('MY-H', priority=schemas.Priority.high),
         issue_factory('MY-M', priority=schemas.Priority.medium),
+        issue_factory('MY-L', priority=schemas.Priority.low),
         issue_factory('MY-N', priority=schemas.Priority.unknown),
-        issue_factory('MY-H', priority=schemas.Priority.high),
     ]
-    monkeypatch.setattr(
-        models.Issue, 'get', _mock_issue_get(
-            my_issues=my, timeline_issues=[],
-        ),
+    get = unittest.mock.AsyncMock(
+        side_effect=_mock_issue_get(my_issues=my, timeline_issues=[]),
     )
+    monkeypatch.setattr(models.Issue, 'get', get)
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=[]),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -311,17 +354,11 @@ async def test_home_sorts_my_issues_by_priority_descending(
 
     assert response.text is not None
     html = response.text
-    # Find the order of issue keys in the rendered HTML
-    positions = {
-        key: html.index(key) for key in [
-            'MY-U', 'MY-H', 'MY-M', 'MY-L', 'MY-N',
-        ]
-    }
-    print(f'Priority order positions: {positions}')
-    assert positions['MY-U'] < positions['MY-H']
-    assert positions['MY-H'] < positions['MY-M']
-    assert positions['MY-M'] < positions['MY-L']
-    assert positions['MY-L'] < positions['MY-N']
+    positions = [html.index(issue.key) for issue in my]
+    assert positions == sorted(positions)
+    get.assert_any_await(
+        assignee='TestUser', closed=False, limit=5, session=unittest.mock.ANY,
+    )
 
 
 @pytest.mark.usefixtures('api_session')
@@ -335,8 +372,8 @@ async def test_home_empty_states(
         ),
     )
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=[]),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -386,8 +423,14 @@ async def test_home_timeline_renders_gantt_chart(
         ),
     )
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=transitions),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(
+            return_value={
+                issue.key: schemas.IssueHistory.from_transitions(
+                    issue, transitions,
+                ),
+            },
+        ),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -421,8 +464,8 @@ async def test_home_timeline_has_no_date_navigation(
         ),
     )
     monkeypatch.setattr(
-        models.IssueTransition, 'get_by_keys',
-        unittest.mock.AsyncMock(return_value=[]),
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -453,6 +496,9 @@ async def test_timeline_header_shows_full_range(
     # Timeline has 4 navigation links: prev month, prev week, next week, next
     # month
     assert html.count('class="timeline-picker-link"') == 4
+    # the client pans from the selected week without reloading the page
+    assert 'data-monday="2026-03-02"' in html
+    assert 'data-weeks-before="3" data-weeks-after="5"' in html
 
 
 @pytest.mark.usefixtures('api_session')
@@ -503,13 +549,15 @@ async def test_timeline_uses_issue_transitions_for_segments(
     ]
 
     issue_get = unittest.mock.AsyncMock(return_value=[issue])
-    transition_get = unittest.mock.AsyncMock(return_value=transitions)
-    monkeypatch.setattr(models.Issue, 'get', issue_get)
-    monkeypatch.setattr(
-        models.IssueTransition,
-        'get_by_keys',
-        transition_get,
+    history_get = unittest.mock.AsyncMock(
+        return_value={
+            issue.key: schemas.IssueHistory.from_transitions(
+                issue, transitions,
+            ),
+        },
     )
+    monkeypatch.setattr(models.Issue, 'get', issue_get)
+    monkeypatch.setattr(models.IssueHistory, 'get_many', history_get)
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
     frozen = datetime.datetime(2026, 3, 4, 12, 0, 0, tzinfo=datetime.UTC)
@@ -528,13 +576,15 @@ async def test_timeline_uses_issue_transitions_for_segments(
     response = await client.get('/timeline?date=2026-03-04')
 
     assert response.status_code == 200
-    transition_get.assert_awaited_once()
+    # the selected week, then the prefetched previous and next weeks
+    assert history_get.await_count == 3
     assert response.text is not None
     html = response.text
     assert 'status-needs-triage' in html
     assert 'status-in-progress' in html
     assert 'status-ready-for-testing' not in html
-    assert 'title="Code Review: 2026-03-02 to 2026-03-02"' in html
+    # only in Code Review for part of a day, so drawn under the next segment
+    assert 'title="Code Review:' not in html
     assert 'title="Ready for Testing: 2026-03-02 to 2026-03-08"' in html
     assert html.count('has-transition-marker') >= 2
 
@@ -560,12 +610,10 @@ async def test_timeline_overdue_tooltip_includes_status(
     )
 
     issue_get = unittest.mock.AsyncMock(return_value=[issue])
-    transition_get = unittest.mock.AsyncMock(return_value=[])
     monkeypatch.setattr(models.Issue, 'get', issue_get)
     monkeypatch.setattr(
-        models.IssueTransition,
-        'get_by_keys',
-        transition_get,
+        models.IssueHistory, 'get_many',
+        unittest.mock.AsyncMock(return_value={}),
     )
     mosura.app.app.state.tracked_user_name = 'TestUser'
 
@@ -575,3 +623,139 @@ async def test_timeline_overdue_tooltip_includes_status(
     assert response.text is not None
     html = response.text
     assert 'title="In Progress: overdue since 2026-03-01"' in html
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_search_page_renders_highlighted_results(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    search = unittest.mock.AsyncMock(
+        return_value=[
+            schemas.SearchResult(
+                key='MOS-1',
+                summary='<b>Fix</b> exporter',
+                status='Backlog',
+                snippet='the <mark>flaky</mark> one',
+            ),
+        ],
+    )
+    monkeypatch.setattr(models.Issue, 'search', search)
+
+    response = await client.get('/search?q=flaky')
+
+    assert response.status_code == 200
+    assert response.text is not None
+    html = response.text
+    assert 'the <mark>flaky</mark> one' in html
+    assert '&lt;b&gt;Fix&lt;/b&gt; exporter' in html
+    assert 'value="flaky"' in html
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_issue_list_renders_first_page_with_next_link(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    issues = [issue_factory('MOS-1', components=['API'], labels=['ops'])]
+    monkeypatch.setattr(
+        models.Issue, 'paginate',
+        unittest.mock.AsyncMock(
+            return_value=(
+                issues, schemas.IssueCursor(priority_rank=2, key='MOS-1'),
+            ),
+        ),
+    )
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=250),
+    )
+    monkeypatch.setattr(
+        models.Issue, 'get_meta',
+        unittest.mock.AsyncMock(return_value=schemas.Meta.from_issues(issues)),
+    )
+
+    response = await client.get('/issues')
+
+    assert response.status_code == 200
+    assert response.text is not None
+    html = response.text
+    assert '<table' in html
+    assert 'MOS-1' in html
+    assert 'data-next="http://default/issues?after=2%3AMOS-1"' in html
+    assert '<span id="total">250</span> in total' in html
+    assert response.headers['X-Total-Count'] == '250'
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_issue_list_partial_renders_rows_only(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    paginate = unittest.mock.AsyncMock(
+        return_value=([issue_factory('MOS-9')], None),
+    )
+    get_meta = unittest.mock.AsyncMock()
+    monkeypatch.setattr(models.Issue, 'paginate', paginate)
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=101),
+    )
+    monkeypatch.setattr(models.Issue, 'get_meta', get_meta)
+    mosura.app.app.state.tracked_user_name = 'TestUser'
+
+    response = await client.get('/mine?after=2:MOS-1&partial=1')
+
+    assert response.status_code == 200
+    assert response.text is not None
+    html = response.text
+    assert html.lstrip().startswith('<tr')
+    assert 'MOS-9' in html
+    assert '<table' not in html
+    assert 'Link' not in response.headers
+    get_meta.assert_not_awaited()
+    assert paginate.await_args is not None
+    assert paginate.await_args.kwargs['assignee'] == 'TestUser'
+    assert paginate.await_args.kwargs['after'] == schemas.IssueCursor(
+        priority_rank=2, key='MOS-1',
+    )
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_issue_list_filters_and_sorts_server_side(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    issues = [issue_factory('MOS-1', status='Backlog')]
+    paginate = unittest.mock.AsyncMock(return_value=(issues, None))
+    count = unittest.mock.AsyncMock(return_value=1)
+    monkeypatch.setattr(models.Issue, 'paginate', paginate)
+    monkeypatch.setattr(models.Issue, 'count', count)
+    monkeypatch.setattr(
+        models.Issue, 'get_meta',
+        unittest.mock.AsyncMock(return_value=schemas.Meta.from_issues(issues)),
+    )
+
+    response = await client.get(
+        '/triage?status=Backlog,Blocked&assignee=&sort=-votes',
+    )
+
+    assert response.status_code == 200
+    assert response.text is not None
+    assert 'value="Backlog,Blocked"' in response.text
+    assert 'class="sorted descending"' in response.text
+    filters = schemas.IssueFilter(
+        assignees=frozenset(), statuses=frozenset({'Backlog', 'Blocked'}),
+    )
+    assert paginate.await_args is not None
+    assert paginate.await_args.kwargs['filters'] == filters
+    assert paginate.await_args.kwargs['order'] == schemas.IssueOrder(
+        sort=schemas.IssueSort.votes, descending=True,
+    )
+    assert paginate.await_args.kwargs['needs_triage'] is True
+    assert count.await_args is not None
+    assert count.await_args.kwargs['filters'] == filters
+
+    response = await client.get('/issues?sort=colour')
+    assert response.status_code == 422
@@ -0,0 +1,151 @@
+import unittest.mock
+from collections.abc import Callable
+
+import niquests
+import pytest
+
+import mosura.app
+from mosura import cache
+from mosura import models
+from mosura import schemas
+from mosura import ui
+
+
+def test_readcache_serves_entries_only_at_their_generation() -> None:
+    read_cache = cache.ReadCache()
+    read_cache.observe(5)
+    read_cache.store('key', 5, ['value'])
+
+    assert read_cache.lookup('key', 5) == (True, ['value'])
+    assert read_cache.lookup('key', 6) == (False, None)
+    assert read_cache.lookup('other', 5) == (False, None)
+    assert (read_cache.hits, read_cache.misses) == (1, 2)
+
+
+def test_readcache_observe_only_moves_forwards() -> None:
+    read_cache = cache.ReadCache()
+    read_cache.observe(5)
+    read_cache.store('key', 5, 'value')
+
+    read_cache.observe(4)
+    assert read_cache.generation == 5
+    assert len(read_cache) == 1
+
+    read_cache.observe(6)
+    assert read_cache.generation == 6
+    assert len(read_cache) == 0
+
+
+def test_readcache_drops_results_read_at_a_stale_generation() -> None:
+    read_cache = cache.ReadCache()
+    read_cache.observe(6)
+
+    read_cache.store('key', 5, 'value')
+
+    assert len(read_cache) == 0
+
+
+def test_readcache_evicts_least_recently_used_by_weight() -> None:
+    read_cache = cache.ReadCache(capacity=6)
+    read_cache.observe(1)
+    read_cache.store('a', 1, [1, 2])
+    read_cache.store('b', 1, ([1, 2], None))
+    read_cache.lookup('a', 1)
+
+    read_cache.store('c', 1, 0)
+    assert len(read_cache) == 3
+
+    read_cache.store('d', 1, [1, 2])
+    assert read_cache.lookup('b', 1) == (False, None)
+    assert read_cache.lookup('a', 1) == (True, [1, 2])
+    assert read_cache.lookup('d', 1) == (True, [1, 2])
+
+    # never worth evicting everything for a single oversized entry
+    read_cache.store('huge', 1, list(range(10)))
+    assert len(read_cache) == 3
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_read_issue_is_served_from_cache_until_a_write(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    get_mock = unittest.mock.AsyncMock(return_value=[issue_factory('MOS-1')])
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+
+    for _ in range(3):
+        response = await client.get('/api/v0/issues/MOS-1')
+        assert response.status_code == 200
+
+    get_mock.assert_awaited_once()
+    read_cache = cache.from_app(mosura.app.app)
+    assert (read_cache.hits, read_cache.misses) == (2, 1)
+
+    monkeypatch.setattr(
+        models.Generation, 'get', unittest.mock.AsyncMock(return_value=2),
+    )
+    await cache.refresh(mosura.app.app)
+
+    response = await client.get('/api/v0/issues/MOS-1')
+    assert response.status_code == 200
+    assert get_mock.await_count == 2
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_timeline_weeks_are_memoized_and_neighbours_prefetched(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    get_mock = unittest.mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+    mosura.app.app.state.tracked_user_name = 'TestUser'
+
+    response = await client.get('/timeline?date=2026-03-04')
+    assert response.status_code == 200
+    # the selected week, then its neighbours in the background
+    assert get_mock.await_count == 3
+
+    # any day of an already computed week is served from memory, and only
+    # the newly adjacent week gets prefetched
+    response = await client.get('/timeline?date=2026-03-12')
+    assert response.status_code == 200
+    assert get_mock.await_count == 4
+
+    response = await client.get('/timeline?date=2026-03-06')
+    assert response.status_code == 200
+    assert get_mock.await_count == 4
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_issue_rows_are_rendered_once_per_generation(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    monkeypatch.setattr(
+        models.Issue, 'paginate',
+        unittest.mock.AsyncMock(return_value=([issue_factory('MOS-1')], None)),
+    )
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=1),
+    )
+    template = ui.templates.get_template('issues.rows.html')
+    render = unittest.mock.Mock(wraps=template.render)
+    monkeypatch.setattr(template, 'render', render)
+
+    for _ in range(2):
+        response = await client.get('/issues?partial=1')
+        assert response.status_code == 200
+        assert response.text is not None
+        assert 'MOS-1' in response.text
+    render.assert_called_once()
+
+    monkeypatch.setattr(
+        models.Generation, 'get', unittest.mock.AsyncMock(return_value=2),
+    )
+    await cache.refresh(mosura.app.app)
+
+    response = await client.get('/issues?partial=1')
+    assert response.status_code == 200
+    assert render.call_count == 2
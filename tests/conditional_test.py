@@ -0,0 +1,136 @@
+import unittest.mock
+
+import niquests
+import pytest
+import starlette.requests
+
+import mosura.app
+from mosura import cache
+from mosura import conditional
+from mosura import models
+
+
+def _request(
+        query: str = '',
+        headers: dict[str, str] | None = None,
+) -> starlette.requests.Request:
+    return starlette.requests.Request({
+        'type': 'http',
+        'method': 'GET',
+        'path': '/issues',
+        'query_string': query.encode(),
+        'headers': [
+            (k.lower().encode(), v.encode())
+            for k, v in (headers or {}).items()
+        ],
+    })
+
+
+def test_make_etag_changes_with_generation_request_and_extra() -> None:
+    etag = conditional.make_etag(_request('a=1&b=2'), 7)
+
+    assert etag.startswith('W/"7-')
+    assert etag == conditional.make_etag(_request('b=2&a=1'), 7)
+    assert etag != conditional.make_etag(_request('a=1&b=2'), 8)
+    assert etag != conditional.make_etag(_request('a=1'), 7)
+    assert etag != conditional.make_etag(_request('a=1&b=2'), 7, 'today')
+    assert etag != conditional.make_etag(
+        _request('a=1&b=2', {'Accept': 'application/x-ndjson'}), 7,
+    )
+
+
+@pytest.mark.parametrize(
+    ('header', 'expected'),
+    [
+        (None, False),
+        ('"1-abc"', True),
+        ('W/"1-abc"', True),
+        ('"0-old", "1-abc"', True),
+        ('*', True),
+        ('"1-abcd"', False),
+    ],
+)
+def test_matches_uses_weak_comparison(
+    header: str | None,
+    expected: bool,
+) -> None:
+    headers = {'If-None-Match': header} if header else {}
+
+    request = _request(headers=headers)
+
+    assert conditional.matches(request, '"1-abc"') is expected
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_read_issues_answers_304_until_the_generation_changes(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    get_mock = unittest.mock.AsyncMock(return_value=[])
+    count_mock = unittest.mock.AsyncMock(return_value=0)
+    monkeypatch.setattr(models.Issue, 'get', get_mock)
+    monkeypatch.setattr(models.Issue, 'count', count_mock)
+
+    response = await client.get('/api/v0/issues')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert isinstance(etag, str)
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = await client.get(
+        '/api/v0/issues', headers={'If-None-Match': etag},
+    )
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert not response.content
+
+    # the same weak tag validates the gzipped copy
+    response = await client.get(
+        '/api/v0/issues',
+        headers={'If-None-Match': etag, 'Accept-Encoding': 'gzip'},
+    )
+    assert response.status_code == 304
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    # only the generation was consulted
+    assert get_mock.await_count == 1
+    assert count_mock.await_count == 1
+
+    # a write commits, and the writer picks up the new generation
+    monkeypatch.setattr(
+        models.Generation, 'get', unittest.mock.AsyncMock(return_value=2),
+    )
+    await cache.refresh(mosura.app.app)
+    response = await client.get(
+        '/api/v0/issues', headers={'If-None-Match': etag},
+    )
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert get_mock.await_count == 2
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_issue_list_page_answers_304_for_current_etag(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    paginate_mock = unittest.mock.AsyncMock(return_value=([], None))
+    monkeypatch.setattr(models.Issue, 'paginate', paginate_mock)
+    monkeypatch.setattr(
+        models.Issue, 'count', unittest.mock.AsyncMock(return_value=0),
+    )
+    monkeypatch.setattr(
+        models.Issue, 'get_meta',
+        unittest.mock.AsyncMock(return_value=None),
+    )
+
+    response = await client.get('/issues?partial=1')
+    etag = response.headers['ETag']
+    assert isinstance(etag, str)
+
+    response = await client.get(
+        '/issues?partial=1', headers={'If-None-Match': etag},
+    )
+
+    assert response.status_code == 304
+    paginate_mock.assert_awaited_once()
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import datetime
 import pathlib
@@ -17,7 +18,9 @@ import sqlalchemy.ext.asyncio
 import sqlalchemy.orm
 
 import mosura.app
+from mosura import cache
 from mosura import database
+from mosura import events
 from mosura import models
 from mosura import schemas
 
@@ -26,8 +29,17 @@ class SyncSessionAdapter:
     def __init__(self, db_session: sqlalchemy.orm.Session) -> None:
         self._db_session = db_session
 
-    async def execute(self, statement: Any) -> Any:
-        return self._db_session.execute(statement)
+    async def execute(self, statement: Any, params: Any = None) -> Any:
+        return self._db_session.execute(statement, params)
+
+    async def stream(self, statement: Any) -> AsyncIterator[Any]:
+        result = self._db_session.execute(statement)
+
+        async def rows() -> AsyncIterator[Any]:
+            for row in result:
+                yield row
+
+        return rows()
 
     async def commit(self) -> None:
         self._db_session.commit()
@@ -35,9 +47,15 @@ class SyncSessionAdapter:
 
 @pytest.fixture(scope='function')
 async def client() -> AsyncIterator[niquests.AsyncSession]:
+    mosura.app.app.state.read_cache = cache.ReadCache()
+    mosura.app.app.state.lane_cache = cache.TaggedCache()
+    mosura.app.app.state.events = events.Broker()
+    mosura.app.app.state.outbox = asyncio.Event()
     async with niquests.AsyncSession(
         app=mosura.app.app,
     ) as c:
+        # the in-process transport never decodes response bodies
+        c.headers['Accept-Encoding'] = 'identity'
         yield c
 
 
@@ -288,7 +306,7 @@ def issue_rows_fetcher(
     async def _fetch(*, key: str | None = None) -> list[models.IssueRow]:
         query = (
             sqlalchemy.select(
-                models.Issue.__table__,
+                *models.Issue.read_columns(),
                 models.Component.component,
                 models.Label.label,
             )
@@ -317,6 +335,30 @@ def issue_rows_fetcher(
     return _fetch
 
 
+@pytest.fixture(scope='function')
+def api_db_session(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+) -> sqlalchemy.ext.asyncio.AsyncSession:
+    # as api_session, but backed by a real database
+    @contextlib.asynccontextmanager
+    async def fake_session_from_app(
+        _app: fastapi.FastAPI,
+    ) -> AsyncIterator[sqlalchemy.ext.asyncio.AsyncSession]:
+        yield db_session
+
+    async def run_inline(
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(database, 'session_from_app', fake_session_from_app)
+    monkeypatch.setattr('mosura.api.asyncio.to_thread', run_inline)
+    return db_session
+
+
 @pytest.fixture(scope='function')
 def api_session(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
     session = types.SimpleNamespace(commit=unittest.mock.AsyncMock())
@@ -340,4 +382,9 @@ def api_session(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
         fake_session_from_app,
     )
     monkeypatch.setattr('mosura.api.asyncio.to_thread', run_inline)
+    monkeypatch.setattr(
+        models.Generation,
+        'get',
+        unittest.mock.AsyncMock(return_value=1),
+    )
     return session
@@ -0,0 +1,58 @@
+import pathlib
+
+import sqlalchemy
+
+from mosura import database
+from mosura import models
+
+
+def test_initialize_rebuilds_outdated_cache_but_keeps_settings(
+    tmp_path: pathlib.Path,
+) -> None:
+    engine = sqlalchemy.create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            'CREATE TABLE settings (key VARCHAR PRIMARY KEY, value VARCHAR)',
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO settings VALUES ('custom_jql', 'project = MOS')",
+        )
+        conn.exec_driver_sql('CREATE TABLE issues (key VARCHAR PRIMARY KEY)')
+        conn.exec_driver_sql("INSERT INTO issues VALUES ('MOS-1')")
+
+    with engine.begin() as conn:
+        database.initialize(conn)
+
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql('PRAGMA user_version').scalar()
+        issues = conn.execute(sqlalchemy.select(models.Issue.key)).all()
+        setting = conn.execute(
+            sqlalchemy.select(models.Setting.value),
+        ).scalar_one()
+        fts = conn.exec_driver_sql('SELECT count(*) FROM issues_fts').scalar()
+
+    assert version == models.SCHEMA_VERSION
+    assert not issues
+    assert setting == 'project = MOS'
+    assert fts == 0
+    engine.dispose()
+
+
+def test_initialize_keeps_current_cache(tmp_path: pathlib.Path) -> None:
+    engine = sqlalchemy.create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    with engine.begin() as conn:
+        database.initialize(conn)
+        conn.execute(
+            sqlalchemy.insert(models.Task).values(
+                key='fetch', variant='desired', latest=None,
+            ),
+        )
+
+    with engine.begin() as conn:
+        database.initialize(conn)
+
+    with engine.connect() as conn:
+        tasks = conn.execute(sqlalchemy.select(models.Task.key)).all()
+
+    assert [task.key for task in tasks] == ['fetch']
+    engine.dispose()
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+import mosura.app
+from mosura import cache
+from mosura import events
+from mosura import schemas
+
+
+def test_broker_replaces_backlog_of_slow_subscribers_with_resync() -> None:
+    broker = events.Broker(buffer_size=2)
+
+    with broker.subscribe() as slow, broker.subscribe() as fast:
+        for generation in (1, 2):
+            broker.publish(
+                schemas.ChangeSet(generation=generation, changed=['MOS-1']),
+            )
+            assert fast.get_nowait().generation == generation
+        broker.publish(schemas.ChangeSet(generation=3, removed=['MOS-2']))
+
+        assert slow.qsize() == 1
+        assert slow.get_nowait() == schemas.ChangeSet(
+            generation=3, resync=True,
+        )
+        assert fast.get_nowait().removed == ['MOS-2']
+        assert len(broker) == 2
+
+    assert len(broker) == 0
+
+
+def test_publish_skips_writes_which_changed_nothing() -> None:
+    mosura.app.app.state.events = events.Broker()
+
+    with events.from_app(mosura.app.app).subscribe() as changes:
+        events.publish(mosura.app.app, 4)
+        events.publish(mosura.app.app, 5, changed={'MOS-2', 'MOS-1'})
+
+    assert changes.get_nowait() == schemas.ChangeSet(
+        generation=5, changed=['MOS-1', 'MOS-2'],
+    )
+    assert changes.empty()
+
+
+async def test_stream_resyncs_reconnecting_clients_then_follows_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(events, 'KEEPALIVE', 0.01)
+    mosura.app.app.state.events = events.Broker()
+    mosura.app.app.state.read_cache = cache.ReadCache()
+    mosura.app.app.state.read_cache.observe(7)
+
+    stream = events.stream(mosura.app.app, last_event_id='5')
+    try:
+        resync = await anext(stream)
+        assert resync.startswith('id: 7\nevent: change\ndata: ')
+        assert json.loads(resync.split('data: ')[1])['resync'] is True
+
+        assert await anext(stream) == ': keepalive\n\n'
+
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        events.publish(mosura.app.app, 8, changed=['MOS-1'])
+        change = await pending
+        assert change == events.format_event(
+            schemas.ChangeSet(generation=8, changed=['MOS-1']),
+        )
+    finally:
+        await stream.aclose()
+
+    assert len(events.from_app(mosura.app.app)) == 0
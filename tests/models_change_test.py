@@ -0,0 +1,102 @@
+import datetime
+from collections.abc import Callable
+
+import sqlalchemy.ext.asyncio
+
+from mosura import models
+from mosura import schemas
+
+
+async def test_change_since_reports_latest_write_per_key(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    for key in ('MOS-1', 'MOS-2', 'MOS-3'):
+        await models.Issue.upsert(
+            issue_create_factory(key, status='Backlog', assignee=None),
+            session=db_session,
+        )
+    await db_session.commit()
+    start = await models.Generation.get(session=db_session)
+
+    assert await models.Change.since(start, session=db_session) == (
+        schemas.ChangeSet(generation=start)
+    )
+
+    await models.Issue.upsert(
+        issue_create_factory('MOS-1', status='Done', assignee=None),
+        session=db_session,
+    )
+    await models.Issue.hard_delete('MOS-2', session=db_session)
+    await db_session.commit()
+
+    changes = await models.Change.since(start, session=db_session)
+    assert changes == schemas.ChangeSet(
+        generation=start + 2, changed=['MOS-1'], removed=['MOS-2'],
+    )
+    assert await models.Change.since(0, session=db_session) == (
+        schemas.ChangeSet(generation=start + 2, resync=True)
+    )
+    assert await models.Change.since(start + 3, session=db_session) == (
+        schemas.ChangeSet(generation=start + 2, resync=True)
+    )
+
+
+async def test_change_since_survives_rewrites_of_old_keys(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    # rewriting the oldest keys must not move the horizon past a reader
+    for key in ('MOS-1', 'MOS-2', 'MOS-1'):
+        await models.Issue.upsert(
+            issue_create_factory(key, status='Backlog', assignee=None),
+            session=db_session,
+        )
+    await db_session.commit()
+    start = await models.Generation.get(session=db_session)
+
+    for key in ('MOS-2', 'MOS-1'):
+        await models.Issue.upsert(
+            issue_create_factory(key, status='Done', assignee=None),
+            session=db_session,
+        )
+    await db_session.commit()
+
+    assert await models.Change.since(start, session=db_session) == (
+        schemas.ChangeSet(generation=start + 2, changed=['MOS-1', 'MOS-2'])
+    )
+
+
+async def test_change_compact_drops_old_deletions(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    for key in ('MOS-1', 'MOS-2'):
+        await models.Issue.upsert(
+            issue_create_factory(key, status='Backlog', assignee=None),
+            session=db_session,
+        )
+    await db_session.commit()
+    start = await models.Generation.get(session=db_session)
+    await models.Issue.hard_delete('MOS-2', session=db_session)
+    await db_session.commit()
+
+    now = datetime.datetime.now(datetime.UTC)
+    dropped = await models.Change.compact(
+        before=now - datetime.timedelta(days=1), session=db_session,
+    )
+    assert dropped == 0
+
+    dropped = await models.Change.compact(
+        before=now + datetime.timedelta(days=1), session=db_session,
+    )
+    await db_session.commit()
+    assert dropped == 1
+
+    # readers from before the deletion can no longer learn of it
+    assert await models.Change.since(start, session=db_session) == (
+        schemas.ChangeSet(generation=start + 1, resync=True)
+    )
+    assert await models.Change.since(start + 1, session=db_session) == (
+        schemas.ChangeSet(generation=start + 1)
+    )
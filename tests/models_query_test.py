@@ -0,0 +1,273 @@
+import datetime
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import sqlalchemy.ext.asyncio
+
+from mosura import models
+from mosura import schemas
+
+
+async def test_issue_paginate_walks_priority_then_key_order(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    for key, priority in [
+            ('MOS-1', schemas.Priority.low),
+            ('MOS-2', schemas.Priority.urgent),
+            ('MOS-3', schemas.Priority.low),
+            ('MOS-4', schemas.Priority.high),
+            ('MOS-5', schemas.Priority.unknown),
+    ]:
+        await seed_issue(
+            issue_create_factory(
+                key, status='Backlog', assignee='Ada', priority=priority,
+            ),
+            components=['API', 'Platform'],
+            labels=['feature', 'ops'],
+        )
+    await db_session.commit()
+
+    pages = []
+    cursor = None
+    while True:
+        issues, cursor = await models.Issue.paginate(
+            limit=2, after=cursor, session=db_session,
+        )
+        pages.append([issue.key for issue in issues])
+        if cursor is None:
+            break
+
+    assert pages == [['MOS-2', 'MOS-4'], ['MOS-1', 'MOS-3'], ['MOS-5']]
+    assert await models.Issue.count(session=db_session) == 5
+
+    # joined rows don't leak into the page size
+    first, _ = await models.Issue.paginate(limit=2, session=db_session)
+    assert [len(issue.components) for issue in first] == [2, 2]
+
+
+async def test_issue_get_meta_covers_all_matching_issues(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1', status='In Progress', assignee='Ada',
+            priority=schemas.Priority.high,
+        ),
+        components=['API'],
+        labels=['feature'],
+    )
+    await seed_issue(
+        issue_create_factory(
+            'MOS-2', status='Backlog', assignee=None,
+            priority=schemas.Priority.low,
+        ),
+        components=['Platform'],
+        labels=[],
+    )
+    await seed_issue(
+        issue_create_factory('MOS-3', status='Closed', assignee='Bob'),
+        components=['Legacy'],
+        labels=['old'],
+    )
+    await db_session.commit()
+
+    meta = await models.Issue.get_meta(session=db_session)
+
+    assert meta == schemas.Meta(
+        assignees=['Ada', 'None'],
+        components=['API', 'Platform'],
+        labels=['feature'],
+        priorities=[schemas.Priority.high, schemas.Priority.low],
+        statuses=['Backlog', 'In Progress'],
+    )
+
+
+async def test_issue_stream_matches_get(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1', status='Backlog', assignee='Ada',
+            priority=schemas.Priority.low,
+        ),
+        components=['API', 'Platform'],
+        labels=['ops'],
+    )
+    await seed_issue(
+        issue_create_factory(
+            'MOS-2', status='Backlog', assignee=None,
+            priority=schemas.Priority.urgent,
+        ),
+    )
+    await seed_issue(
+        issue_create_factory('MOS-3', status='Closed', assignee='Ada'),
+        components=['API'],
+    )
+    await db_session.commit()
+
+    streamed = [
+        issue async for issue in models.Issue.stream(session=db_session)
+    ]
+
+    assert [issue.key for issue in streamed] == ['MOS-2', 'MOS-1']
+    assert streamed == await models.Issue.get(session=db_session)
+
+
+async def test_issue_project_reads_only_requested_fields(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    for key, priority in [
+            ('MOS-1', schemas.Priority.low),
+            ('MOS-2', schemas.Priority.urgent),
+            ('MOS-3', schemas.Priority.high),
+    ]:
+        await seed_issue(
+            issue_create_factory(
+                key, status='Backlog', assignee='Ada', priority=priority,
+            ),
+            components=['Platform', 'API'],
+        )
+    await db_session.commit()
+
+    rows, cursor = await models.Issue.project(
+        frozenset({'key', 'status', 'components'}), limit=2,
+        session=db_session,
+    )
+
+    assert [row['key'] for row in rows] == ['MOS-2', 'MOS-3']
+    assert 'description' not in rows[0]
+    assert rows[0]['status'] == 'Backlog'
+    assert rows[0]['components'] == [
+        {'key': 'MOS-2', 'component': 'API'},
+        {'key': 'MOS-2', 'component': 'Platform'},
+    ]
+    assert cursor == schemas.IssueCursor(priority_rank=3, key='MOS-3')
+
+    rows, cursor = await models.Issue.project(
+        frozenset({'key', 'created'}), after=cursor, session=db_session,
+    )
+
+    assert [row['key'] for row in rows] == ['MOS-1']
+    assert rows[0]['created'].tzinfo == datetime.UTC
+    assert 'labels' not in rows[0]
+    assert cursor is None
+
+
+async def test_issue_get_window_only_skips_issues_outside_the_timeline(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    def at(day: datetime.date) -> datetime.datetime:
+        return datetime.datetime.combine(day, datetime.time(12), datetime.UTC)
+
+    today = datetime.date(2026, 3, 11)
+    start, end = schemas.Timeline.get_window(today, today, 1, 1)
+    assert start == datetime.date(2026, 3, 2)
+    assert end == datetime.date(2026, 3, 23)
+    long_ago = start.replace(year=2020)
+
+    for key, status, created, updated in [
+            ('OLD-OPEN', 'Backlog', long_ago, long_ago),
+            ('OLD-CLOSED', 'Closed', long_ago, start.replace(year=2021)),
+            ('ENDS-AT-START', 'Closed', long_ago, start),
+            ('ENDS-INSIDE', 'Closed', long_ago, today),
+            ('CREATED-AT-END', 'Closed', end, end),
+            ('INSIDE', 'Closed', start, end),
+    ]:
+        await seed_issue(
+            issue_create_factory(
+                key, status=status, assignee='Ada', created=at(created),
+                updated=at(updated),
+            ),
+        )
+    await db_session.commit()
+
+    everything = await models.Issue.get(
+        assignee='Ada', closed=True, session=db_session,
+    )
+    windowed = await models.Issue.get(
+        assignee='Ada', closed=True, window=(start, end), session=db_session,
+    )
+
+    assert sorted(issue.key for issue in windowed) == [
+        'ENDS-AT-START', 'ENDS-INSIDE', 'INSIDE', 'OLD-OPEN',
+    ]
+
+    def render(issues: list[schemas.Issue]) -> schemas.Timeline:
+        return schemas.Timeline.from_issues(
+            issues, selected_date=today, current_date=today,
+            weeks_before=1, weeks_after=1,
+        )
+
+    assert render(windowed) == render(everything)
+
+
+async def test_issue_paginate_filters_and_sorts_in_sql(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    for key, assignee, votes, components in [
+            ('MOS-1', 'Ada', 3, ['API']),
+            ('MOS-2', None, 5, ['API', 'Platform']),
+            ('MOS-3', 'Bob', 3, ['Platform']),
+            ('MOS-4', 'Ada', 9, []),
+            ('MOS-5', 'Bob', 1, ['API']),
+    ]:
+        await seed_issue(
+            issue_create_factory(
+                key, status='Backlog', assignee=assignee, votes=votes,
+            ),
+            components=components,
+            labels=['ops'],
+        )
+    await db_session.commit()
+
+    filters = schemas.IssueFilter.parse(
+        assignees='Bob,None', components='API,Platform',
+    )
+    order = schemas.IssueOrder.parse('-votes')
+    pages = []
+    cursor = None
+    while True:
+        issues, cursor = await models.Issue.paginate(
+            limit=2, after=cursor, filters=filters, order=order,
+            session=db_session,
+        )
+        pages.append([issue.key for issue in issues])
+        if cursor is None:
+            break
+
+    assert pages == [['MOS-2', 'MOS-3'], ['MOS-5']]
+    assert await models.Issue.count(
+        filters=filters, session=db_session,
+    ) == 3
+    # every component of a matching issue is still returned
+    assert [len(x.components) for x in issues] == [1]
+
+    by_assignee = await models.Issue.get(
+        order=schemas.IssueOrder.parse('assignee'), session=db_session,
+    )
+    assert [x.key for x in by_assignee] == [
+        'MOS-2', 'MOS-1', 'MOS-4', 'MOS-3', 'MOS-5',
+    ]
+
+    by_key, cursor = await models.Issue.paginate(
+        limit=3, order=schemas.IssueOrder.parse('-key'), session=db_session,
+    )
+    assert [x.key for x in by_key] == ['MOS-5', 'MOS-4', 'MOS-3']
+    by_key, cursor = await models.Issue.paginate(
+        limit=3, after=cursor, order=schemas.IssueOrder.parse('-key'),
+        session=db_session,
+    )
+    assert [x.key for x in by_key] == ['MOS-2', 'MOS-1']
+    assert cursor is None
@@ -0,0 +1,149 @@
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import sqlalchemy.ext.asyncio
+
+from mosura import models
+from mosura import schemas
+
+
+async def test_issue_search_matches_summary_and_stripped_description(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1',
+            status='Backlog',
+            assignee='Ada',
+            summary='Rotate database credentials',
+            description='<p>Use the <strong>vault</strong> CLI</p>',
+        ),
+    )
+    await seed_issue(
+        issue_create_factory(
+            'MOS-2',
+            status='Closed',
+            assignee='Bob',
+            summary='Unrelated work',
+            description='<p>Nothing to see</p>',
+        ),
+    )
+    await db_session.commit()
+
+    by_summary = await models.Issue.search('credentials', session=db_session)
+    assert [result.key for result in by_summary] == ['MOS-1']
+    assert by_summary[0].summary == 'Rotate database credentials'
+    assert by_summary[0].status == 'Backlog'
+    assert '<mark>credentials</mark>' in by_summary[0].snippet
+
+    by_description = await models.Issue.search('vault', session=db_session)
+    assert [result.key for result in by_description] == ['MOS-1']
+
+    # markup is never indexed
+    assert not await models.Issue.search('strong', session=db_session)
+
+
+async def test_issue_search_ranks_summary_hits_first(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1',
+            status='Backlog',
+            assignee='Ada',
+            summary='Tidy up dashboards',
+            description='<p>The flaky exporter breaks this too</p>',
+        ),
+    )
+    await seed_issue(
+        issue_create_factory(
+            'MOS-2',
+            status='Backlog',
+            assignee='Ada',
+            summary='Fix flaky exporter',
+            description='<p>See logs</p>',
+        ),
+    )
+    await db_session.commit()
+
+    results = await models.Issue.search('flaky export', session=db_session)
+
+    assert [result.key for result in results] == ['MOS-2', 'MOS-1']
+
+
+async def test_issue_search_follows_upserts_and_deletes(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1',
+            status='Backlog',
+            assignee='Ada',
+            summary='Original title',
+        ),
+    )
+    await db_session.commit()
+
+    await models.Issue.upsert(
+        issue_create_factory(
+            'MOS-1',
+            status='Backlog',
+            assignee='Ada',
+            summary='Renamed title',
+        ),
+        session=db_session,
+    )
+    await db_session.commit()
+
+    assert not await models.Issue.search('original', session=db_session)
+    renamed = await models.Issue.search('renamed', session=db_session)
+    assert [result.key for result in renamed] == ['MOS-1']
+
+    await models.Issue.hard_delete('MOS-1', session=db_session)
+    await db_session.commit()
+
+    assert not await models.Issue.search('renamed', session=db_session)
+    rows = await db_session.execute(
+        sqlalchemy.text('SELECT count(*) FROM issues_fts'),
+    )
+    assert rows.scalar() == 0
+
+
+async def test_issue_search_treats_query_syntax_as_plain_text(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    await seed_issue(
+        issue_create_factory(
+            'MOS-1',
+            status='Backlog',
+            assignee='Ada',
+            summary='Handle "quoted" input AND friends',
+        ),
+    )
+    await db_session.commit()
+
+    results = await models.Issue.search(
+        '"quoted AND (fri',
+        session=db_session,
+    )
+
+    assert [result.key for result in results] == ['MOS-1']
+    assert not await models.Issue.search('" * ()', session=db_session)
+
+
+def test_issue_search_highlight_escapes_content() -> None:
+    highlighted = models.IssueSearch.highlight(
+        '<script>\x02match\x03</script>',
+    )
+
+    assert highlighted == (
+        '&lt;script&gt;<mark>match</mark>&lt;/script&gt;'
+    )
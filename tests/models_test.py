@@ -26,7 +26,7 @@ async def test_convert_field_response_dedupes_and_sorts(
     converted = models.convert_field_response(
         'MOS-1',
         rows,
-        idx=11,
+        idx=13,
         name='component',
     )
 
@@ -320,6 +320,8 @@ async def test_issue_upsert_updates_existing_issue(
     assert fetched[0].priority == schemas.Priority.high
     assert fetched[0].votes == 9
     assert fetched[0].startdate == datetime.date(2026, 2, 1)
+    assert fetched[0].status_category == 'in-progress'
+    assert fetched[0].status_rank == 2
 
     rows = await db_session.execute(
         sqlalchemy.select(models.Issue).where(models.Issue.key == 'MOS-9'),
@@ -327,6 +329,29 @@ async def test_issue_upsert_updates_existing_issue(
     assert len(rows.scalars().all()) == 1
 
 
+async def test_issue_transition_reads_back_stored_categories(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+    transition_factory: Callable[..., schemas.IssueTransition],
+) -> None:
+    await seed_issue(
+        issue_create_factory('MOS-9', status='Closed', assignee='Ada'),
+    )
+    await models.IssueTransition.upsert(
+        transition_factory(key='MOS-9', from_status=None, to_status='Done'),
+        session=db_session,
+    )
+    await db_session.commit()
+
+    [transition] = await models.IssueTransition.get_by_keys(
+        ['MOS-9'], session=db_session,
+    )
+
+    assert transition.from_category is None
+    assert transition.to_category == 'closed'
+
+
 async def test_setting_get_returns_none_for_missing_key(
     db_session: sqlalchemy.ext.asyncio.AsyncSession,
 ) -> None:
@@ -393,3 +418,55 @@ async def test_task_get_returns_utc_and_none_for_missing(
 
     missing = await models.Task.get('MOS', 'closed', session=db_session)
     assert missing is None
+
+
+async def test_generation_is_bumped_by_issue_writes(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    assert await models.Generation.get(session=db_session) == 0
+
+    await models.Issue.upsert(
+        issue_create_factory('MOS-1', status='Backlog', assignee=None),
+        session=db_session,
+    )
+    await db_session.commit()
+    first = await models.Generation.get(session=db_session)
+    assert first > 0
+
+    await models.Issue.hard_delete('MOS-1', session=db_session)
+    await db_session.commit()
+    assert await models.Generation.get(session=db_session) == first + 1
+
+
+async def test_generation_is_bumped_per_assignee(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    assert await models.Generation.get_assignees(
+        ('Alice', 'Bob'), session=db_session,
+    ) == {'Alice': 0, 'Bob': 0}
+
+    await models.Issue.upsert(
+        issue_create_factory('MOS-1', status='Backlog', assignee='Alice'),
+        session=db_session,
+    )
+    await db_session.commit()
+    first = await models.Generation.get_assignees(
+        ('Alice', 'Bob'), session=db_session,
+    )
+    assert first['Alice'] > 0
+    assert first['Bob'] == 0
+
+    # a reassignment changes both lanes
+    await models.Issue.upsert(
+        issue_create_factory('MOS-1', status='Backlog', assignee='Bob'),
+        session=db_session,
+    )
+    await db_session.commit()
+    second = await models.Generation.get_assignees(
+        ('Alice', 'Bob'), session=db_session,
+    )
+    assert second['Alice'] == first['Alice'] + 1
+    assert second['Bob'] > 0
+    assert await models.Generation.get_lanes(session=db_session) == second
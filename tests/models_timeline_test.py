@@ -0,0 +1,114 @@
+import datetime
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import sqlalchemy.ext.asyncio
+
+from mosura import models
+from mosura import schemas
+
+
+def _at(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time(9), datetime.UTC)
+
+
+async def test_issue_history_round_trips_and_matches_replayed_timeline(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+    transition_factory: Callable[..., schemas.IssueTransition],
+) -> None:
+    today = datetime.date(2026, 3, 11)
+    issue = issue_create_factory(
+        'MOS-1', status='In Progress', assignee='Ada',
+        created=_at(datetime.date(2025, 6, 2)),
+    )
+    transitions = [
+        transition_factory(
+            key='MOS-1', from_status='Backlog', to_status=status,
+            timestamp=_at(day),
+        )
+        for status, day in [
+            ('In Progress', datetime.date(2025, 7, 1)),
+            ('Backlog', datetime.date(2025, 8, 1)),
+            ('In Progress', datetime.date(2026, 3, 4)),
+        ]
+    ]
+    await seed_issue(issue)
+    for transition in transitions:
+        await models.IssueTransition.upsert(transition, session=db_session)
+    await models.IssueHistory.rebuild(issue, session=db_session)
+    await db_session.commit()
+
+    window = schemas.Timeline.get_window(today, today, 1, 1)
+    histories = await models.IssueHistory.get_many(
+        ['MOS-1', 'MOS-unknown'], window=window, session=db_session,
+    )
+
+    assert 'MOS-unknown' not in histories
+    # the first two segments ended long before this window
+    history = histories['MOS-1']
+    assert history.started
+    assert history.segments == [
+        schemas.HistorySegment(
+            start=datetime.date(2025, 8, 1),
+            end=datetime.date(2026, 3, 4),
+            status='Backlog',
+        ),
+        schemas.HistorySegment(
+            start=datetime.date(2026, 3, 4),
+            end=None,
+            status='In Progress',
+            estimated_end=datetime.date(2025, 7, 2),
+        ),
+    ]
+
+    [stored] = await models.Issue.get(key='MOS-1', session=db_session)
+    rendered = schemas.Timeline.from_histories(
+        [stored], histories, selected_date=today, current_date=today,
+        weeks_before=1, weeks_after=1,
+    )
+    replayed = schemas.Timeline.from_issues(
+        [stored], transitions={'MOS-1': transitions}, selected_date=today,
+        current_date=today, weeks_before=1, weeks_after=1,
+    )
+    assert rendered == replayed
+
+
+async def test_issue_history_rebuild_replaces_previous_rows(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+    seed_issue: Callable[..., Awaitable[None]],
+) -> None:
+    issue = issue_create_factory(
+        'MOS-1', status='Backlog', assignee='Ada',
+        created=_at(datetime.date(2026, 3, 2)),
+    )
+    await seed_issue(issue)
+    await models.IssueHistory.rebuild(issue, session=db_session)
+    closed = issue_create_factory(
+        'MOS-1', status='Closed', assignee='Ada',
+        created=_at(datetime.date(2026, 3, 2)),
+        updated=_at(datetime.date(2026, 3, 5)),
+    )
+    await models.IssueHistory.rebuild(closed, session=db_session)
+    await db_session.commit()
+
+    window = (datetime.date(2026, 3, 1), datetime.date(2026, 4, 1))
+    histories = await models.IssueHistory.get_many(
+        ['MOS-1'], window=window, session=db_session,
+    )
+
+    assert histories['MOS-1'].segments == [
+        schemas.HistorySegment(
+            start=datetime.date(2026, 3, 2),
+            end=datetime.date(2026, 3, 5),
+            status='Closed',
+        ),
+    ]
+
+    await models.Issue.hard_delete('MOS-1', session=db_session)
+    await db_session.commit()
+    assert not await models.IssueHistory.get_many(
+        ['MOS-1'], window=window, session=db_session,
+    )
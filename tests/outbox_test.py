@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+import datetime
+import types
+import unittest.mock
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+
+import fastapi
+import jira
+import pytest
+import sqlalchemy.ext.asyncio
+
+from mosura import database
+from mosura import models
+from mosura import outbox
+from mosura import schemas
+from mosura import tasks
+
+
+@pytest.fixture(name='app')
+def _app(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+) -> fastapi.FastAPI:
+    @contextlib.asynccontextmanager
+    async def fake_session_from_app(
+        _app: fastapi.FastAPI,
+    ) -> AsyncIterator[sqlalchemy.ext.asyncio.AsyncSession]:
+        yield db_session
+
+    async def run_inline(
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(database, 'session_from_app', fake_session_from_app)
+    monkeypatch.setattr(asyncio, 'to_thread', run_inline)
+
+    app = fastapi.FastAPI()
+    app.state.outbox = asyncio.Event()
+    return app
+
+
+@pytest.fixture(name='refresh')
+def _refresh(monkeypatch: pytest.MonkeyPatch) -> unittest.mock.AsyncMock:
+    refresh = unittest.mock.AsyncMock()
+    monkeypatch.setattr(tasks, 'refresh_issue_by_key', refresh)
+    return refresh
+
+
+@pytest.fixture(name='queue_edit')
+def _queue_edit(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    issue_factory: Callable[..., schemas.Issue],
+) -> Callable[..., Awaitable[schemas.OutboxEntry]]:
+    async def _queue(key: str, **patch: str) -> schemas.OutboxEntry:
+        entry = await models.Outbox.add(
+            issue_factory(key, summary='Old summary'),
+            schemas.IssuePatch.model_validate(patch),
+            session=db_session,
+        )
+        await db_session.commit()
+        return entry
+
+    return _queue
+
+
+def _live_issue(
+    jira_raw_factory: Callable[..., dict[str, Any]],
+    jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
+    summary: str,
+) -> tuple[jira.Issue, unittest.mock.Mock]:
+    live_issue = jira_issue_factory(jira_raw_factory(summary=summary))
+    update = unittest.mock.Mock()
+    live_issue.update = update  # type: ignore[method-assign]
+    return live_issue, update
+
+
+async def test_outbox_holds_later_edits_behind_pending_ones(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    queue_edit: Callable[..., Awaitable[schemas.OutboxEntry]],
+) -> None:
+    first = await queue_edit('MOS-1', summary='First')
+    await queue_edit('MOS-1', summary='Second')
+    other = await queue_edit('MOS-2', priority='High')
+    now = datetime.datetime.now(datetime.UTC)
+
+    assert first.original == schemas.IssuePatch(summary='Old summary')
+    assert other.original == schemas.IssuePatch(priority='Medium')
+    due = await models.Outbox.due(now=now, session=db_session)
+    assert [x.entry_id for x in due] == [first.entry_id, other.entry_id]
+
+    await models.Outbox.resolve(
+        first.entry_id, schemas.OutboxStatus.pending, attempts=1, error='timeout',
+        next_attempt=now + datetime.timedelta(minutes=1), session=db_session,
+    )
+    due = await models.Outbox.due(now=now, session=db_session)
+    assert [x.entry_id for x in due] == [other.entry_id]
+
+
+async def test_push_applies_edits_and_detects_conflicts(
+    app: fastapi.FastAPI,
+    refresh: unittest.mock.AsyncMock,
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    queue_edit: Callable[..., Awaitable[schemas.OutboxEntry]],
+    jira_raw_factory: Callable[..., dict[str, Any]],
+    jira_issue_factory: Callable[[dict[str, Any]], jira.Issue],
+) -> None:
+    applied = await queue_edit('MOS-1', summary='Mine')
+    conflict = await queue_edit('MOS-2', summary='Mine')
+    unchanged, applied_update = _live_issue(
+        jira_raw_factory, jira_issue_factory, 'Old summary',
+    )
+    theirs, conflict_update = _live_issue(
+        jira_raw_factory, jira_issue_factory, 'Theirs',
+    )
+    app.state.jira_client = types.SimpleNamespace(
+        issue=unittest.mock.Mock(side_effect=[unchanged, theirs]),
+    )
+
+    await outbox.push_due(app)
+
+    app.state.jira_client.issue.assert_any_call(
+        id='MOS-1', fields=['updated', 'summary'],
+    )
+    applied_update.assert_called_once_with(fields={'summary': 'Mine'})
+    conflict_update.assert_not_called()
+    entry = await models.Outbox.get(applied.entry_id, session=db_session)
+    assert entry is not None
+    assert (entry.status, entry.attempts) == (schemas.OutboxStatus.applied, 1)
+    entry = await models.Outbox.get(conflict.entry_id, session=db_session)
+    assert entry is not None
+    assert entry.status == schemas.OutboxStatus.conflict
+    # Jira has the last word either way
+    assert [x.kwargs['key'] for x in refresh.await_args_list] == [
+        'MOS-1', 'MOS-2',
+    ]
+
+
+async def test_push_retries_with_backoff_then_gives_up(
+    app: fastapi.FastAPI,
+    refresh: unittest.mock.AsyncMock,
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    queue_edit: Callable[..., Awaitable[schemas.OutboxEntry]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(outbox, 'MAX_ATTEMPTS', 2)
+    monkeypatch.setattr(outbox, 'RETRY_BACKOFF', datetime.timedelta())
+    queued = await queue_edit('MOS-1', summary='Mine')
+    app.state.jira_client = types.SimpleNamespace(
+        issue=unittest.mock.Mock(side_effect=TimeoutError('read timed out')),
+    )
+
+    await outbox.push_due(app)
+
+    entry = await models.Outbox.get(queued.entry_id, session=db_session)
+    assert entry is not None
+    assert entry.status == schemas.OutboxStatus.failed
+    assert (entry.attempts, entry.error) == (2, 'read timed out')
+    assert app.state.jira_client.issue.call_count == 2
+    refresh.assert_awaited_once_with(app=app, key='MOS-1')
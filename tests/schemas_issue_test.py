@@ -1,4 +1,5 @@
 import datetime
+import json
 import logging
 from collections.abc import Callable
 from typing import Any
@@ -38,6 +39,50 @@ def test_issuecreate_from_jira_normalizes_status(
     assert issue.enddate == datetime.date(2026, 1, 19)
 
 
+@pytest.mark.parametrize(
+    ('status', 'category', 'rank'),
+    [
+        ('Needs Triage', 'needs-triage', 0),
+        ('Backlog', 'backlog', 1),
+        ('Code Review', 'in-progress', 3),
+        ('Closed', 'closed', 5),
+        ('Blocked', 'blocked', 9),
+    ],
+)
+def test_issuecreate_derives_status_category_and_rank(
+    status: str,
+    category: str,
+    rank: int,
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    issue = issue_create_factory('MOS-1', status=status, assignee=None)
+
+    assert issue.status_category == category
+    assert issue.status_rank == rank
+    assert issue.status_sort_value == f'stat{rank}'
+
+
+def test_issuecreate_keeps_stored_status_category_and_rank(
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    stored = issue_create_factory('MOS-1', status='Backlog', assignee=None)
+    data = stored.model_dump() | {'status_category': 'x', 'status_rank': 7}
+
+    issue = schemas.IssueCreate.model_validate(data)
+
+    assert issue.status_category == 'x'
+    assert issue.status_rank == 7
+
+
+def test_issuetransition_derives_categories(
+    transition_factory: Callable[..., schemas.IssueTransition],
+) -> None:
+    transition = transition_factory(from_status='To Do', to_status='Done')
+
+    assert transition.from_category == 'backlog'
+    assert transition.to_category == 'closed'
+
+
 def test_issuecreate_from_jira_uses_timeestimate_when_due_date_is_missing(
     jira_raw_factory: Callable[..., dict[str, Any]],
 ) -> None:
@@ -125,3 +170,71 @@ def test_issuecreate_from_jira_parses_created_and_updated(
     )
     assert issue.created == expected_created
     assert issue.updated == expected_updated
+
+
+def test_issuecreate_description_text_strips_markup(
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    issue = issue_create_factory(
+        'MOS-1',
+        status='Backlog',
+        assignee=None,
+        description=(
+            '<p>First&nbsp;para</p><p>second <strong>bold</strong></p>'
+            '<ul><li>one</li><li>two</li></ul>'
+        ),
+    )
+
+    assert issue.description_text == 'First para second bold one two'
+
+
+def test_issuecreate_description_text_handles_missing_description(
+    issue_create_factory: Callable[..., schemas.IssueCreate],
+) -> None:
+    issue = issue_create_factory(
+        'MOS-1',
+        status='Backlog',
+        assignee=None,
+        description=None,
+    )
+
+    assert issue.description_text == ''
+
+
+def test_issuecursor_round_trips_through_its_string_form() -> None:
+    cursor = schemas.IssueCursor(priority_rank=3, key='MOS-12')
+
+    assert str(cursor) == '3:MOS-12'
+    assert schemas.IssueCursor.parse(str(cursor)) == cursor
+
+
+@pytest.mark.parametrize('value', ['', 'MOS-12', 'x:MOS-12', '3:'])
+def test_issuecursor_rejects_malformed_values(value: str) -> None:
+    with pytest.raises(ValueError, match='invalid'):
+        schemas.IssueCursor.parse(value)
+
+
+def test_issue_parse_fields_always_includes_key() -> None:
+    fields = schemas.Issue.parse_fields('status, priority,,')
+
+    assert fields == {'key', 'status', 'priority'}
+
+
+def test_issue_parse_fields_rejects_unknown_fields() -> None:
+    with pytest.raises(ValueError, match='unknown fields: bogus, rowid'):
+        schemas.Issue.parse_fields('key,rowid,bogus')
+
+
+def test_issue_dump_fields_matches_full_serialization(
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    issue = issue_factory('MOS-1', components=['API'], labels=['ops'])
+    fields = schemas.Issue.parse_fields(
+        'priority,startdate,updated,timeestimate,components',
+    )
+
+    dumped = json.loads(
+        schemas.Issue.dump_fields(fields, [issue.model_dump()]),
+    )
+
+    assert dumped == [issue.model_dump(mode='json', include=set(fields))]
@@ -3,6 +3,7 @@ import datetime
 import pytest
 
 from mosura.schemas.issue import IssueCreate
+from mosura.schemas.listing import IssueOrder
 
 
 @pytest.mark.parametrize(
@@ -20,3 +21,20 @@ def test_parse_timeestimate(
 ) -> None:
     x = IssueCreate.parse_timeestimate(original)
     assert x == expected
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        (None, '-priority'),
+        ('votes', 'votes'),
+        ('-summary', '-summary'),
+    ],
+)
+def test_issue_order_round_trips(value: str | None, expected: str) -> None:
+    assert str(IssueOrder.parse(value)) == expected
+
+
+def test_issue_order_rejects_unknown_sort() -> None:
+    with pytest.raises(ValueError):
+        IssueOrder.parse('-colour')
@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+
+from mosura import schemas
+from mosura.schemas.timeline import SEGMENT_SLOTS
+
+
+def _issue(*spans: tuple[int, int, str]) -> schemas.TimelineIssue:
+    day = datetime.date(2024, 1, 1)
+    return schemas.TimelineIssue(
+        key='MOS-1',
+        summary='MOS-1',
+        status=spans[-1][2],
+        created=day,
+        startdate=None,
+        segments=[
+            schemas.TimelineSegment(
+                day + datetime.timedelta(days=start),
+                day + datetime.timedelta(days=end),
+                status,
+            )
+            for start, end, status in spans
+        ],
+        estimated_completion=None,
+        overdue=False,
+        overdue_start=False,
+    )
+
+
+def _spans(issue: schemas.TimelineIssue) -> list[tuple[int, int, str]]:
+    day = datetime.date(2024, 1, 1)
+    return [
+        ((x.start - day).days, (x.end - day).days, x.status)
+        for x in issue.segments
+    ]
+
+
+def test_coalesce_folds_same_day_bounces_into_the_next_segment() -> None:
+    issue = _issue(
+        (0, 3, 'Backlog'),
+        (3, 3, 'In Progress'),
+        (3, 3, 'Needs Triage'),
+        (3, 8, 'Closed'),
+    )
+
+    issue.coalesce(1)
+
+    assert _spans(issue) == [(0, 3, 'Backlog'), (3, 8, 'Closed')]
+
+
+def test_coalesce_merges_repeated_statuses() -> None:
+    issue = _issue((0, 3, 'Backlog'), (3, 5, 'Backlog'))
+
+    issue.coalesce(1)
+
+    assert _spans(issue) == [(0, 5, 'Backlog')]
+
+
+@pytest.mark.parametrize(
+    ('resolution', 'expected'),
+    [
+        # wide enough to see, so the transition marker is kept
+        (1, [(0, 4, 'In Progress'), (4, 5, 'Code Review')]),
+        (3, [(0, 5, 'Code Review')]),
+    ],
+)
+def test_coalesce_merges_same_category_below_resolution(
+    resolution: int,
+    expected: list[tuple[int, int, str]],
+) -> None:
+    issue = _issue((0, 4, 'In Progress'), (4, 5, 'Code Review'))
+
+    issue.coalesce(resolution)
+
+    assert _spans(issue) == expected
+
+
+def test_calculate_rendering_bounds_segments_when_zoomed_out() -> None:
+    statuses = ('Backlog', 'In Progress', 'Needs Triage', 'Closed')
+    issue = _issue(*[(n, n + 1, statuses[n % 4]) for n in range(365)])
+    monday, boxes = schemas.Timeline.get_boxes(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 1), 0, 52,
+    )
+    timeline = schemas.Timeline([issue], [], monday, boxes)
+
+    timeline.calculate_rendering(datetime.date(2024, 1, 1))
+
+    assert len(issue.segments) <= SEGMENT_SLOTS + 1
+    assert issue.segments[0].start == datetime.date(2024, 1, 1)
+    assert issue.segments[-1].end == datetime.date(2024, 12, 31)
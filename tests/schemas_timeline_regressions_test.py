@@ -1,6 +1,9 @@
 import datetime
+import logging
 from collections.abc import Callable
 
+import pytest
+
 from mosura import schemas
 
 
@@ -89,3 +92,45 @@ def test_from_issues_does_not_shorten_open_segment_before_current_date(
     assert tli.estimated_completion == datetime.date(2024, 1, 7)
     assert tli.overdue
     assert ready_segment.end == current_date
+
+
+def test_from_histories_logs_and_drops_inverted_segments(
+    caplog: pytest.LogCaptureFixture,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    current_date = datetime.date(2024, 1, 10)
+    issue = issue_factory(
+        'TEST-5C',
+        status='In Progress',
+        timeestimate=datetime.timedelta(days=3),
+    )
+    history = schemas.IssueHistory(
+        key='TEST-5C',
+        estimated_completion=None,
+        started=True,
+        segments=[
+            schemas.HistorySegment(
+                start=datetime.date(2024, 1, 9),
+                end=datetime.date(2024, 1, 8),
+                status='Backlog',
+            ),
+            schemas.HistorySegment(
+                start=datetime.date(2024, 1, 9),
+                end=None,
+                status='In Progress',
+            ),
+        ],
+    )
+
+    with caplog.at_level(logging.ERROR, logger='mosura.schemas'):
+        timeline = schemas.Timeline.from_histories(
+            [issue],
+            {'TEST-5C': history},
+            selected_date=current_date,
+            current_date=current_date,
+            weeks_before=1,
+            weeks_after=1,
+        )
+
+    assert 'inverted dates for Backlog' in caplog.text
+    assert [x.status for x in timeline.issues[0].segments] == ['In Progress']
@@ -10,7 +10,8 @@ def test_from_issues_treats_root_caused_as_closed_for_end_dates(
     issue = issue_factory(
         'TEST-RC-1',
         summary='Root caused issue',
-        status='Root Caused',
+        # as stored at ingest
+        status=schemas.IssueCreate.parse_status('Root Caused'),
         startdate=datetime.date(2024, 1, 1),
         timeestimate=datetime.timedelta(days=5),
     )
@@ -0,0 +1,127 @@
+import gzip
+import os
+import pathlib
+import unittest.mock
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from typing import Any
+
+import fastapi
+import niquests
+import pytest
+
+import mosura.app
+from mosura import models
+from mosura import schemas
+from mosura import static
+
+
+@pytest.fixture(name='assets')
+def _assets(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / 'app.css').write_text('.gantt { color: red; }\n' * 100)
+    (tmp_path / 'tiny.js').write_text('let x = 1;\n')
+    (tmp_path / 'favicon.ico').write_bytes(b'\0' * 4096)
+    return tmp_path
+
+
+def test_compress_only_writes_worthwhile_assets(assets: pathlib.Path) -> None:
+    static.compress(str(assets))
+
+    assert sorted(x.name for x in assets.glob('*.gz')) == ['app.css.gz']
+    assert gzip.decompress((assets / 'app.css.gz').read_bytes()) == (
+        (assets / 'app.css').read_bytes()
+    )
+
+
+async def test_static_files_serve_precompressed_fingerprinted_assets(
+    assets: pathlib.Path,
+) -> None:
+    static.compress(str(assets))
+    app = fastapi.FastAPI()
+    static_files = static.StaticFiles(directory=str(assets))
+    app.mount('/static', static_files, name='static')
+    version = static_files.version('/app.css')
+    assert version
+
+    async with niquests.AsyncSession(app=app) as client:
+        response = await client.get(
+            f'/static/app.css?v={version}',
+            headers={'Accept-Encoding': 'gzip'},
+        )
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Content-Type'].startswith('text/css')
+        assert 'immutable' in response.headers['Cache-Control']
+        assert response.content is not None
+        assert gzip.decompress(response.content) == (
+            (assets / 'app.css').read_bytes()
+        )
+
+        response = await client.get(
+            '/static/app.css?v=stale',
+            headers={'Accept-Encoding': 'identity'},
+        )
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+        assert 'Cache-Control' not in response.headers
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+
+async def test_static_files_ignore_stale_precompressed_assets(
+    assets: pathlib.Path,
+) -> None:
+    static.compress(str(assets))
+    gzipped = assets / 'app.css.gz'
+    os.utime(gzipped, (0, 0))
+    app = fastapi.FastAPI()
+    app.mount('/static', static.StaticFiles(directory=str(assets)))
+
+    async with niquests.AsyncSession(app=app) as client:
+        response = await client.get(
+            '/static/app.css', headers={'Accept-Encoding': 'gzip'},
+        )
+
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_pages_are_compressed_and_link_fingerprinted_assets(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        models.Issue, 'get', unittest.mock.AsyncMock(return_value=[]),
+    )
+    mosura.app.app.state.tracked_user_name = 'TestUser'
+    version = mosura.app.app.state.static_files.version('/app.css')
+
+    response = await client.get(
+        '/timeline', headers={'Accept-Encoding': 'gzip'},
+    )
+
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.content is not None
+    html = gzip.decompress(response.content).decode()
+    assert f'/static/app.css?v={version}' in html
+
+
+@pytest.mark.usefixtures('api_session')
+async def test_streams_are_not_compressed(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    issue_factory: Callable[..., schemas.Issue],
+) -> None:
+    async def stream(**_kwargs: Any) -> AsyncIterator[schemas.Issue]:
+        for n in range(50):
+            yield issue_factory(f'MOS-{n}')
+
+    monkeypatch.setattr(models.Issue, 'stream', stream)
+
+    response = await client.get(
+        '/api/v0/issues?stream=1', headers={'Accept-Encoding': 'gzip'},
+    )
+
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
@@ -56,6 +56,7 @@ def _build_app(
     app = fastapi.FastAPI()
     app.state.tracked_user_id = tracked_user_id
     app.state.tracked_user_name = tracked_user_name
+    app.state.team = {tracked_user_id: tracked_user_name}
     app.state.jira_client = jira_client
     return app
 
@@ -195,6 +196,15 @@ async def test_changed_issue_resyncs_graph_and_transitions(
     )
     assert [t.to_status for t in transitions] == ['In Progress']
 
+    # the timeline history is rebuilt from the fresh transitions
+    histories = await models.IssueHistory.get_many(
+        ['MOS-1'],
+        window=(datetime.date(2026, 1, 1), datetime.date(2026, 2, 1)),
+        session=db_session,
+    )
+    assert histories['MOS-1'].started
+    assert histories['MOS-1'].segments[-1].status == 'In Progress'
+
 
 async def test_cold_start_fully_syncs_new_issue(
     db_session: sqlalchemy.ext.asyncio.AsyncSession,
@@ -252,6 +262,29 @@ async def test_non_tracked_user_never_fetches_changelog(
     assert not jira_client.changelog_fetches
 
 
+async def test_team_member_fetches_changelog(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+    jira_raw_factory: IssueFactory,
+) -> None:
+    jira_client = _FakeJiraClient(
+        [
+            jira_raw_factory(
+                key='MOS-1',
+                assignee='Bob',
+                updated='2026-01-06T10:00:00.000+0000',
+            ),
+        ],
+        histories=_STATUS_HISTORY,
+    )
+    app = _build_app(jira_client)
+    app.state.team['account-456'] = 'Bob'
+
+    await tasks.sync_desired_issues(app=app, session=db_session)
+    await db_session.commit()
+
+    assert jira_client.changelog_fetches == ['MOS-1']
+
+
 async def test_stale_issue_pruned_by_reconciliation(
     db_session: sqlalchemy.ext.asyncio.AsyncSession,
     issue_create_factory: Callable[..., schemas.IssueCreate],
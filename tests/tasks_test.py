@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import datetime
 import types
 import unittest.mock
 from collections.abc import AsyncIterator
@@ -11,8 +12,11 @@ import fastapi
 import pytest
 import requests
 
+from mosura import cache
 from mosura import database
+from mosura import events
 from mosura import models
+from mosura import schemas
 from mosura import tasks
 
 
@@ -56,6 +60,7 @@ def _build_app(
     )
     app.state.tracked_user_id = tracked_user_id
     app.state.tracked_user_name = tracked_user_name
+    app.state.team = {tracked_user_id: tracked_user_name}
     app.state.jira_client = types.SimpleNamespace()
     return app
 
@@ -93,6 +98,32 @@ async def test_sync_desired_issues_appends_custom_jql(
     ]
 
 
+async def test_sync_desired_issues_includes_team_members(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = _build_app()
+    app.state.team['account-456'] = 'Bob'
+    app.state.team['account-789'] = 'Carol'
+    search = unittest.mock.AsyncMock(return_value=[])
+
+    monkeypatch.setattr(tasks, '_search_issues', search)
+    monkeypatch.setattr(
+        models.Setting, 'get', unittest.mock.AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr(
+        models.Issue, 'get_updated_map',
+        unittest.mock.AsyncMock(return_value={}),
+    )
+
+    await tasks.sync_desired_issues(app=app, session=object())
+
+    assert search.await_args is not None
+    assert search.await_args.kwargs['jql'] == (
+        '(assignee = "account-123")'
+        'OR(assignee in ("account-456", "account-789"))'
+    )
+
+
 async def test_reconcile_stale_issues_deletes_stale_without_refetch(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -283,3 +314,63 @@ async def test_spawn_creates_single_desired_worker(
     assert len(fetched) == 1
     assert fetched[0] is app
     app.state.jira_client.project.assert_not_called()
+
+
+async def test_fetch_desired_publishes_changed_and_removed_keys(
+    monkeypatch: pytest.MonkeyPatch,
+    api_session: types.SimpleNamespace,
+) -> None:
+    app = _build_app()
+    app.state.read_cache = cache.ReadCache()
+    app.state.events = events.Broker()
+    before = {
+        'MOS-1': datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        'MOS-2': datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+    }
+    after = {
+        'MOS-1': datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        'MOS-3': datetime.datetime(2026, 1, 2, tzinfo=datetime.UTC),
+    }
+    monkeypatch.setattr(
+        models.Issue, 'get_updated_map',
+        unittest.mock.AsyncMock(side_effect=[before, after]),
+    )
+    monkeypatch.setattr(
+        tasks, 'sync_desired_issues',
+        unittest.mock.AsyncMock(return_value={'MOS-1', 'MOS-3'}),
+    )
+    monkeypatch.setattr(
+        tasks, 'reconcile_stale_issues',
+        unittest.mock.AsyncMock(return_value={'MOS-2'}),
+    )
+    monkeypatch.setattr(
+        models.Task, 'get', unittest.mock.AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr(models.Task, 'upsert', unittest.mock.AsyncMock())
+    monkeypatch.setattr(
+        models.Generation, 'get_lanes',
+        unittest.mock.AsyncMock(
+            side_effect=[
+                {'Alice': 1, 'Bob': 1}, {'Alice': 1, 'Bob': 2, 'Carol': 1},
+            ],
+        ),
+    )
+    compact_mock = unittest.mock.AsyncMock(return_value=0)
+    monkeypatch.setattr(models.Change, 'compact', compact_mock)
+    # stop after the first run
+    monkeypatch.setattr(
+        asyncio, 'sleep',
+        unittest.mock.AsyncMock(side_effect=asyncio.CancelledError),
+    )
+
+    with app.state.events.subscribe() as changes:
+        with pytest.raises(asyncio.CancelledError):
+            await tasks.fetch_desired(app)
+
+    api_session.commit.assert_awaited_once()
+    compact_mock.assert_awaited_once()
+    assert changes.get_nowait() == schemas.ChangeSet(
+        generation=1, changed=['MOS-3'], removed=['MOS-2'],
+        assignees=['Bob', 'Carol'],
+    )
+    assert changes.empty()
@@ -0,0 +1,99 @@
+import datetime
+import unittest.mock
+
+import niquests
+import pytest
+
+import mosura.app
+from mosura import cache
+from mosura import models
+from mosura import timelines
+
+
+@pytest.fixture(name='team')
+def _team(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    mosura.app.app.state.team = {'acct-1': 'Alice', 'acct-2': 'Bob'}
+    generations = {'Alice': 1, 'Bob': 1}
+
+    async def get_assignees(
+            assignees: tuple[str, ...],
+            **_kwargs: object,
+    ) -> dict[str, int]:
+        return {x: generations[x] for x in assignees}
+
+    monkeypatch.setattr(models.Generation, 'get_assignees', get_assignees)
+    return generations
+
+
+@pytest.mark.usefixtures('api_session', 'client')
+async def test_get_team_only_rebuilds_changed_lanes(
+    monkeypatch: pytest.MonkeyPatch,
+    team: dict[str, int],
+) -> None:
+    issue_get = unittest.mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(models.Issue, 'get', issue_get)
+    app = mosura.app.app
+
+    async def get_team() -> list[str]:
+        lanes = await timelines.get_team(
+            app,
+            datetime.date(2026, 3, 4),
+            datetime.date(2026, 3, 4),
+            weeks_before=1,
+            weeks_after=1,
+        )
+        return list(lanes)
+
+    assert await get_team() == ['Alice', 'Bob']
+    assert issue_get.await_count == 2
+
+    # a write to Bob's issues only
+    team['Bob'] += 1
+    cache.from_app(app).observe(2)
+    issue_get.reset_mock()
+
+    assert await get_team() == ['Alice', 'Bob']
+    assert [x.kwargs['assignee'] for x in issue_get.await_args_list] == [
+        'Bob',
+    ]
+
+
+@pytest.mark.usefixtures('api_session', 'team')
+async def test_team_timeline_renders_a_lane_per_member(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        models.Issue, 'get', unittest.mock.AsyncMock(return_value=[]),
+    )
+
+    response = await client.get('/timeline/team?date=2026-03-02')
+
+    assert response.status_code == 200
+    assert response.text is not None
+    html = response.text
+    assert '2026-02-09 - 2026-04-13' in html
+    assert html.count('class="gantt-lane-header"') == 2
+    assert html.index('>Alice<') < html.index('>Bob<')
+
+
+@pytest.mark.usefixtures('api_session', 'team')
+async def test_team_timeline_renders_a_single_lane(
+    client: niquests.AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    issue_get = unittest.mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(models.Issue, 'get', issue_get)
+
+    response = await client.get('/timeline/team?date=2026-03-02&lane=Bob')
+
+    assert response.status_code == 200
+    assert response.text is not None
+    assert response.text.count('class="gantt-lane-header"') == 1
+    assert 'data-lane="Bob"' in response.text
+    assert [x.kwargs['assignee'] for x in issue_get.await_args_list] == [
+        'Bob',
+    ]
+
+    response = await client.get('/timeline/team?lane=Carol')
+    assert response.status_code == 404
@@ -0,0 +1,49 @@
+import pathlib
+import types
+
+import pytest
+
+from mosura import ui
+
+
+def test_configure_templates_precompiles_into_bytecode_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    env = ui.templates.env
+    monkeypatch.setattr(env, 'auto_reload', True)
+    monkeypatch.setattr(env, 'bytecode_cache', None)
+    monkeypatch.setattr(env, 'cache', {})
+    settings = types.SimpleNamespace(
+        mosura_appdata=str(tmp_path),
+        mosura_reload_templates=False,
+        mosura_template_cache=True,
+    )
+
+    ui.configure_templates(settings)  # type: ignore[arg-type]
+
+    assert env.auto_reload is False
+    assert env.cache is not None
+    assert len(env.cache) == len(env.list_templates())
+    cached = list((tmp_path / 'templates.cache').iterdir())
+    assert len(cached) == len(env.list_templates())
+
+
+def test_configure_templates_can_skip_bytecode_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    env = ui.templates.env
+    monkeypatch.setattr(env, 'auto_reload', False)
+    monkeypatch.setattr(env, 'bytecode_cache', None)
+    settings = types.SimpleNamespace(
+        mosura_appdata=str(tmp_path),
+        mosura_reload_templates=True,
+        mosura_template_cache=False,
+    )
+
+    ui.configure_templates(settings)  # type: ignore[arg-type]
+
+    assert env.auto_reload is True
+    assert env.bytecode_cache is None
+    assert not list(tmp_path.iterdir())
@@ -4,9 +4,6 @@ from collections.abc import Callable
 import pytest
 
 from mosura import schemas
-from mosura import ui
-
-# pylint: disable=protected-access
 
 
 def test_enrich_draws_markers_only_for_same_color_off_left_edge(
@@ -65,8 +62,7 @@ def test_enrich_draws_markers_only_for_same_color_off_left_edge(
         weeks_before=1,
         weeks_after=1,
     )
-    ui._enrich_timeline_for_template(
-        timeline,
+    timeline.calculate_rendering(
         current_date=datetime.date(2024, 1, 8),
     )
 
@@ -108,8 +104,7 @@ def test_enrich_renders_segment_end_date_inclusively(
         weeks_before=1,
         weeks_after=1,
     )
-    ui._enrich_timeline_for_template(
-        timeline,
+    timeline.calculate_rendering(
         current_date=datetime.date(2026, 2, 23),
     )
 